@@ -0,0 +1,160 @@
+"""
+Gerador de carga concorrente contra o app ASGI, dentro do processo (sem rede nem servidor), sobre
+um banco SQLite populado pelo Faker. Reporta vazão e p50/p95/p99 por endpoint em JSON.
+
+    python -m benchmarks.load --tasks 10000 --requests 5000 --concurrency 32 --output load.json
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from benchmarks.seed import create_seeded_database
+from benchmarks.stats import summarize, write_report
+from configs.database import async_db_url, get_async_db_connection, get_db_connection
+from configs.environment import get_environment_variables
+from main import app as main_app
+from schemas.enums import TaskStatus
+
+env = get_environment_variables()
+
+# (endpoint, peso, requisição): a requisição recebe o gerador aleatório e os IDs e retorna (método, URL, corpo)
+Scenario = List[Tuple[str, int, Callable[[random.Random, List[int]], Tuple[str, str, Optional[dict]]]]]
+
+DEFAULT_SCENARIO: Scenario = [
+    ("GET /tasks/", 4, lambda rng, ids: ("GET", f"/tasks/?limit=50&offset={rng.randrange(len(ids))}", None)),
+    ("GET /tasks/{task_id}", 4, lambda rng, ids: ("GET", f"/tasks/{rng.choice(ids)}", None)),
+    ("PATCH /tasks/{task_id}", 1, lambda rng, ids: (
+        "PATCH", f"/tasks/{rng.choice(ids)}", {"status": rng.choice(list(TaskStatus)).value}
+    )),
+    ("POST /tasks/", 1, lambda rng, ids: (
+        "POST", "/tasks/", {"title": f"load test task {rng.getrandbits(64):x}", "status": TaskStatus.PENDING.value}
+    )),
+]
+
+
+async def generate_load(
+        app: FastAPI,
+        ids: List[int],
+        requests: int,
+        concurrency: int,
+        scenario: Scenario = DEFAULT_SCENARIO,
+        seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Dispara `requests` requisições contra o app com `concurrency` clientes simultâneos, sorteando o
+    endpoint de cada uma pelos pesos do cenário. Respostas 5xx e exceções contam como erro.
+    """
+    rng = random.Random(seed)
+    names = [name for name, _, _ in scenario]
+    weights = [weight for _, weight, _ in scenario]
+    builders = {name: build for name, _, build in scenario}
+    plan = rng.choices(names, weights=weights, k=requests)
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    position = iter(range(requests))
+
+    async def worker(client: AsyncClient, worker_rng: random.Random):
+        for index in position:
+            name = plan[index]
+            method, url, body = builders[name](worker_rng, ids)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+                status = str(response.status_code)
+            except Exception as e:
+                status = type(e).__name__
+            latencies[name].append(time.perf_counter() - started)
+            statuses[name][status] += 1
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client, random.Random(seed + n + 1)) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    endpoints = {
+        name: {
+            **summarize(latencies[name], elapsed),
+            "statuses": dict(statuses[name]),
+            "errors": sum(
+                count for status, count in statuses[name].items() if not status.isdigit() or int(status) >= 500
+            ),
+        }
+        for name in names if latencies[name]
+    }
+    return {
+        "elapsed_s": round(elapsed, 4),
+        "total": summarize([sample for samples in latencies.values() for sample in samples], elapsed),
+        "endpoints": endpoints,
+    }
+
+
+def run_load_test(
+        db_path: str, tasks: int, requests: int, concurrency: int, seed: int = 0, app: FastAPI = main_app
+) -> Dict[str, Any]:
+    """
+    Popula o banco em `db_path`, aponta as dependências de banco do app para ele (a síncrona e, com
+    ASYNC_MODE, a assíncrona) e executa a carga. As substituições são desfeitas ao final.
+    """
+    engine, session_factory, ids = create_seeded_database(db_path, tasks, seed)
+    async_engine = create_async_engine(async_db_url(str(engine.url))) if env.ASYNC_MODE else None
+
+    def benchmark_db_connection():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def benchmark_async_db_connection():
+        async with async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)() as db:
+            yield db
+
+    overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db_connection] = benchmark_db_connection
+    if async_engine is not None:
+        app.dependency_overrides[get_async_db_connection] = benchmark_async_db_connection
+
+    async def run():
+        try:
+            return await generate_load(app, ids, requests, concurrency, seed=seed)
+        finally:
+            if async_engine is not None:
+                await async_engine.dispose()
+
+    try:
+        result = asyncio.run(run())
+    finally:
+        app.dependency_overrides = overrides
+        engine.dispose()
+    return {"benchmark": "load", "tasks": tasks, "requests": requests, "concurrency": concurrency, **result}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000, help="Tarefas geradas no banco (padrão: 10000)")
+    parser.add_argument("--requests", type=int, default=5000, help="Total de requisições (padrão: 5000)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Clientes simultâneos (padrão: 32)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente do Faker e do sorteio das requisições")
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: apenas imprime)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = run_load_test(
+            str(Path(directory) / "benchmark.db"), args.tasks, args.requests, args.concurrency, args.seed
+        )
+    print(write_report(report, args.output))
+
+
+if __name__ == "__main__":
+    main()
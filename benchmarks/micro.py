@@ -0,0 +1,102 @@
+"""
+Micro-benchmarks das camadas de repositório e serviço sobre um banco SQLite populado pelo Faker.
+
+    python -m benchmarks.micro --tasks 10000 --iterations 500 --output micro.json
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from benchmarks.seed import create_seeded_database
+from benchmarks.stats import summarize, write_report
+from repositories.cache import InMemoryCache
+from repositories.models import Task
+from repositories.task_repository import TaskRepository
+from schemas.enums import TaskStatus
+from schemas.task_schema import task_list_adapter
+from services.helpers.task_changes import TaskChangeBroker
+from services.task_service import TaskService
+
+PAGE_SIZE = 50
+
+
+def measure(operation: Callable[[], Any], iterations: int, warmup: int = 10) -> Dict[str, Any]:
+    """Executa a operação `warmup` vezes sem medir e depois `iterations` vezes, resumindo as durações."""
+    for _ in range(warmup):
+        operation()
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation_started = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - operation_started)
+    return summarize(samples, time.perf_counter() - started)
+
+
+def run_micro_benchmarks(db_path: str, tasks: int, iterations: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    Mede, sobre `tasks` tarefas: a listagem e a busca por ID do repositório, a listagem do serviço
+    (consulta e validação), a serialização de uma página, o UPDATE ... RETURNING usado pelo PATCH e o
+    caminho antigo de carregar a entidade e aplicar copy_attributes antes do commit.
+    """
+    engine, session_factory, ids = create_seeded_database(db_path, tasks, seed)
+    rng = random.Random(seed)
+    db = session_factory()
+    repository = TaskRepository(db)
+    service = TaskService(repository=repository, cache=InMemoryCache(), changes=TaskChangeBroker())
+    page = service.list_tasks(limit=PAGE_SIZE)
+    statuses = list(TaskStatus)
+
+    def repository_list():
+        repository.list(limit=PAGE_SIZE, offset=rng.randrange(max(tasks - PAGE_SIZE, 1)))
+        db.expunge_all()
+
+    def repository_get():
+        repository.get(rng.choice(ids))
+        db.expunge_all()
+
+    def service_list_tasks():
+        service.list_tasks(limit=PAGE_SIZE, offset=rng.randrange(max(tasks - PAGE_SIZE, 1)))
+
+    def update_returning():
+        repository.update(rng.choice(ids), {"status": rng.choice(statuses)})
+
+    def update_copy_attributes():
+        task = repository.get(rng.choice(ids))
+        repository.copy_attributes(task, Task(status=rng.choice(statuses)))
+        db.commit()
+        db.expunge_all()
+
+    try:
+        results = {
+            "repository.list": measure(repository_list, iterations),
+            "repository.get": measure(repository_get, iterations),
+            "service.list_tasks": measure(service_list_tasks, iterations),
+            "serialization.list_page": measure(lambda: task_list_adapter(None).dump_json(page), iterations),
+            "update.returning": measure(update_returning, iterations),
+            "update.copy_attributes": measure(update_copy_attributes, iterations),
+        }
+    finally:
+        db.close()
+        engine.dispose()
+    return {"benchmark": "micro", "tasks": tasks, "iterations": iterations, "page_size": PAGE_SIZE, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000, help="Tarefas geradas no banco (padrão: 10000)")
+    parser.add_argument("--iterations", type=int, default=500, help="Execuções medidas por caso (padrão: 500)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente do Faker e das escolhas aleatórias")
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: apenas imprime)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = run_micro_benchmarks(str(Path(directory) / "benchmark.db"), args.tasks, args.iterations, args.seed)
+    print(write_report(report, args.output))
+
+
+if __name__ == "__main__":
+    main()
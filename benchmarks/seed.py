@@ -0,0 +1,56 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from faker import Faker
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from configs.database import set_sqlite_pragmas
+from repositories.models import EntityMeta
+from repositories.task_repository import TaskRepository
+from schemas.enums import TaskStatus
+
+SEED_CHUNK_SIZE = 1000
+
+
+def create_benchmark_engine(path: str) -> Engine:
+    """Engine SQLite para os benchmarks, com os mesmos PRAGMAs da aplicação e as tabelas criadas."""
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", set_sqlite_pragmas)
+    EntityMeta.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed_tasks(db: Session, count: int, seed: Optional[int] = 0) -> List[int]:
+    """
+    Insere `count` tarefas geradas pelo Faker (títulos únicos, status e datas variados) em lotes de
+    SEED_CHUNK_SIZE. Com o mesmo `seed`, os dados são os mesmos em cada execução.
+    """
+    faker, rng = Faker(), random.Random(seed)
+    faker.seed_instance(seed)
+    repository = TaskRepository(db)
+    now = datetime.now(timezone.utc)
+    ids: List[int] = []
+
+    for start in range(0, count, SEED_CHUNK_SIZE):
+        rows = [
+            {
+                "title": f"{faker.sentence(nb_words=4)} #{index}",
+                "description": faker.text(max_nb_chars=200),
+                "status": rng.choice(list(TaskStatus)),
+                "created_at": now - timedelta(minutes=rng.randrange(60 * 24 * 365)),
+            }
+            for index in range(start, min(start + SEED_CHUNK_SIZE, count))
+        ]
+        ids.extend(task.id for task in repository.create_many(rows))
+    return sorted(ids)
+
+
+def create_seeded_database(path: str, count: int, seed: Optional[int] = 0):
+    """Cria o banco em `path` com `count` tarefas e retorna o engine, a fábrica de sessões e os IDs."""
+    engine = create_benchmark_engine(path)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with session_factory() as db:
+        ids = seed_tasks(db, count, seed)
+    return engine, session_factory, ids
@@ -0,0 +1,61 @@
+import json
+import math
+import platform
+import subprocess
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Sequence
+
+
+def percentile(sorted_samples: Sequence[float], fraction: float) -> float:
+    """Percentil pelo método nearest-rank sobre amostras já ordenadas."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_samples)), 1)
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: Sequence[float], elapsed: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Resume as durações (em segundos) em milissegundos: média, mínimo, p50, p95, p99 e máximo.
+    Com `elapsed`, inclui a vazão em operações por segundo.
+    """
+    ordered = sorted(samples)
+    summary: Dict[str, Any] = {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4) if ordered else 0.0,
+        "min_ms": round(ordered[0] * 1000, 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 4),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4) if ordered else 0.0,
+    }
+    if elapsed:
+        summary["throughput_per_s"] = round(len(ordered) / elapsed, 2)
+    return summary
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(report: Dict[str, Any], output: Optional[str] = None) -> str:
+    """
+    Completa o relatório com a revisão do git, a data e a versão do Python (para comparar execuções
+    entre commits) e o grava em `output`, ou apenas retorna o JSON.
+    """
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        **report,
+    }
+    content = json.dumps(report, indent=2, default=str)
+    if output:
+        with open(output, "w", encoding="utf-8") as file:
+            file.write(content + "\n")
+    return content
@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from configs.environment import get_environment_variables
+from repositories.cache import Cache, InMemoryCache, NullCache, RedisCache
+
+env = get_environment_variables()
+
+
+@lru_cache
+def get_cache() -> Cache:
+    """
+    Retorna o cache de leitura configurado em CACHE_BACKEND, compartilhado por toda a aplicação.
+    """
+    if env.CACHE_BACKEND == "redis":
+        return RedisCache.from_url(env.CACHE_REDIS_URL, ttl=env.CACHE_TTL)
+    if env.CACHE_BACKEND == "none":
+        return NullCache()
+    return InMemoryCache(max_size=env.CACHE_MAX_SIZE, ttl=env.CACHE_TTL)
@@ -0,0 +1,14 @@
+from functools import lru_cache
+
+from configs.environment import get_environment_variables
+from services.helpers.task_changes import TaskChangeBroker
+
+env = get_environment_variables()
+
+
+@lru_cache
+def get_change_broker() -> TaskChangeBroker:
+    """
+    Retorna o broker de alterações de tarefas, compartilhado por toda a aplicação (um por processo).
+    """
+    return TaskChangeBroker(buffer_size=env.CHANGES_BUFFER_SIZE, queue_size=env.CHANGES_QUEUE_SIZE)
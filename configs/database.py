@@ -1,10 +1,37 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+import math
+import time
+from typing import Any, Dict, List, Optional, Type
+
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
 from configs.environment import get_environment_variables
+from configs.metrics import register_query_metrics
+from configs.query_log import register_query_log
+from configs.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    PoolStats,
+    async_pool_stats,
+    pool_stats,
+    register_pool_events,
+)
+from configs.replicas import ReplicaSet, RoutingSession
 
 env = get_environment_variables()
 
+# Métodos HTTP que podem ler das réplicas e cookie da janela de read-your-writes
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+READ_YOUR_WRITES_COOKIE = "read_primary_until"
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
 
 def postgres_db_url():
     return f"{env.DATABASE_DIALECT}://{env.DATABASE_USERNAME}:{env.DATABASE_PASSWORD}@{env.DATABASE_HOSTNAME}:{env.DATABASE_PORT}/{env.DATABASE_NAME}"
@@ -14,24 +41,168 @@ def sqlite_db_url():
     return f"{env.DATABASE_DIALECT}:///{env.DATABASE_NAME}"
 
 
+def async_db_url(url: str) -> str:
+    """Troca o driver da URL síncrona pelo driver assíncrono do dialeto (asyncpg ou aiosqlite)."""
+    sync_url = make_url(url)
+    return sync_url.set(drivername=ASYNC_DRIVERS[sync_url.get_backend_name()]).render_as_string(hide_password=False)
+
+
+def replica_urls() -> List[str]:
+    return [url.strip() for url in env.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+
+def is_sqlite() -> bool:
+    return env.DATABASE_DIALECT.startswith("sqlite")
+
+
+def engine_options(poolclass: Type[Pool] = InstrumentedQueuePool) -> Dict[str, Any]:
+    """
+    Monta os parâmetros do engine de acordo com o dialeto e as configurações de pool.
+    Bancos SQLite em memória mantêm o pool padrão (uma conexão por thread).
+    """
+    options: Dict[str, Any] = {
+        "echo": env.DEBUG_MODE,
+        "future": True,
+        "pool_pre_ping": env.DATABASE_POOL_PRE_PING,
+    }
+
+    if is_sqlite() and env.DATABASE_NAME in ("", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=poolclass,
+        pool_size=env.DATABASE_POOL_SIZE,
+        max_overflow=env.DATABASE_MAX_OVERFLOW,
+        pool_timeout=env.DATABASE_POOL_TIMEOUT,
+        pool_recycle=env.DATABASE_POOL_RECYCLE,
+    )
+    return options
+
+
+def register_engine_events(engine, stats: Optional[PoolStats] = pool_stats):
+    """
+    Registra no engine (síncrono) os PRAGMAs do SQLite, os contadores do pool, as métricas de consultas
+    e, se habilitado, o log de consultas lentas.
+    """
+    if stats is not None:
+        register_pool_events(engine, stats)
+    if is_sqlite():
+        event.listen(engine, "connect", set_sqlite_pragmas)
+    if env.METRICS_ENABLED:
+        register_query_metrics(engine)
+    if env.QUERY_LOG_ENABLED:
+        register_query_log(engine, env.SLOW_QUERY_THRESHOLD_MS)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Aplica os PRAGMAs de desempenho do SQLite em cada nova conexão."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={env.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={env.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={env.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={env.SQLITE_BUSY_TIMEOUT}")
+    finally:
+        cursor.close()
+
+
 DATABASE_URL = sqlite_db_url()
 
 if env.DATABASE_DIALECT == "postgresql":
     DATABASE_URL = postgres_db_url()
 
 # Create Database Engine
-Engine = create_engine(
-    DATABASE_URL, echo=env.DEBUG_MODE, future=True
+Engine = create_engine(DATABASE_URL, **engine_options())
+register_engine_events(Engine)
+
+
+def create_replica_engine(url: str):
+    """Engine de uma réplica de leitura, com os parâmetros do primário e um pool fora das estatísticas dele."""
+    replica_engine = create_engine(url, **engine_options(poolclass=QueuePool))
+    register_engine_events(replica_engine, stats=None)
+    return replica_engine
+
+
+def create_async_replica_engine(url: str):
+    replica_engine = create_async_engine(async_db_url(url), **engine_options(poolclass=AsyncAdaptedQueuePool))
+    register_engine_events(replica_engine.sync_engine, stats=None)
+    return replica_engine
+
+
+# Réplicas de leitura (opcionais); sem DATABASE_REPLICA_URLS, todas as consultas vão ao primário
+ReadReplicas = ReplicaSet(
+    [create_replica_engine(url) for url in replica_urls()], env.REPLICA_HEALTH_CHECK_INTERVAL
 )
 
 SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=Engine
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=Engine
 )
 
+# Async engine, only created when ASYNC_MODE is enabled so the async drivers stay optional
+AsyncEngine = None
+AsyncSessionLocal = None
+AsyncReadReplicas = ReplicaSet([])
+
+if env.ASYNC_MODE:
+    AsyncEngine = create_async_engine(
+        async_db_url(DATABASE_URL), **engine_options(poolclass=InstrumentedAsyncQueuePool)
+    )
+    register_engine_events(AsyncEngine.sync_engine, async_pool_stats)
+
+    AsyncReadReplicas = ReplicaSet(
+        [create_async_replica_engine(url) for url in replica_urls()], env.REPLICA_HEALTH_CHECK_INTERVAL
+    )
+
+    AsyncSessionLocal = async_sessionmaker(
+        bind=AsyncEngine, sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False
+    )
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Retorna as estatísticas de checkout e espera do pool do engine principal (e do assíncrono, se ativo)."""
+    stats: Dict[str, Any] = pool_stats.snapshot(Engine.pool)
+    if AsyncEngine is not None:
+        stats["async"] = async_pool_stats.snapshot(AsyncEngine.pool)
+    if ReadReplicas:
+        stats["replicas"] = ReadReplicas.status()
+    return stats
 
-def get_db_connection():
-    db = scoped_session(SessionLocal)
+
+def reads_from_replica(request: Request, response: Response) -> bool:
+    """
+    Apenas requisições de leitura usam as réplicas. Uma requisição de escrita marca o cliente (cookie)
+    para continuar lendo do primário por REPLICA_READ_YOUR_WRITES_WINDOW segundos, enquanto as
+    réplicas ainda podem não ter recebido o que ele gravou.
+    """
+    window = env.REPLICA_READ_YOUR_WRITES_WINDOW
+    if request.method not in READ_METHODS:
+        if window:
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE, f"{time.time() + window:.3f}", max_age=math.ceil(window), httponly=True
+            )
+        return False
+
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) <= time.time()
+    except ValueError:
+        return True
+
+
+def get_db_connection(request: Request, response: Response):
+    replica = ReadReplicas.choose() if ReadReplicas and reads_from_replica(request, response) else None
+    db = SessionLocal(replica=replica)
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db_connection(request: Request, response: Response):
+    replica = None
+    if AsyncReadReplicas and reads_from_replica(request, response):
+        replica = await AsyncReadReplicas.choose_async()
+    db: AsyncSession = AsyncSessionLocal(replica=replica)
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -1,5 +1,7 @@
 import os
 from functools import lru_cache
+from typing import Literal
+
 from pydantic import Field, ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -26,6 +28,77 @@ class EnvironmentSettings(BaseSettings):
     DATABASE_PORT: int = Field(..., description="Porta de conexão com o banco")
     DATABASE_USERNAME: str = Field(..., description="Usuário do banco")
     DEBUG_MODE: bool = Field(..., description="Modo de depuração")
+    ASYNC_MODE: bool = Field(False, description="Usa o caminho assíncrono (AsyncSession) nas rotas de tarefas")
+    BULK_MAX_ITEMS: int = Field(5000, ge=1, description="Quantidade máxima de itens por requisição em lote")
+    BULK_CHUNK_SIZE: int = Field(
+        1000, ge=1, description="Linhas processadas por lote (transação ou leitura) nas operações em massa"
+    )
+    BATCH_GET_MAX_IDS: int = Field(500, ge=1, description="Quantidade máxima de IDs em GET /tasks/?ids=")
+
+    TASK_COUNT_SOURCE: Literal["counters", "estimate"] = Field(
+        "counters", description="Origem do X-Total-Count sem filtro: contadores por status ou pg_class.reltuples"
+    )
+
+    CHANGES_BUFFER_SIZE: int = Field(1000, ge=1, description="Eventos recentes guardados para retomar /tasks/changes")
+    CHANGES_QUEUE_SIZE: int = Field(100, ge=1, description="Eventos pendentes por assinante antes de desconectá-lo")
+    CHANGES_HEARTBEAT: float = Field(15.0, gt=0, description="Segundos entre keep-alives no stream de alterações")
+
+    IDEMPOTENCY_ENABLED: bool = Field(True, description="Guarda e repete as respostas de escritas com Idempotency-Key")
+    IDEMPOTENCY_KEY_TTL: float = Field(
+        86400.0, gt=0, description="Segundos que a resposta de uma Idempotency-Key fica guardada"
+    )
+    IDEMPOTENCY_CLEANUP_INTERVAL: float = Field(
+        300.0, gt=0, description="Segundos entre as remoções das Idempotency-Keys expiradas"
+    )
+    IDEMPOTENCY_LEASE: float = Field(
+        30.0, gt=0, description="Segundos até uma Idempotency-Key sem resposta poder ser retomada por uma retentativa"
+    )
+    IDEMPOTENCY_MAX_BODY_SIZE: int = Field(
+        1048576, ge=1, description="Bytes máximos do corpo (requisição ou resposta) guardado com Idempotency-Key"
+    )
+
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = Field(
+        "memory", description="Backend do cache de leitura de tarefas"
+    )
+    CACHE_MAX_SIZE: int = Field(10000, ge=1, description="Quantidade máxima de entradas no cache em memória")
+    CACHE_TTL: float = Field(60.0, gt=0, description="Segundos até uma entrada do cache expirar")
+    CACHE_REDIS_URL: str = Field("redis://localhost:6379/0", description="URL do Redis quando CACHE_BACKEND=redis")
+
+    DATABASE_REPLICA_URLS: str = Field(
+        "", description="URLs das réplicas de leitura, separadas por vírgula (vazio: tudo no primário)"
+    )
+    REPLICA_HEALTH_CHECK_INTERVAL: float = Field(5.0, gt=0, description="Segundos entre verificações da réplica")
+    REPLICA_READ_YOUR_WRITES_WINDOW: float = Field(
+        5.0, ge=0, description="Segundos em que um cliente lê do primário após uma escrita (0 desativa)"
+    )
+
+    METRICS_ENABLED: bool = Field(True, description="Mede as requisições (GET /metrics e cabeçalho Server-Timing)")
+
+    QUERY_LOG_ENABLED: bool = Field(False, description="Registra consultas lentas e requisições com consultas demais")
+    SLOW_QUERY_THRESHOLD_MS: float = Field(
+        100.0, ge=0, description="Milissegundos a partir dos quais uma consulta é lenta"
+    )
+    QUERY_LOG_MAX_QUERIES: int = Field(
+        10, ge=1, description="Consultas por requisição acima das quais ela é sinalizada"
+    )
+    QUERY_LOG_MAX_REPEATS: int = Field(
+        1, ge=1, description="Vezes que o mesmo statement pode se repetir na requisição antes de sinalizar N+1"
+    )
+
+    DATABASE_POOL_SIZE: int = Field(5, ge=1, description="Conexões mantidas abertas no pool")
+    DATABASE_MAX_OVERFLOW: int = Field(10, ge=0, description="Conexões extras permitidas além do pool")
+    DATABASE_POOL_TIMEOUT: float = Field(30.0, gt=0, description="Segundos de espera por uma conexão livre")
+    DATABASE_POOL_RECYCLE: int = Field(1800, description="Segundos até reciclar uma conexão (-1 desativa)")
+    DATABASE_POOL_PRE_PING: bool = Field(True, description="Valida a conexão antes de cada checkout")
+
+    SQLITE_JOURNAL_MODE: Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"] = Field(
+        "WAL", description="PRAGMA journal_mode do SQLite"
+    )
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        "NORMAL", description="PRAGMA synchronous do SQLite"
+    )
+    SQLITE_MMAP_SIZE: int = Field(268435456, ge=0, description="PRAGMA mmap_size do SQLite, em bytes")
+    SQLITE_BUSY_TIMEOUT: int = Field(5000, ge=0, description="PRAGMA busy_timeout do SQLite, em milissegundos")
 
     model_config = ConfigDict(
         extra="forbid",
@@ -0,0 +1,277 @@
+import hashlib
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+
+from configs.database import SessionLocal
+from repositories.helpers.db_operations import RepositoryIntegrityException
+from repositories.idempotency_repository import IdempotencyRepository
+from repositories.models import IdempotencyKey
+
+logger = logging.getLogger("todolist.idempotency")
+
+IDEMPOTENT_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+IDEMPOTENCY_KEY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+# Cabeçalhos que descrevem a resposta original e não devem ser repetidos no replay
+UNSTORED_HEADERS = {"date", "server-timing", "set-cookie"}
+
+# Resultado da reserva: (situação, horário da reserva, status, cabeçalhos, corpo da resposta guardada)
+Reservation = Tuple[str, Optional[datetime], Optional[int], Optional[List[List[str]]], Optional[bytes]]
+
+RESERVED, REPLAY, IN_PROGRESS, MISMATCH = "reserved", "replay", "in_progress", "mismatch"
+
+
+class BodyTooLarge(Exception):
+    """Corpo da requisição maior que o limite para guardá-lo e compará-lo."""
+
+
+def utc_now() -> datetime:
+    """Horário atual em UTC sem fuso, como as colunas DateTime guardam."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def request_fingerprint(method: str, path: str, query_string: bytes, body: bytes) -> str:
+    """Hash da requisição: a mesma chave só pode ser reutilizada com o mesmo método, caminho, query e corpo."""
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), query_string, body):
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def read_body(
+        receive: Callable[[], Awaitable[dict]], max_size: int
+) -> Tuple[bytes, Callable[[], Awaitable[dict]]]:
+    """
+    Lê todo o corpo da requisição, até `max_size` bytes (BodyTooLarge acima disso), e retorna um
+    `receive` que o entrega novamente à aplicação.
+    """
+    chunks, size, more_body = [], 0, True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_size:
+            raise BodyTooLarge()
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    body, delivered = b"".join(chunks), False
+
+    async def replay_receive():
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return body, replay_receive
+
+
+def content_length(scope) -> Optional[int]:
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class IdempotencyMiddleware:
+    """
+    Middleware ASGI que torna seguras as retentativas de escrita com o cabeçalho Idempotency-Key.
+    A primeira requisição com a chave é executada e a resposta (status < 500) fica guardada por `ttl`
+    segundos; as repetições recebem a resposta guardada, com Idempotent-Replayed: true, sem executar
+    a rota. A mesma chave com outra requisição retorna 422 e, enquanto a original não termina, 409.
+    As chaves expiradas são removidas a cada `cleanup_interval` segundos, durante as requisições.
+
+    Uma reserva sem resposta por mais de `lease` segundos (o processo caiu ou a requisição travou) é
+    retomada pela próxima repetição. Corpos de requisição acima de `max_body_size` bytes retornam 413,
+    já que seriam lidos inteiros na memória (o que anularia o streaming de POST /tasks/import), e
+    respostas acima do limite não são guardadas.
+    """
+
+    def __init__(
+            self,
+            app,
+            session_factory=SessionLocal,
+            ttl: float = 86400.0,
+            cleanup_interval: float = 300.0,
+            lease: float = 30.0,
+            max_body_size: int = 1048576,
+    ):
+        self.app = app
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.cleanup_interval = cleanup_interval
+        self.lease = lease
+        self.max_body_size = max_body_size
+        self._next_cleanup = 0.0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        key = next(
+            (value.decode("latin-1") for name, value in scope["headers"] if name == IDEMPOTENCY_KEY_HEADER), None
+        )
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                {"detail": f"Idempotency-Key must have between 1 and {MAX_KEY_LENGTH} characters."}, status_code=400
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            if (content_length(scope) or 0) > self.max_body_size:
+                raise BodyTooLarge()
+            body, receive = await read_body(receive, self.max_body_size)
+        except BodyTooLarge:
+            response = JSONResponse(
+                {"detail": f"Requests with an Idempotency-Key accept at most {self.max_body_size} bytes."},
+                status_code=413,
+            )
+            await response(scope, receive, send)
+            return
+
+        fingerprint = request_fingerprint(scope["method"], scope["path"], scope["query_string"], body)
+        outcome, reserved_at, status_code, headers, stored_body = await run_in_threadpool(
+            self.reserve, key, fingerprint
+        )
+
+        if outcome == REPLAY:
+            await send({
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+                + [(REPLAYED_HEADER, b"true")],
+            })
+            await send({"type": "http.response.body", "body": stored_body})
+            return
+        if outcome == MISMATCH:
+            response = JSONResponse(
+                {"detail": "Idempotency-Key was already used with a different request."}, status_code=422
+            )
+            await response(scope, receive, send)
+            return
+        if outcome == IN_PROGRESS:
+            response = JSONResponse(
+                {"detail": "A request with this Idempotency-Key is still being processed."},
+                status_code=409,
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.execute(scope, receive, send, key, reserved_at)
+
+    async def execute(self, scope, receive, send, key: str, reserved_at: datetime):
+        """
+        Executa a requisição reservada, repassando a resposta ao cliente enquanto a guarda. A chave é
+        liberada se a rota falhar (exceção ou 5xx), se a resposta passar do limite ou se não puder ser guardada.
+        """
+        status_code, headers, chunks, size = 500, [], [], 0
+
+        async def send_and_capture(message):
+            nonlocal status_code, headers, chunks, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                    if name.decode("latin-1").lower() not in UNSTORED_HEADERS
+                ]
+            elif message["type"] == "http.response.body" and chunks is not None:
+                size += len(message.get("body", b""))
+                if size > self.max_body_size:
+                    # Resposta grande demais (ex.: um stream): deixa de guardá-la, sem acumular na memória
+                    chunks = None
+                else:
+                    chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_capture)
+            if status_code < 500 and chunks is not None:
+                await run_in_threadpool(self.store, key, reserved_at, status_code, headers, b"".join(chunks))
+                return
+        except BaseException:
+            await self.release_quietly(key, reserved_at)
+            raise
+        # Falha do servidor: libera a chave para que a retentativa execute a requisição de novo
+        await self.release_quietly(key, reserved_at)
+
+    async def release_quietly(self, key: str, reserved_at: datetime):
+        """Libera a reserva sem mascarar o erro original; se falhar, a reserva expira pelo `lease`."""
+        try:
+            await run_in_threadpool(self.release, key, reserved_at)
+        except Exception:
+            logger.exception("Could not release Idempotency-Key %r", key)
+
+    def reserve(self, key: str, fingerprint: str) -> Reservation:
+        """
+        Reserva a chave para a requisição ou, se ela já existir, retorna a resposta guardada.
+        Um INSERT concorrente da mesma chave falha pela chave primária, e só uma requisição a executa.
+        Uma reserva sem resposta há mais de `lease` segundos é retomada com um UPDATE condicional, que
+        também só uma requisição consegue fazer.
+        """
+        with self.session_factory() as db:
+            repository = IdempotencyRepository(db)
+            now = utc_now()
+            if time.monotonic() >= self._next_cleanup:
+                self._next_cleanup = time.monotonic() + self.cleanup_interval
+                repository.delete_expired(now)
+
+            record = repository.get(key)
+            if record is not None and record.expires_at <= now:
+                repository.delete(key, expected={"expires_at": record.expires_at})
+                record = None
+            if record is None:
+                try:
+                    repository.create(IdempotencyKey(
+                        key=key, fingerprint=fingerprint, created_at=now, expires_at=now + timedelta(seconds=self.ttl)
+                    ))
+                    return RESERVED, now, None, None, None
+                except RepositoryIntegrityException:
+                    record = repository.get(key)
+                    if record is None:
+                        return IN_PROGRESS, None, None, None, None
+
+            if record.status_code is None and record.created_at <= now - timedelta(seconds=self.lease):
+                reclaimed = repository.update(
+                    key,
+                    {"fingerprint": fingerprint, "created_at": now, "expires_at": now + timedelta(seconds=self.ttl)},
+                    expected={"status_code": None, "created_at": record.created_at},
+                )
+                return (RESERVED, now, None, None, None) if reclaimed else (IN_PROGRESS, None, None, None, None)
+            if record.fingerprint != fingerprint:
+                return MISMATCH, None, None, None, None
+            if record.status_code is None:
+                return IN_PROGRESS, None, None, None, None
+            return REPLAY, None, record.status_code, record.headers, record.body
+
+    def store(self, key: str, reserved_at: datetime, status_code: int, headers: List[List[str]], body: bytes):
+        """Guarda a resposta, desde que a reserva ainda seja desta requisição (não retomada por outra)."""
+        with self.session_factory() as db:
+            IdempotencyRepository(db).update(
+                key,
+                {"status_code": status_code, "headers": headers, "body": body},
+                expected={"created_at": reserved_at, "status_code": None},
+            )
+
+    def release(self, key: str, reserved_at: datetime):
+        with self.session_factory() as db:
+            IdempotencyRepository(db).delete(key, expected={"created_at": reserved_at, "status_code": None})
@@ -0,0 +1,202 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+
+# Limites (em segundos) dos buckets do histograma de latência
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class RequestMetrics:
+    """Medidas acumuladas durante uma requisição (consultas, tempo de banco, linhas e serialização)."""
+    started_at: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    serialization_time: float = 0.0
+
+    def server_timing(self) -> str:
+        """Valor do cabeçalho Server-Timing (durações em milissegundos)."""
+        elapsed = time.perf_counter() - self.started_at
+        return (
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries", '
+            f"serialize;dur={self.serialization_time * 1000:.2f}, "
+            f"app;dur={elapsed * 1000:.2f}"
+        )
+
+
+current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request_metrics", default=None)
+
+
+@contextmanager
+def track_serialization() -> Iterator[None]:
+    """Soma o tempo do bloco à serialização da requisição atual."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = current_request_metrics.get()
+        if metrics is not None:
+            metrics.serialization_time += time.perf_counter() - started
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse que contabiliza a conversão do conteúdo em bytes como tempo de serialização."""
+
+    def render(self, content) -> bytes:
+        with track_serialization():
+            return super().render(content)
+
+
+@dataclass
+class RouteMetrics:
+    requests: Dict[str, int] = field(default_factory=dict)
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    duration: float = 0.0
+    queries: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    serialization_time: float = 0.0
+
+
+class MetricsRegistry:
+    """
+    Agrega, por método e rota, as medidas de cada requisição e as exporta no formato texto do Prometheus.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+    def observe(self, method: str, route: str, status: int, duration: float, metrics: RequestMetrics):
+        with self._lock:
+            route_metrics = self._routes.setdefault((method, route), RouteMetrics())
+            route_metrics.requests[str(status)] = route_metrics.requests.get(str(status), 0) + 1
+            route_metrics.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+            route_metrics.duration += duration
+            route_metrics.queries += metrics.queries
+            route_metrics.db_time += metrics.db_time
+            route_metrics.rows += metrics.rows
+            route_metrics.serialization_time += metrics.serialization_time
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_requests_total Requisições atendidas, por rota e status.",
+            "# TYPE http_requests_total counter",
+        ]
+        with self._lock:
+            routes = sorted(self._routes.items())
+            for (method, route), route_metrics in routes:
+                for status, count in sorted(route_metrics.requests.items()):
+                    lines.append(f'http_requests_total{{method="{method}",route="{route}",status="{status}"}} {count}')
+
+            lines += [
+                "# HELP http_request_duration_seconds Latência das requisições, por rota.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route), route_metrics in routes:
+                labels = f'method="{method}",route="{route}"'
+                cumulative = 0
+                for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), route_metrics.buckets):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {route_metrics.duration:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+            for name, attribute, help_text in (
+                    ("http_request_db_queries_total", "queries", "Consultas ao banco feitas pelas requisições."),
+                    ("http_request_db_seconds_total", "db_time", "Tempo gasto no banco pelas requisições."),
+                    ("http_request_db_rows_total", "rows", "Linhas retornadas ou afetadas, segundo o driver."),
+                    ("http_request_serialization_seconds_total", "serialization_time",
+                     "Tempo gasto serializando as respostas."),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, route), route_metrics in routes:
+                    value = getattr(route_metrics, attribute)
+                    value = f"{value:.6f}" if isinstance(value, float) else value
+                    lines.append(f'{name}{{method="{method}",route="{route}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mede cada requisição HTTP, registra as medidas por rota (o template, como
+    /tasks/{task_id}, e não o caminho) e adiciona o cabeçalho Server-Timing à resposta.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = metrics_registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = current_request_metrics.set(metrics)
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", metrics.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request_metrics.reset(token)
+            route = scope.get("route")
+            self.registry.observe(
+                scope["method"],
+                getattr(route, "path", "<unmatched>"),
+                status,
+                time.perf_counter() - metrics.started_at,
+                metrics,
+            )
+
+
+def register_query_metrics(engine):
+    """Registra no engine os eventos que somam consultas, tempo de banco e linhas à requisição atual."""
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        metrics = current_request_metrics.get()
+        if metrics is None:
+            return
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - started
+        # O SQLite só informa rowcount em escritas; o psycopg2 também informa as linhas de cada SELECT
+        if cursor.rowcount > 0:
+            metrics.rows += cursor.rowcount
+
+    def handle_error(context):
+        if context.connection is not None and context.connection.info.get("query_started_at"):
+            context.connection.info["query_started_at"].pop()
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolStats:
+    """
+    Acumula estatísticas de uso do pool de conexões (checkouts, esperas e timeouts).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zera todos os contadores."""
+        with self._lock:
+            self.connections_created = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.timeouts = 0
+            self.wait_time_total = 0.0
+            self.wait_time_max = 0.0
+
+    def record_connect(self):
+        with self._lock:
+            self.connections_created += 1
+
+    def record_checkin(self):
+        with self._lock:
+            self.checkins += 1
+
+    def record_checkout(self, wait_time: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def record_timeout(self, wait_time: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def snapshot(self, pool: Pool) -> Dict[str, float | int | str]:
+        """Retorna os contadores acumulados junto com o estado atual do pool."""
+        with self._lock:
+            stats = {
+                "pool_class": type(pool).__name__,
+                "connections_created": self.connections_created,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "wait_time_total": round(self.wait_time_total, 6),
+                "wait_time_max": round(self.wait_time_max, 6),
+                "wait_time_avg": round(self.wait_time_total / self.checkouts, 6) if self.checkouts else 0.0,
+            }
+
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                timeout=pool.timeout(),
+            )
+        return stats
+
+
+pool_stats = PoolStats()
+async_pool_stats = PoolStats()
+
+
+class InstrumentedPoolMixin:
+    """
+    Mede o tempo de espera de cada checkout de conexão e registra em `stats`.
+    """
+
+    stats: PoolStats = pool_stats
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.stats.record_timeout(time.perf_counter() - started)
+            raise
+        self.stats.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    stats = pool_stats
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    stats = async_pool_stats
+
+
+def register_pool_events(target, stats: PoolStats = pool_stats):
+    """Registra, no engine ou pool informado, os eventos que alimentam os contadores de conexões."""
+
+    def on_connect(dbapi_connection, connection_record):
+        stats.record_connect()
+
+    def on_checkin(dbapi_connection, connection_record):
+        stats.record_checkin()
+
+    event.listen(target, "connect", on_connect)
+    event.listen(target, "checkin", on_checkin)
@@ -0,0 +1,124 @@
+import logging
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger("todolist.sql")
+
+# Statements executados pela requisição atual (apenas com QUERY_LOG_ENABLED)
+current_request_queries: ContextVar[Optional[List[str]]] = ContextVar("current_request_queries", default=None)
+
+
+def frame_qualname(frame) -> str:
+    """Nome qualificado da função do frame (co_qualname só existe a partir do Python 3.11)."""
+    code = frame.f_code
+    qualname = getattr(code, "co_qualname", None)
+    if qualname is not None:
+        return qualname
+    owner = frame.f_locals.get("self", frame.f_locals.get("cls"))
+    if owner is None:
+        return code.co_name
+    owner_class = owner if isinstance(owner, type) else type(owner)
+    return f"{owner_class.__name__}.{code.co_name}"
+
+
+def calling_repository_method() -> str:
+    """
+    Método de repositório que originou a consulta: o mais externo da pilha dentro do pacote
+    `repositories` (ex.: TaskRepository.update, e não o BaseRepository.update_by_id que ele chama).
+    """
+    frame, caller = sys._getframe(1), None
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith("repositories."):
+            caller = frame_qualname(frame)
+        elif caller is not None:
+            break
+        frame = frame.f_back
+    return caller or "<unknown>"
+
+
+def register_query_log(engine, threshold_ms: float):
+    """
+    Registra no engine o log de consultas lentas: statements que levam `threshold_ms` ou mais são
+    registrados em WARNING com os parâmetros e o método de repositório que os executou. Também
+    anota cada statement na requisição atual para o detector de N+1 (QueryLogMiddleware).
+    """
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_log_started_at", []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_log_started_at"].pop()) * 1000
+        queries = current_request_queries.get()
+        if queries is not None:
+            queries.append(statement)
+        if elapsed_ms >= threshold_ms:
+            logger.warning(
+                "Slow query (%.1f ms) in %s: %s | parameters: %r",
+                elapsed_ms, calling_repository_method(), " ".join(statement.split()), parameters,
+            )
+
+    def handle_error(context):
+        if context.connection is not None and context.connection.info.get("query_log_started_at"):
+            context.connection.info["query_log_started_at"].pop()
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+
+
+class QueryLogMiddleware:
+    """
+    Middleware ASGI que sinaliza requisições com consultas demais: mais de `max_queries` no total,
+    ou o mesmo statement executado mais de `max_repeats` vezes (o padrão típico de N+1).
+    """
+
+    def __init__(self, app, max_queries: int = 10, max_repeats: int = 1):
+        self.app = app
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries: List[str] = []
+        token = current_request_queries.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_request_queries.reset(token)
+            self.check(scope["method"], scope["path"], queries)
+
+    def check(self, method: str, path: str, queries: List[str]) -> None:
+        repeated = [
+            (statement, count) for statement, count in Counter(queries).most_common() if count > self.max_repeats
+        ]
+        if len(queries) <= self.max_queries and not repeated:
+            return
+        logger.warning(
+            "%s %s issued %d queries (%d distinct); repeated: %s",
+            method, path, len(queries), len(set(queries)),
+            "; ".join(f"{count}x {' '.join(statement.split())}" for statement, count in repeated) or "none",
+        )
+
+
+@contextmanager
+def count_queries() -> Iterator[List[str]]:
+    """Captura os statements executados por qualquer engine durante o bloco (usado pelos testes)."""
+    statements: List[str] = []
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "after_cursor_execute", after_cursor_execute)
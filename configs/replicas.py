@@ -0,0 +1,117 @@
+import itertools
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from sqlalchemy import Delete, Engine, Insert, Select, Update, event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+HEALTH_CHECK_QUERY = text("SELECT 1")
+
+
+class Replica:
+    """
+    Réplica de leitura com o último resultado da verificação de saúde. Um erro de conexão durante
+    o uso também a marca como indisponível até a próxima verificação.
+    """
+
+    def __init__(self, engine: Engine | AsyncEngine, check_interval: float):
+        self.engine = engine
+        self.check_interval = check_interval
+        self.healthy = True
+        self.checked_at: Optional[float] = None
+        event.listen(self.sync_engine, "handle_error", self._on_error)
+
+    @property
+    def sync_engine(self) -> Engine:
+        """Engine usado pela sessão síncrona (para engines assíncronos, o engine síncrono interno)."""
+        return self.engine.sync_engine if isinstance(self.engine, AsyncEngine) else self.engine
+
+    @property
+    def needs_check(self) -> bool:
+        return self.checked_at is None or time.monotonic() - self.checked_at >= self.check_interval
+
+    def check(self) -> bool:
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(HEALTH_CHECK_QUERY)
+        except DBAPIError:
+            return self._mark(False)
+        return self._mark(True)
+
+    async def check_async(self) -> bool:
+        try:
+            async with self.engine.connect() as connection:
+                await connection.execute(HEALTH_CHECK_QUERY)
+        except DBAPIError:
+            return self._mark(False)
+        return self._mark(True)
+
+    def _mark(self, healthy: bool) -> bool:
+        self.healthy, self.checked_at = healthy, time.monotonic()
+        return healthy
+
+    def _on_error(self, context):
+        if context.is_disconnect or context.connection is None:
+            self._mark(False)
+
+
+class ReplicaSet:
+    """
+    Distribui as leituras entre as réplicas em round-robin, pulando as indisponíveis. A saúde de
+    cada réplica é verificada (SELECT 1) no momento da escolha, no máximo uma vez a cada `check_interval`.
+    Sem réplicas disponíveis, a escolha retorna None e a leitura vai para o primário.
+    """
+
+    def __init__(self, engines: Sequence[Engine | AsyncEngine], check_interval: float = 5.0):
+        self.replicas: List[Replica] = [Replica(engine, check_interval) for engine in engines]
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def _candidates(self) -> List[Replica]:
+        with self._lock:
+            start = next(self._counter) % len(self.replicas)
+        return self.replicas[start:] + self.replicas[:start]
+
+    def choose(self) -> Optional[Engine]:
+        for replica in self._candidates():
+            if replica.check() if replica.needs_check else replica.healthy:
+                return replica.sync_engine
+        return None
+
+    async def choose_async(self) -> Optional[Engine]:
+        for replica in self._candidates():
+            if await replica.check_async() if replica.needs_check else replica.healthy:
+                return replica.sync_engine
+        return None
+
+    def status(self) -> List[dict]:
+        return [
+            {"url": replica.sync_engine.url.render_as_string(), "healthy": replica.healthy}
+            for replica in self.replicas
+        ]
+
+
+class RoutingSession(Session):
+    """
+    Sessão que envia os SELECTs à réplica escolhida para a requisição e as escritas ao primário.
+    Depois da primeira escrita (flush ou INSERT/UPDATE/DELETE), a sessão passa a ler também do
+    primário, garantindo que a própria requisição veja o que gravou.
+    """
+
+    def __init__(self, *args, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is not None:
+            if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+                self.replica = None
+            elif isinstance(clause, Select):
+                return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
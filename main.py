@@ -3,9 +3,22 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
 
+from configs.database import AsyncEngine
 from configs.environment import get_environment_variables
+from configs.idempotency import IdempotencyMiddleware
+from configs.metrics import MetricsMiddleware, TimedJSONResponse
+from configs.query_log import QueryLogMiddleware
 from repositories.models import init as init_db
+from routers.async_task_router import router as async_task_router
+from routers.cache_router import router as cache_router
+from routers.database_router import router as database_router
+from routers.metrics_router import router as metrics_router
+from routers.task_bulk_router import router as task_bulk_router
+from routers.task_changes_router import router as task_changes_router
+from routers.task_export_router import router as task_export_router
 from routers.task_router import router as task_router
+from routers.task_search_router import router as task_search_router
+from routers.task_stats_router import router as task_stats_router
 
 env = get_environment_variables()
 
@@ -14,15 +27,44 @@ env = get_environment_variables()
 async def lifespan(app: FastAPI):
     init_db()
     yield
+    if AsyncEngine is not None:
+        await AsyncEngine.dispose()
 
 
 app = FastAPI(
     title=env.APP_NAME,
     version=env.API_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=TimedJSONResponse,
 )
 
-app.include_router(task_router)
+# Adicionado antes, fica por dentro das métricas: as respostas repetidas também são medidas
+if env.IDEMPOTENCY_ENABLED:
+    app.add_middleware(
+        IdempotencyMiddleware,
+        ttl=env.IDEMPOTENCY_KEY_TTL,
+        cleanup_interval=env.IDEMPOTENCY_CLEANUP_INTERVAL,
+        lease=env.IDEMPOTENCY_LEASE,
+        max_body_size=env.IDEMPOTENCY_MAX_BODY_SIZE,
+    )
+if env.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if env.QUERY_LOG_ENABLED:
+    app.add_middleware(
+        QueryLogMiddleware, max_queries=env.QUERY_LOG_MAX_QUERIES, max_repeats=env.QUERY_LOG_MAX_REPEATS
+    )
+
+# Rotas com caminhos fixos (/tasks/bulk, /tasks/export, /tasks/stats, /tasks/changes, ...)
+# precedem as rotas com /tasks/{task_id}
+app.include_router(task_bulk_router)
+app.include_router(task_export_router)
+app.include_router(task_stats_router)
+app.include_router(task_search_router)
+app.include_router(task_changes_router)
+app.include_router(async_task_router if env.ASYNC_MODE else task_router)
+app.include_router(database_router)
+app.include_router(cache_router)
+app.include_router(metrics_router)
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=True)
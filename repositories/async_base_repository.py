@@ -0,0 +1,111 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Generic, List, TypeVar, Optional, Type
+
+from sqlalchemy import delete, inspect, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.helpers.db_operations import (
+    copy_attributes,
+    expected_criteria,
+    with_version_increment,
+    wrap_db_exception,
+)
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+
+
+class AsyncBaseRepository(ABC, Generic[T, ID]):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @property
+    def reads_from_replica(self) -> bool:
+        """Indica se as leituras da sessão ainda vão para uma réplica (RoutingSession), e não ao primário."""
+        return getattr(self.db.sync_session, "replica", None) is not None
+
+    async def add(self, entity: T) -> T:
+        """Adiciona uma nova entidade ao banco de dados."""
+        try:
+            self.db.add(entity)
+            await self.db.commit()
+            await self.db.refresh(entity)
+            return entity
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao salvar no banco de dados") from e
+
+    async def delete_entity(self, entity_id: ID, model: Type[T], expected: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Exclui uma entidade do banco de dados pelo ID com um único DELETE ... RETURNING.
+        Com `expected`, só exclui se as colunas ainda tiverem os valores informados.
+        """
+        primary_key = inspect(model).primary_key[0]
+        statement = delete(model).where(primary_key == entity_id, *expected_criteria(model, expected))
+        statement = statement.returning(primary_key)
+        try:
+            deleted_id = await self.db.scalar(statement)
+            await self.db.commit()
+            return deleted_id is not None
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao deletar do banco de dados") from e
+
+    async def update_by_id(
+            self, model: Type[T], entity_id: ID, values: Dict[str, Any], expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[T]:
+        """
+        Atualiza uma entidade pelo ID com um único UPDATE ... RETURNING.
+        Com `expected`, a linha só é alterada se as colunas ainda tiverem os valores informados
+        (comparação e troca atômica). A coluna de versão do modelo, se houver, é incrementada.
+        Retorna a entidade atualizada (desanexada da sessão) ou None se nenhuma linha atendeu aos critérios.
+        """
+        primary_key = inspect(model).primary_key[0]
+        statement = update(model).where(primary_key == entity_id, *expected_criteria(model, expected))
+        statement = statement.values(**with_version_increment(model, values)).returning(model)
+        try:
+            entity = await self.db.scalar(statement)
+            if entity is not None:
+                self.db.expunge(entity)
+            await self.db.commit()
+            return entity
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao atualizar o banco de dados") from e
+
+    async def update_entity(self, entity: T) -> T:
+        """Atualiza uma entidade no banco de dados."""
+        try:
+            await self.db.commit()
+            await self.db.refresh(entity)
+            return entity
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao atualizar o banco de dados") from e
+
+    def copy_attributes(self, target: T, source: T):
+        """Copia atributos de uma entidade para outra."""
+        copy_attributes(target, source)
+
+    @abstractmethod
+    async def create(self, entity: T) -> T:
+        pass
+
+    @abstractmethod
+    async def delete(self, entity_id: ID, expected: Optional[Dict[str, Any]] = None) -> bool:
+        pass
+
+    @abstractmethod
+    async def get(self, entity_id: ID) -> Optional[T]:
+        pass
+
+    @abstractmethod
+    async def list(self, limit: int = 10, offset: int = 0) -> List[T]:
+        pass
+
+    @abstractmethod
+    async def update(
+            self, entity_id: ID, values: Dict[str, Any], expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[T]:
+        pass
@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from fastapi import Depends
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.database import get_async_db_connection
+from repositories.models import Task
+from repositories.async_base_repository import AsyncBaseRepository
+from repositories.helpers.pagination import CursorKey
+from repositories.helpers.task_queries import (
+    ESTIMATED_COUNT_QUERY,
+    filtered_count_query,
+    get_task_query,
+    get_tasks_query,
+    list_tasks_query,
+    task_columns,
+    total_count_query,
+)
+from schemas.enums import SortOrder, TaskSort, TaskStatus
+
+
+class AsyncTaskRepository(AsyncBaseRepository[Task, int]):
+    def __init__(self, db: AsyncSession = Depends(get_async_db_connection)):
+        super().__init__(db)
+
+    async def create(self, entity: Task) -> Task:
+        """Adiciona uma nova tarefa usando o método add do repositório base."""
+        return await self.add(entity)
+
+    async def delete(self, entity_id: int, expected: Optional[Dict[str, Any]] = None) -> bool:
+        """Exclui uma tarefa pelo ID usando delete_entity."""
+        return await self.delete_entity(entity_id, Task, expected)
+
+    async def count(
+            self,
+            status: Optional[TaskStatus] = None,
+            estimate: bool = False,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> int:
+        """
+        Conta as tarefas pelos contadores por status ou, com `estimate` no PostgreSQL, por reltuples.
+        Com filtros de data, faz um COUNT(*) com os filtros da listagem.
+        """
+        if created_after is not None or updated_after is not None:
+            return await self.db.scalar(filtered_count_query(status, created_after, updated_after))
+        if estimate and status is None and self.db.bind.dialect.name == "postgresql":
+            estimated = await self.db.scalar(ESTIMATED_COUNT_QUERY)
+            if estimated is not None and estimated >= 0:
+                return estimated
+        return await self.db.scalar(total_count_query(status))
+
+    async def get(self, entity_id: int) -> Optional[Task]:
+        """Recupera uma tarefa pelo ID."""
+        return await self.db.scalar(select(Task).where(Task.id == entity_id).limit(1))
+
+    async def get_row(self, entity_id: int, fields: Sequence[str]) -> Optional[Row]:
+        """Recupera uma tarefa pelo ID como linha Row, lendo apenas as colunas de `fields`."""
+        result = await self.db.execute(get_task_query(entity_id, fields))
+        return result.first()
+
+    async def get_rows(self, entity_ids: Sequence[int], fields: Optional[Sequence[str]] = None) -> Sequence[Row]:
+        """Recupera várias tarefas pelo ID com uma única consulta; a ordem das linhas não é garantida."""
+        result = await self.db.execute(get_tasks_query(entity_ids, fields))
+        return result.all()
+
+    async def list(
+            self,
+            limit: int = 10,
+            offset: int = 0,
+            status: Optional[TaskStatus] = None,
+            after: Optional[CursorKey] = None,
+            sort: TaskSort = TaskSort.CREATED_AT,
+            order: SortOrder = SortOrder.ASC,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> Union[List[Task], list]:
+        """
+        Lista tarefas com paginação por offset ou por cursor (keyset), ordenação por `sort`/`order`
+        e filtros opcionais por status e por data de criação/alteração.
+        """
+        result = await self.db.scalars(list_tasks_query(
+            limit=limit, offset=offset, status=status, after=after, sort=sort, order=order,
+            created_after=created_after, updated_after=updated_after,
+        ))
+        return result.all()
+
+    async def list_rows(
+            self,
+            limit: int = 10,
+            offset: int = 0,
+            status: Optional[TaskStatus] = None,
+            after: Optional[CursorKey] = None,
+            fields: Optional[Sequence[str]] = None,
+            sort: TaskSort = TaskSort.CREATED_AT,
+            order: SortOrder = SortOrder.ASC,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> Sequence[Row]:
+        """
+        Lista tarefas como linhas Row (apenas as colunas da resposta), sem montar entidades ORM.
+        Com `fields`, o SELECT lê somente as colunas desses campos.
+        """
+        result = await self.db.execute(
+            list_tasks_query(
+                limit=limit, offset=offset, status=status, after=after, columns=task_columns(fields),
+                sort=sort, order=order, created_after=created_after, updated_after=updated_after,
+            )
+        )
+        return result.all()
+
+    async def update(
+            self, entity_id: int, values: Dict[str, Any], expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[Task]:
+        """Atualiza uma tarefa pelo ID com um único UPDATE ... RETURNING; retorna None se ela não existir."""
+        return await self.update_by_id(Task, entity_id, values, expected)
+
+    async def get_by_title(self, title: str) -> Optional[Task]:
+        """Busca uma tarefa pelo título."""
+        return await self.db.scalar(select(Task).where(Task.title == title).limit(1))
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Generic, List, TypeVar, Optional, Type
+from typing import Any, Dict, Generic, List, TypeVar, Optional, Tuple, Type
 
+from sqlalchemy import ColumnElement, delete, insert, inspect, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from repositories.helpers.db_operations import copy_attributes, RepositoryDBException
+from repositories.helpers.db_operations import (
+    copy_attributes,
+    expected_criteria,
+    with_version_increment,
+    wrap_db_exception,
+)
 
 T = TypeVar("T")
 ID = TypeVar("ID")
@@ -14,6 +20,11 @@ class BaseRepository(ABC, Generic[T, ID]):
     def __init__(self, db: Session):
         self.db = db
 
+    @property
+    def reads_from_replica(self) -> bool:
+        """Indica se as leituras da sessão ainda vão para uma réplica (RoutingSession), e não ao primário."""
+        return getattr(self.db, "replica", None) is not None
+
     def add(self, entity: T) -> T:
         """Adiciona uma nova entidade ao banco de dados."""
         try:
@@ -23,26 +34,88 @@ class BaseRepository(ABC, Generic[T, ID]):
             return entity
         except SQLAlchemyError as e:
             self.db.rollback()
-            raise RepositoryDBException(
-                original_exception=e,
-                message="Erro ao salvar no banco de dados"
-            ) from e
+            raise wrap_db_exception(e, "Erro ao salvar no banco de dados") from e
+
+    def add_many(self, model: Type[T], rows: List[Dict[str, Any]]) -> List[T]:
+        """
+        Insere várias entidades em uma única transação, com um INSERT em lote (executemany/RETURNING).
+        Todos os itens de `rows` devem ter as mesmas chaves; valores None são gravados como NULL.
+        A ordem das entidades retornadas não é garantida. Elas já vêm desanexadas da sessão,
+        evitando um SELECT de refresh por linha após o commit.
+        """
+        if not rows:
+            return []
+        try:
+            entities = self.db.scalars(
+                insert(model).returning(model), rows, execution_options={"render_nulls": True}
+            ).all()
+            for entity in entities:
+                self.db.expunge(entity)
+            self.db.commit()
+            return list(entities)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao salvar no banco de dados") from e
+
+    def delete_entity(self, entity_id: ID, model: Type[T], expected: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Exclui uma entidade do banco de dados pelo ID com um único DELETE ... RETURNING.
+        Com `expected`, só exclui se as colunas ainda tiverem os valores informados.
+        """
+        primary_key = inspect(model).primary_key[0]
+        statement = delete(model).where(primary_key == entity_id, *expected_criteria(model, expected))
+        statement = statement.returning(primary_key)
+        try:
+            deleted_id = self.db.scalar(statement)
+            self.db.commit()
+            return deleted_id is not None
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao deletar do banco de dados") from e
+
+    def delete_many(self, model: Type[T], criteria: List[ColumnElement[bool]], chunk_size: int = 1000) -> int:
+        """
+        Exclui as entidades que atendem aos critérios em lotes de até `chunk_size` linhas,
+        com um DELETE ... WHERE id IN (SELECT ... LIMIT) e um commit por lote, para não
+        manter a tabela bloqueada durante exclusões grandes. Retorna o total de linhas excluídas.
+        """
+        primary_key = inspect(model).primary_key[0]
+        chunk = select(primary_key).where(*criteria).order_by(primary_key).limit(chunk_size)
+        statement = delete(model).where(primary_key.in_(chunk.scalar_subquery()))
 
-    def delete_entity(self, entity_id: ID, model: Type[T]) -> bool:
-        """Exclui uma entidade do banco de dados pelo ID."""
+        deleted = 0
         try:
-            entity = self.db.get(model, entity_id)
-            if entity:
-                self.db.delete(entity)
+            while True:
+                result = self.db.execute(statement, execution_options={"synchronize_session": False})
                 self.db.commit()
-                return True
-            return False
+                deleted += result.rowcount
+                if result.rowcount < chunk_size:
+                    return deleted
         except SQLAlchemyError as e:
             self.db.rollback()
-            raise RepositoryDBException(
-                original_exception=e,
-                message="Erro ao deletar do banco de dados"
-            ) from e
+            raise wrap_db_exception(e, "Erro ao deletar do banco de dados") from e
+
+    def update_by_id(
+            self, model: Type[T], entity_id: ID, values: Dict[str, Any], expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[T]:
+        """
+        Atualiza uma entidade pelo ID com um único UPDATE ... RETURNING.
+        Com `expected`, a linha só é alterada se as colunas ainda tiverem os valores informados
+        (comparação e troca atômica). A coluna de versão do modelo, se houver, é incrementada.
+        Retorna a entidade atualizada (desanexada da sessão) ou None se nenhuma linha atendeu aos critérios.
+        """
+        primary_key = inspect(model).primary_key[0]
+        statement = update(model).where(primary_key == entity_id, *expected_criteria(model, expected))
+        statement = statement.values(**with_version_increment(model, values)).returning(model)
+        try:
+            entity = self.db.scalar(statement)
+            if entity is not None:
+                self.db.expunge(entity)
+            self.db.commit()
+            return entity
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao atualizar o banco de dados") from e
 
     def update_entity(self, entity: T) -> T:
         """Atualiza uma entidade no banco de dados."""
@@ -52,10 +125,30 @@ class BaseRepository(ABC, Generic[T, ID]):
             return entity
         except SQLAlchemyError as e:
             self.db.rollback()
-            raise RepositoryDBException(
-                original_exception=e,
-                message="Erro ao atualizar o banco de dados"
-            ) from e
+            raise wrap_db_exception(e, "Erro ao atualizar o banco de dados") from e
+
+    def update_many(
+            self, model: Type[T], criteria: List[ColumnElement[bool]], values: Dict[str, Any]
+    ) -> Tuple[int, Optional[List[ID]]]:
+        """
+        Atualiza, com um único UPDATE ... WHERE, todas as entidades que atendem aos critérios
+        (incrementando a coluna de versão do modelo, se houver).
+        Retorna a quantidade de linhas alteradas e, quando o dialeto suporta RETURNING, seus IDs.
+        """
+        primary_key = inspect(model).primary_key[0]
+        statement = update(model).where(*criteria).values(**with_version_increment(model, values))
+        supports_returning = self.db.get_bind().dialect.update_returning
+        if supports_returning:
+            statement = statement.returning(primary_key)
+
+        try:
+            result = self.db.execute(statement, execution_options={"synchronize_session": False})
+            ids = list(result.scalars().all()) if supports_returning else None
+            self.db.commit()
+            return (len(ids) if ids is not None else result.rowcount), ids
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise wrap_db_exception(e, "Erro ao atualizar o banco de dados") from e
 
     def copy_attributes(self, target: T, source: T):
         """Copia atributos de uma entidade para outra."""
@@ -66,7 +159,7 @@ class BaseRepository(ABC, Generic[T, ID]):
         pass
 
     @abstractmethod
-    def delete(self, entity_id: ID) -> None:
+    def delete(self, entity_id: ID, expected: Optional[Dict[str, Any]] = None) -> bool:
         pass
 
     @abstractmethod
@@ -78,5 +171,7 @@ class BaseRepository(ABC, Generic[T, ID]):
         pass
 
     @abstractmethod
-    def update(self, entity_id: ID, entity: T) -> T:
+    def update(
+            self, entity_id: ID, values: Dict[str, Any], expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[T]:
         pass
@@ -0,0 +1,3 @@
+from repositories.cache.base import Cache, NullCache
+from repositories.cache.memory_cache import InMemoryCache
+from repositories.cache.redis_cache import RedisCache
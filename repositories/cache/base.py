@@ -0,0 +1,70 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
+
+
+class Cache(ABC):
+    """
+    Interface dos caches de leitura. Os valores são bytes (JSON já serializado), o que permite
+    trocar o backend em memória por um compatível com Redis sem mudar quem usa o cache.
+    """
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if keys:
+            self.delete(*keys)
+
+    def stats(self) -> Dict[str, int | float | str]:
+        """Retorna os contadores de acertos, falhas e remoções do cache."""
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": type(self).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class NullCache(Cache):
+    """Cache desativado: toda leitura é uma falha e nada é armazenado."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        pass
+
+    def delete(self, *keys: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
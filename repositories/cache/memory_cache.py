@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from repositories.cache.base import Cache
+
+
+class InMemoryCache(Cache):
+    """
+    Cache LRU com expiração por TTL, limitado a `max_size` entradas, local ao processo.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 60.0):
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+                self._count("evictions")
+
+            if entry is None:
+                self._count("misses")
+                return None
+
+            self._entries.move_to_end(key)
+            self._count("hits")
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._count("evictions")
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int | float | str]:
+        stats = super().stats()
+        stats.update(size=len(self._entries), max_size=self.max_size, ttl=self.ttl)
+        return stats
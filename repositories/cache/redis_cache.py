@@ -0,0 +1,46 @@
+from typing import Any, Dict, Optional
+
+from repositories.cache.base import Cache
+
+
+class RedisCache(Cache):
+    """
+    Cache sobre um cliente compatível com Redis (get/set/delete/scan_iter), como `redis.Redis`.
+    As chaves recebem um prefixo para que `clear` remova apenas as entradas desta aplicação.
+    """
+
+    def __init__(self, client: Any, ttl: float = 60.0, prefix: str = "todolist:"):
+        super().__init__()
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float = 60.0, prefix: str = "todolist:") -> "RedisCache":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package to be installed") from e
+        return cls(redis.Redis.from_url(url), ttl=ttl, prefix=prefix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.client.get(self.prefix + key)
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self.client.set(self.prefix + key, value, px=int((self.ttl if ttl is None else ttl) * 1000))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def stats(self) -> Dict[str, int | float | str]:
+        stats = super().stats()
+        stats.update(ttl=self.ttl)
+        return stats
@@ -1,4 +1,7 @@
-from typing import TypeVar
+from typing import Any, Dict, List, Optional, TypeVar
+
+from sqlalchemy import ColumnElement, inspect
+from sqlalchemy.exc import IntegrityError
 
 T = TypeVar("T")
 ID = TypeVar("ID")
@@ -22,3 +25,26 @@ class RepositoryDBException(Exception):
         if self.original_exception:
             return f"{self.message}: {str(self.original_exception)}"
         return self.message
+
+
+class RepositoryIntegrityException(RepositoryDBException):
+    """Raised when a write violates a database constraint (e.g. a unique title)."""
+
+
+def wrap_db_exception(exception: Exception, message: str) -> RepositoryDBException:
+    """Wraps a SQLAlchemy error, using RepositoryIntegrityException for constraint violations."""
+    exception_class = RepositoryIntegrityException if isinstance(exception, IntegrityError) else RepositoryDBException
+    return exception_class(message=message, original_exception=exception)
+
+
+def with_version_increment(model, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Adds `version = version + 1` to the UPDATE values when the model maps a version_id_col."""
+    version_column = inspect(model).version_id_col
+    if version_column is None:
+        return values
+    return {**values, version_column.key: version_column + 1}
+
+
+def expected_criteria(model, expected: Optional[Dict[str, Any]]) -> List[ColumnElement[bool]]:
+    """Builds `column == value` criteria (IS NULL for None) used in conditional writes."""
+    return [getattr(model, column) == value for column, value in (expected or {}).items()]
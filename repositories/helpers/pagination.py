@@ -0,0 +1,81 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+CursorKey = Tuple[Any, int]
+SearchCursorKey = Tuple[float, int]
+
+CURSOR_ERRORS = (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError)
+
+
+def _encode_payload(payload: dict) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str) -> dict:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def encode_cursor(value: Any, entity_id: int, sort: Optional[str] = None) -> str:
+    """
+    Gera um cursor opaco a partir da chave de ordenação (valor, id) do último item da página.
+    `sort` identifica a ordenação da listagem e é omitido na ordenação padrão (created_at, id).
+    """
+    payload = {"c": value.isoformat()} if isinstance(value, datetime) else {"v": value}
+    payload["i"] = entity_id
+    if sort:
+        payload["k"] = sort
+    return _encode_payload(payload)
+
+
+def decode_cursor(cursor: str, sort: Optional[str] = None) -> Optional[CursorKey]:
+    """
+    Converte um cursor opaco de volta para a chave (valor, id).
+    Um cursor vazio indica o início da paginação. Lança ValueError se o cursor for inválido
+    ou tiver sido gerado para outra ordenação.
+    """
+    if not cursor:
+        return None
+
+    try:
+        payload = _decode_payload(cursor)
+        if payload.get("k") != sort:
+            raise ValueError("Cursor was issued for a different sort order")
+        value = datetime.fromisoformat(payload["c"]) if "c" in payload else payload["v"]
+        return value, int(payload["i"])
+    except CURSOR_ERRORS as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def encode_search_cursor(score: float, entity_id: int) -> str:
+    """Gera o cursor da busca textual a partir da relevância e do ID do último resultado."""
+    return _encode_payload({"s": score, "i": entity_id})
+
+
+def decode_search_cursor(cursor: str) -> Optional[SearchCursorKey]:
+    """Converte um cursor da busca textual de volta para a chave (relevância, id)."""
+    if not cursor:
+        return None
+
+    try:
+        payload = _decode_payload(cursor)
+        return float(payload["s"]), int(payload["i"])
+    except CURSOR_ERRORS as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def next_page_cursor(
+        items: Sequence, limit: int, key: Optional[Callable[[Any], Any]] = None, sort: Optional[str] = None
+) -> Optional[str]:
+    """
+    Retorna o cursor da próxima página, ou None quando a página atual não está cheia.
+    `key` extrai o valor de ordenação do último item (padrão: created_at).
+    """
+    if limit <= 0 or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(key(last) if key else last.created_at, last.id, sort)
@@ -0,0 +1,187 @@
+import re
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Double, Select, TextClause, cast, func, literal_column, select, text, tuple_
+
+from repositories.helpers.pagination import CursorKey, SearchCursorKey
+from repositories.models import Task, TaskStatusCount, search_vector, tasks_fts
+from schemas.enums import SortOrder, TaskSort, TaskStatus
+
+# Colunas lidas pelo caminho rápido de listagem (linhas Row, sem montar entidades ORM)
+TASK_COLUMNS = (
+    Task.id, Task.title, Task.description, Task.status, Task.created_at, Task.updated_at, Task.version
+)
+
+
+# Última alteração da tarefa (updated_at fica nulo até a primeira atualização); usa ix_tasks_modified_at_id
+TASK_MODIFIED_AT = func.coalesce(Task.updated_at, Task.created_at)
+
+TASK_SORT_COLUMNS = {
+    TaskSort.ID: Task.id,
+    TaskSort.CREATED_AT: Task.created_at,
+    TaskSort.UPDATED_AT: TASK_MODIFIED_AT,
+    TaskSort.TITLE: Task.title,
+}
+
+
+def task_sort_key(sort: TaskSort = TaskSort.CREATED_AT, order: SortOrder = SortOrder.ASC) -> Optional[str]:
+    """Identificador da ordenação gravado no cursor (None na ordenação padrão, mantendo os cursores antigos)."""
+    if sort == TaskSort.CREATED_AT and order == SortOrder.ASC:
+        return None
+    return f"{sort.value}:{order.value}"
+
+
+def task_sort_value(task: Any, sort: TaskSort = TaskSort.CREATED_AT) -> Any:
+    """Valor da coluna de ordenação de uma tarefa já carregada, equivalente a TASK_SORT_COLUMNS."""
+    if sort == TaskSort.UPDATED_AT:
+        return task.updated_at or task.created_at
+    return getattr(task, sort.value)
+
+
+def _as_stored_datetime(value: datetime) -> datetime:
+    """As colunas de data não têm fuso e guardam UTC: converte datas com fuso antes de comparar."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def task_columns(fields: Optional[Sequence[str]] = None) -> Sequence:
+    """Colunas de Task correspondentes aos campos pedidos (todas as de TASK_COLUMNS sem projeção)."""
+    return [getattr(Task, name) for name in fields] if fields else TASK_COLUMNS
+
+
+def get_task_query(entity_id: int, fields: Optional[Sequence[str]] = None) -> Select:
+    """Busca uma tarefa pelo ID lendo apenas as colunas dos campos pedidos."""
+    return select(*task_columns(fields)).where(Task.id == entity_id)
+
+
+def get_tasks_query(entity_ids: Sequence[int], fields: Optional[Sequence[str]] = None) -> Select:
+    """Busca várias tarefas pelo ID com um único WHERE id IN (...), lendo apenas as colunas pedidas."""
+    return select(*task_columns(fields)).where(Task.id.in_(entity_ids))
+
+
+def task_filters(
+        status: Optional[TaskStatus] = None,
+        created_after: Optional[datetime] = None,
+        updated_after: Optional[datetime] = None,
+) -> List[Any]:
+    """Critérios de filtro da listagem, compartilhados pelo SELECT da página e pelo COUNT do total."""
+    criteria = []
+    if status:
+        criteria.append(Task.status == status)
+    if created_after is not None:
+        criteria.append(Task.created_at > _as_stored_datetime(created_after))
+    if updated_after is not None:
+        criteria.append(TASK_MODIFIED_AT > _as_stored_datetime(updated_after))
+    return criteria
+
+
+def list_tasks_query(
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[TaskStatus] = None,
+        after: Optional[CursorKey] = None,
+        columns: Optional[Sequence] = None,
+        sort: TaskSort = TaskSort.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+        created_after: Optional[datetime] = None,
+        updated_after: Optional[datetime] = None,
+) -> Select:
+    """
+    Monta o SELECT da listagem de tarefas, compartilhado pelos repositórios síncrono e assíncrono.
+    A ordem é (coluna de `sort`, id), ascendente ou descendente, e cada coluna de ordenação tem índice
+    (ix_tasks_created_at_id, ix_tasks_modified_at_id, o índice único de title e a PK). Com `after`
+    a página é buscada por keyset (WHERE (coluna, id) > :after) em vez de descartar `offset` linhas.
+    `created_after`/`updated_after` viram faixas nesses mesmos índices.
+    Com `columns`, seleciona apenas essas colunas em vez da entidade Task.
+    """
+    query = select(*columns) if columns else select(Task)
+    query = query.where(*task_filters(status, created_after, updated_after))
+
+    keys = (Task.id,) if sort == TaskSort.ID else (TASK_SORT_COLUMNS[sort], Task.id)
+    descending = order == SortOrder.DESC
+    if after is not None:
+        position = tuple_(*keys) if len(keys) > 1 else keys[0]
+        bound = tuple_(*after) if len(keys) > 1 else after[1]
+        query = query.where(position < bound if descending else position > bound)
+    elif offset:
+        query = query.offset(offset)
+
+    return query.order_by(*(key.desc() if descending else key for key in keys)).limit(limit)
+
+
+def export_tasks_query(status: Optional[TaskStatus] = None) -> Select:
+    """Monta o SELECT da exportação completa, ordenado por id (índices da PK e de (status, id))."""
+    query = select(*TASK_COLUMNS)
+
+    if status:
+        query = query.where(Task.status == status)
+
+    return query.order_by(Task.id)
+
+
+def status_counts_query() -> Select:
+    """Lê os contadores por status mantidos pelos triggers (uma linha por status, sem COUNT(*))."""
+    return select(TaskStatusCount.status, TaskStatusCount.count)
+
+
+def total_count_query(status: Optional[TaskStatus] = None) -> Select:
+    """Soma os contadores por status, opcionalmente de um único status."""
+    query = select(func.coalesce(func.sum(TaskStatusCount.count), 0))
+    if status:
+        query = query.where(TaskStatusCount.status == status)
+    return query
+
+
+def filtered_count_query(
+        status: Optional[TaskStatus] = None,
+        created_after: Optional[datetime] = None,
+        updated_after: Optional[datetime] = None,
+) -> Select:
+    """
+    COUNT(*) com os mesmos filtros da listagem, para os filtros de data que os contadores por status
+    não cobrem (faixas nos índices de created_at e de coalesce(updated_at, created_at)).
+    """
+    return select(func.count()).select_from(Task).where(*task_filters(status, created_after, updated_after))
+
+
+# Estimativa do PostgreSQL atualizada por VACUUM/ANALYZE; -1 se a tabela nunca foi analisada
+ESTIMATED_COUNT_QUERY: TextClause = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'tasks'::regclass")
+
+
+def search_terms(query: str) -> List[str]:
+    """Extrai as palavras da busca, descartando a sintaxe de consulta do FTS5/tsquery."""
+    return re.findall(r"\w+", query)
+
+
+def search_tasks_query(
+        terms: List[str],
+        dialect: str,
+        limit: int = 10,
+        after: Optional[SearchCursorKey] = None,
+) -> Select:
+    """
+    Monta a busca textual em title e description, com todos os termos casando por prefixo.
+    No SQLite usa a tabela FTS5 (relevância bm25, com peso maior para o título); no PostgreSQL,
+    a coluna tsvector com índice GIN (ts_rank_cd). A coluna `score` cresce com a relevância
+    invertida, então os resultados seguem (score, id) ascendente e a paginação é por keyset.
+    """
+    if dialect == "postgresql":
+        ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        score = cast(-func.ts_rank_cd(search_vector, ts_query), Double)
+        query = select(*TASK_COLUMNS, score.label("score")).where(search_vector.op("@@")(ts_query))
+    else:
+        fts_table = literal_column("tasks_fts")
+        score = func.bm25(fts_table, 2.0, 1.0)
+        query = (
+            select(*TASK_COLUMNS, score.label("score"))
+            .select_from(tasks_fts)
+            .join(Task, Task.id == tasks_fts.c.rowid)
+            .where(fts_table.op("MATCH")(" ".join(f'"{term}"*' for term in terms)))
+        )
+
+    if after is not None:
+        query = query.where(tuple_(score, Task.id) > tuple_(*after))
+
+    return query.order_by(score, Task.id).limit(limit)
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from configs.database import get_db_connection
+from repositories.base_repository import BaseRepository
+from repositories.models import IdempotencyKey
+
+
+class IdempotencyRepository(BaseRepository[IdempotencyKey, str]):
+    def __init__(self, db: Session = Depends(get_db_connection)):
+        super().__init__(db)
+
+    def create(self, entity: IdempotencyKey) -> IdempotencyKey:
+        """Reserva a chave; levanta RepositoryIntegrityException se ela já existir."""
+        return self.add(entity)
+
+    def delete(self, entity_id: str, expected: Optional[Dict[str, Any]] = None) -> bool:
+        return self.delete_entity(entity_id, IdempotencyKey, expected)
+
+    def get(self, entity_id: str) -> Optional[IdempotencyKey]:
+        return self.db.get(IdempotencyKey, entity_id, populate_existing=True)
+
+    def list(self, limit: int = 10, offset: int = 0) -> List[IdempotencyKey]:
+        return self.db.query(IdempotencyKey).order_by(IdempotencyKey.created_at).offset(offset).limit(limit).all()
+
+    def update(
+            self, entity_id: str, values: Dict[str, Any], expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[IdempotencyKey]:
+        return self.update_by_id(IdempotencyKey, entity_id, values, expected)
+
+    def delete_expired(self, now: datetime, chunk_size: int = 1000) -> int:
+        """Exclui em lotes as chaves expiradas (pelo índice de expires_at) e retorna quantas foram removidas."""
+        return self.delete_many(IdempotencyKey, [IdempotencyKey.expires_at <= now], chunk_size=chunk_size)
@@ -1,6 +1,9 @@
 from configs.database import Engine
 from repositories.models.base_model import EntityMeta
 from repositories.models.task_model import Task
+from repositories.models.idempotency_key_model import IdempotencyKey
+from repositories.models.task_status_count_model import TaskStatusCount
+from repositories.models.task_search_index import search_vector, tasks_fts
 
 
 def init():
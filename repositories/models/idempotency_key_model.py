@@ -0,0 +1,19 @@
+from sqlalchemy import JSON, Column, DateTime, Integer, LargeBinary, String
+
+from repositories.models import EntityMeta
+
+
+class IdempotencyKey(EntityMeta):
+    """
+    Resposta guardada de uma requisição de escrita enviada com o cabeçalho Idempotency-Key.
+    Enquanto a requisição original está em andamento, `status_code` fica nulo.
+    """
+    __tablename__: str = "idempotency_keys"
+
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    headers = Column(JSON, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
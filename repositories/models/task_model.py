@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
 from typing import Dict
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SqlEnum, func
+from sqlalchemy import DDL, Column, Integer, String, DateTime, Enum as SqlEnum, Index, event, func, inspect
+from sqlalchemy.schema import CreateIndex
 
 from repositories.models import EntityMeta
 from schemas.enums import TaskStatus
@@ -9,13 +10,23 @@ from schemas.enums import TaskStatus
 
 class Task(EntityMeta):
     __tablename__: str = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_status_id", "status", "id"),
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False, unique=True)
     description = Column(String, nullable=True)
     status = Column(SqlEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = Column(DateTime, default=None, onupdate=func.now())
+    updated_at = Column(DateTime, default=None, onupdate=lambda: datetime.now(timezone.utc))
+    version = Column(Integer, nullable=False, server_default="1")
+
+    # Contador de versão do SQLAlchemy: o flush da unidade de trabalho inclui "AND version = :atual"
+    # e levanta StaleDataError em conflito; os UPDATEs por comando incrementam a coluna explicitamente.
+    __mapper_args__ = {"version_id_col": version}
 
     def normalize(self) -> Dict:
         return {
@@ -25,6 +36,31 @@ class Task(EntityMeta):
             "status": TaskStatus.from_value(self.status).value,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
+            "version": self.version,
         }
 
 
+# Ordenação e filtro por última alteração (updated_at fica nulo até a primeira atualização)
+Index("ix_tasks_modified_at_id", func.coalesce(Task.updated_at, Task.created_at), Task.id)
+
+
+# Colunas adicionadas a tasks depois da criação da tabela, com o DDL que as inclui em bancos existentes
+TASK_ADDED_COLUMNS = {
+    "version": "ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 1",
+}
+
+
+@event.listens_for(EntityMeta.metadata, "after_create")
+def add_missing_task_columns(target, connection, **kw):
+    """Adiciona em bancos existentes as colunas de tasks que a tabela ainda não tem (com valor padrão)."""
+    existing = {column["name"] for column in inspect(connection).get_columns(Task.__tablename__)}
+    for column, statement in TASK_ADDED_COLUMNS.items():
+        if column not in existing:
+            connection.execute(DDL(statement))
+
+
+@event.listens_for(EntityMeta.metadata, "after_create")
+def create_missing_task_indexes(target, connection, **kw):
+    """Cria em bancos existentes os índices de tasks adicionados depois da criação da tabela."""
+    for index in Task.__table__.indexes:
+        connection.execute(CreateIndex(index, if_not_exists=True))
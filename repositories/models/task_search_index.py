@@ -0,0 +1,68 @@
+from sqlalchemy import Column, DDL, Integer, column, event, table, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from repositories.models import EntityMeta
+
+# Tabela FTS5 (SQLite) com conteúdo externo: indexa title e description de tasks pelo rowid (= tasks.id)
+tasks_fts = table("tasks_fts", column("rowid", Integer))
+
+# Coluna tsvector gerada (PostgreSQL); não é mapeada em Task porque só existe nesse dialeto
+search_vector = Column("search_vector", TSVECTOR)
+
+SQLITE_SEARCH_INDEX = (
+    """
+    CREATE VIRTUAL TABLE tasks_fts USING fts5(title, description, content='tasks', content_rowid='id')
+    """,
+    """
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', OLD.id, OLD.title, OLD.description);
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+    END
+    """,
+    "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')",
+)
+
+POSTGRESQL_SEARCH_INDEX = (
+    """
+    ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_tasks_search_vector ON tasks USING GIN (search_vector)",
+)
+
+SEARCH_INDEX_EXISTS = {
+    "sqlite": "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'",
+    "postgresql": (
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'tasks' AND column_name = 'search_vector'"
+    ),
+}
+
+
+@event.listens_for(EntityMeta.metadata, "after_create")
+def create_search_index(target, connection, **kw):
+    """
+    Cria o índice de busca textual (e o preenche com as tarefas existentes) se ele ainda não existir:
+    FTS5 mantida por triggers no SQLite, coluna tsvector gerada com índice GIN no PostgreSQL.
+    """
+    dialect = connection.dialect.name
+    if dialect not in SEARCH_INDEX_EXISTS or connection.scalar(text(SEARCH_INDEX_EXISTS[dialect])):
+        return
+
+    statements = SQLITE_SEARCH_INDEX if dialect == "sqlite" else POSTGRESQL_SEARCH_INDEX
+    for statement in statements:
+        connection.execute(DDL(statement))
@@ -0,0 +1,80 @@
+from sqlalchemy import Column, DDL, Enum as SqlEnum, Integer, event
+
+from repositories.models import EntityMeta
+from schemas.enums import TaskStatus
+
+
+class TaskStatusCount(EntityMeta):
+    """
+    Quantidade de tarefas por status, mantida por triggers na tabela tasks a cada INSERT,
+    DELETE e mudança de status. Permite contar as tarefas sem um COUNT(*) sobre a tabela.
+    """
+    __tablename__: str = "task_status_counts"
+
+    status = Column(SqlEnum(TaskStatus), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_count_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO task_status_counts (status, count) VALUES (NEW.status, 1)
+        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_count_delete AFTER DELETE ON tasks BEGIN
+        UPDATE task_status_counts SET count = count - 1 WHERE status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_count_update AFTER UPDATE OF status ON tasks
+    WHEN OLD.status <> NEW.status BEGIN
+        UPDATE task_status_counts SET count = count - 1 WHERE status = OLD.status;
+        INSERT INTO task_status_counts (status, count) VALUES (NEW.status, 1)
+        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+    END
+    """,
+)
+
+POSTGRESQL_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION tasks_count_trigger() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            UPDATE task_status_counts SET count = count - 1 WHERE status = OLD.status;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO task_status_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT (status) DO UPDATE SET count = task_status_counts.count + 1;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER tasks_count_insert_delete AFTER INSERT OR DELETE ON tasks
+    FOR EACH ROW EXECUTE FUNCTION tasks_count_trigger()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER tasks_count_update AFTER UPDATE OF status ON tasks
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status) EXECUTE FUNCTION tasks_count_trigger()
+    """,
+)
+
+# Preenche os contadores com as tarefas já existentes quando a tabela é criada num banco em uso
+BACKFILL = """
+    INSERT INTO task_status_counts (status, count)
+    SELECT status, COUNT(*) FROM tasks GROUP BY status
+"""
+
+
+@event.listens_for(EntityMeta.metadata, "after_create")
+def create_count_triggers(target, connection, tables=(), **kw):
+    """Cria os triggers dos contadores depois que as tabelas tasks e task_status_counts existem."""
+    if TaskStatusCount.__table__ not in tables:
+        return
+
+    statements = SQLITE_TRIGGERS if connection.dialect.name == "sqlite" else POSTGRESQL_TRIGGERS
+    for statement in (BACKFILL, *statements):
+        connection.execute(DDL(statement))
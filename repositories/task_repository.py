@@ -1,12 +1,29 @@
-from typing import List, Optional, Union
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from fastapi import Depends
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 from configs.database import get_db_connection
 from repositories.models import Task
 from repositories.base_repository import BaseRepository
-from schemas.enums import TaskStatus
+from repositories.helpers.pagination import CursorKey, SearchCursorKey
+from repositories.helpers.task_queries import (
+    ESTIMATED_COUNT_QUERY,
+    _as_stored_datetime,
+    export_tasks_query,
+    filtered_count_query,
+    get_task_query,
+    get_tasks_query,
+    list_tasks_query,
+    search_tasks_query,
+    search_terms,
+    status_counts_query,
+    task_columns,
+    total_count_query,
+)
+from schemas.enums import SortOrder, TaskSort, TaskStatus
 
 
 class TaskRepository(BaseRepository[Task, int]):
@@ -17,31 +34,166 @@ class TaskRepository(BaseRepository[Task, int]):
         """Adiciona uma nova tarefa usando o método add do repositório base."""
         return self.add(entity)
 
-    def delete(self, entity_id: int) -> bool:
+    def create_many(self, rows: List[Dict[str, Any]]) -> List[Task]:
+        """Adiciona várias tarefas em uma única transação usando add_many."""
+        return self.add_many(Task, rows)
+
+    def delete(self, entity_id: int, expected: Optional[Dict[str, Any]] = None) -> bool:
         """Exclui uma tarefa pelo ID usando delete_entity."""
-        return self.delete_entity(entity_id, Task)
+        return self.delete_entity(entity_id, Task, expected)
+
+    def count(
+            self,
+            status: Optional[TaskStatus] = None,
+            estimate: bool = False,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> int:
+        """
+        Conta as tarefas pelos contadores por status. Com `estimate`, no PostgreSQL e sem filtro,
+        usa a estimativa de pg_class.reltuples (sem ler os contadores, que concentram escritas).
+        Com filtros de data, que os contadores não cobrem, faz um COUNT(*) com os filtros da listagem.
+        """
+        if created_after is not None or updated_after is not None:
+            return self.db.scalar(filtered_count_query(status, created_after, updated_after))
+        if estimate and status is None and self.db.get_bind().dialect.name == "postgresql":
+            estimated = self.db.scalar(ESTIMATED_COUNT_QUERY)
+            if estimated is not None and estimated >= 0:
+                return estimated
+        return self.db.scalar(total_count_query(status))
+
+    def count_by_status(self) -> Dict[TaskStatus, int]:
+        """Retorna a quantidade de tarefas de cada status, incluindo os status sem tarefas."""
+        counts = dict.fromkeys(TaskStatus, 0)
+        counts.update(self.db.execute(status_counts_query()).tuples().all())
+        return counts
 
     def get(self, entity_id: int) -> Optional[Task]:
         """Recupera uma tarefa pelo ID."""
         return self.db.query(Task).filter(Task.id == entity_id).first()
 
-    def list(self, limit: int = 10, offset: int = 0, status: Optional[TaskStatus] = None) -> Union[List[Task], list]:
-        """Lista tarefas com suporte a paginação e filtro opcional por status."""
-        query = self.db.query(Task)
+    def get_row(self, entity_id: int, fields: Sequence[str]) -> Optional[Row]:
+        """Recupera uma tarefa pelo ID como linha Row, lendo apenas as colunas de `fields`."""
+        return self.db.execute(get_task_query(entity_id, fields)).first()
 
-        if status:
-            query = query.filter(Task.status == status)
+    def get_rows(self, entity_ids: Sequence[int], fields: Optional[Sequence[str]] = None) -> Sequence[Row]:
+        """Recupera várias tarefas pelo ID com uma única consulta; a ordem das linhas não é garantida."""
+        return self.db.execute(get_tasks_query(entity_ids, fields)).all()
+
+    def list(
+            self,
+            limit: int = 10,
+            offset: int = 0,
+            status: Optional[TaskStatus] = None,
+            after: Optional[CursorKey] = None,
+            sort: TaskSort = TaskSort.CREATED_AT,
+            order: SortOrder = SortOrder.ASC,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> Union[List[Task], list]:
+        """
+        Lista tarefas com paginação por offset ou por cursor (keyset), ordenação por `sort`/`order`
+        e filtros opcionais por status e por data de criação/alteração.
+        """
+        return self.db.scalars(list_tasks_query(
+            limit=limit, offset=offset, status=status, after=after, sort=sort, order=order,
+            created_after=created_after, updated_after=updated_after,
+        )).all()
+
+    def list_rows(
+            self,
+            limit: int = 10,
+            offset: int = 0,
+            status: Optional[TaskStatus] = None,
+            after: Optional[CursorKey] = None,
+            fields: Optional[Sequence[str]] = None,
+            sort: TaskSort = TaskSort.CREATED_AT,
+            order: SortOrder = SortOrder.ASC,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> Sequence[Row]:
+        """
+        Lista tarefas como linhas Row (apenas as colunas da resposta), sem montar entidades ORM.
+        Com `fields`, o SELECT lê somente as colunas desses campos.
+        """
+        return self.db.execute(
+            list_tasks_query(
+                limit=limit, offset=offset, status=status, after=after, columns=task_columns(fields),
+                sort=sort, order=order, created_after=created_after, updated_after=updated_after,
+            )
+        ).all()
 
-        return query.offset(offset).limit(limit).all()
+    def search_rows(
+            self,
+            query: str,
+            limit: int = 10,
+            after: Optional[SearchCursorKey] = None,
+    ) -> Sequence[Row]:
+        """
+        Busca tarefas pelo índice de texto completo, ordenadas por relevância (coluna `score`).
+        Uma busca sem nenhuma palavra retorna uma lista vazia.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+        dialect = self.db.get_bind().dialect.name
+        return self.db.execute(search_tasks_query(terms, dialect, limit=limit, after=after)).all()
 
-    def update(self, entity_id: int, entity: Task) -> Optional[Task]:
-        """Atualiza uma tarefa específica pelo ID usando update_entity e copy_attributes."""
-        task = self.get(entity_id)
-        if task:
-            self.copy_attributes(task, entity)
-            return self.update_entity(task)
-        return None
+    def stream_rows(self, status: Optional[TaskStatus] = None, chunk_size: int = 1000) -> Iterator[Sequence[Row]]:
+        """
+        Percorre as tarefas em blocos de `chunk_size` linhas usando cursor no servidor (yield_per),
+        mantendo a memória constante. Como o gerador é consumido depois que a dependência da
+        requisição já encerrou a sessão, ele a reabre e a fecha ao terminar.
+        """
+        try:
+            result = self.db.execute(export_tasks_query(status), execution_options={"yield_per": chunk_size})
+            yield from result.partitions()
+        finally:
+            self.db.close()
+
+    def update(
+            self, entity_id: int, values: Dict[str, Any], expected: Optional[Dict[str, Any]] = None
+    ) -> Optional[Task]:
+        """Atualiza uma tarefa pelo ID com um único UPDATE ... RETURNING; retorna None se ela não existir."""
+        return self.update_by_id(Task, entity_id, values, expected)
+
+    def update_many(
+            self,
+            values: Dict[str, Any],
+            ids: Optional[List[int]] = None,
+            status: Optional[TaskStatus] = None,
+    ) -> Tuple[int, Optional[List[int]]]:
+        """Atualiza em um único UPDATE as tarefas selecionadas por lista de IDs e/ou status."""
+        criteria = []
+        if ids is not None:
+            criteria.append(Task.id.in_(ids))
+        if status:
+            criteria.append(Task.status == status)
+        return super().update_many(Task, criteria, values)
+
+    def delete_many(
+            self,
+            ids: Optional[List[int]] = None,
+            status: Optional[TaskStatus] = None,
+            created_before: Optional[datetime] = None,
+            chunk_size: int = 1000,
+    ) -> int:
+        """Exclui em lotes as tarefas selecionadas por lista de IDs, status e/ou data de criação."""
+        criteria = []
+        if ids is not None:
+            criteria.append(Task.id.in_(ids))
+        if status:
+            criteria.append(Task.status == status)
+        if created_before:
+            criteria.append(Task.created_at < _as_stored_datetime(created_before))
+        return super().delete_many(Task, criteria, chunk_size=chunk_size)
 
     def get_by_title(self, title: str) -> Optional[Task]:
         """Busca uma tarefa pelo título."""
         return self.db.query(Task).filter(Task.title == title).first()
+
+    def get_existing_titles(self, titles: List[str]) -> Set[str]:
+        """Retorna, com uma única consulta IN, os títulos informados que já existem."""
+        if not titles:
+            return set()
+        return set(self.db.scalars(select(Task.title).where(Task.title.in_(titles))).all())
@@ -0,0 +1,22 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from configs.cache import get_cache
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/stats")
+def cache_stats() -> Dict[str, Any]:
+    """
+    Retorna os contadores do cache de leitura de tarefas.
+
+    **Campos**:
+    - **backend**: Implementação em uso (`InMemoryCache`, `RedisCache` ou `NullCache`).
+    - **hits / misses**: Leituras atendidas pelo cache e leituras que foram ao banco.
+    - **evictions**: Entradas removidas por limite de tamanho ou expiração do TTL.
+    - **hit_ratio**: Proporção de acertos sobre o total de leituras.
+    - **size / max_size / ttl**: Estado e limites do cache (quando aplicável).
+    """
+    return get_cache().stats()
@@ -0,0 +1,24 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from configs.database import get_pool_stats
+
+router = APIRouter(prefix="/database", tags=["database"])
+
+
+@router.get("/pool")
+def pool_stats() -> Dict[str, Any]:
+    """
+    Retorna as estatísticas do pool de conexões do banco.
+
+    **Campos**:
+    - **checkouts / checkins**: Total de conexões retiradas e devolvidas ao pool.
+    - **connections_created**: Conexões físicas abertas desde o início do processo.
+    - **timeouts**: Checkouts que excederam `DATABASE_POOL_TIMEOUT`.
+    - **wait_time_total / wait_time_avg / wait_time_max**: Tempo de espera por conexão, em segundos.
+    - **size / checked_in / checked_out / overflow**: Estado atual do pool (quando aplicável).
+    - **async**: As mesmas estatísticas para o engine assíncrono, quando `ASYNC_MODE` está ativo.
+    - **replicas**: URL e disponibilidade de cada réplica de leitura, quando configuradas.
+    """
+    return get_pool_stats()
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Response
+
+from configs.metrics import PROMETHEUS_CONTENT_TYPE, metrics_registry
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=Response)
+def metrics():
+    """
+    Retorna as métricas das requisições no formato texto do Prometheus.
+
+    **Métricas** (por método e rota):
+    - **http_requests_total**: Requisições atendidas, também por status.
+    - **http_request_duration_seconds**: Histograma de latência.
+    - **http_request_db_queries_total / http_request_db_seconds_total**: Consultas e tempo gasto no banco.
+    - **http_request_db_rows_total**: Linhas retornadas ou afetadas, conforme informado pelo driver.
+    - **http_request_serialization_seconds_total**: Tempo gasto serializando as respostas.
+
+    Divida os totais por `http_requests_total` para obter as médias por requisição.
+    """
+    return Response(content=metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Request, status
+
+from schemas.enums import FileFormat, TaskStatus
+from schemas.task_schema import (
+    TaskBulkCreateResultSchema,
+    TaskBulkDeleteResultSchema,
+    TaskBulkUpdateResultSchema,
+    TaskBulkUpdateSchema,
+    TaskCreateSchema,
+    TaskImportResultSchema,
+)
+from services.task_service import TaskService
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkCreateResultSchema,
+    status_code=status.HTTP_200_OK,
+)
+def add_many(tasks: List[TaskCreateSchema], service: TaskService = Depends()):
+    """
+    Cria várias tarefas em uma única transação.
+
+    **Corpo**: Lista de tarefas com os mesmos campos de `POST /tasks/`.
+
+    Títulos já cadastrados ou repetidos na própria requisição são rejeitados
+    individualmente; as demais tarefas são criadas. A resposta informa o resultado
+    de cada item, na mesma ordem da requisição.
+    """
+    return service.create_tasks(tasks)
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportResultSchema,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_tasks(request: Request, format: FileFormat = FileFormat.NDJSON, service: TaskService = Depends()):
+    """
+    Importa tarefas de um arquivo NDJSON ou CSV enviado no corpo da requisição.
+
+    **Parâmetros**:
+    - **format (str)**: Formato do arquivo: `ndjson` (padrão, um objeto por linha) ou `csv` (com cabeçalho).
+
+    O corpo é lido em streaming e as tarefas são gravadas em blocos de `BULK_CHUNK_SIZE`,
+    uma transação por bloco. Cada registro segue os campos de `POST /tasks/`; colunas extras
+    (como as da exportação) são ignoradas. A resposta resume o processamento e lista os
+    registros rejeitados com a linha e o motivo.
+    """
+    return await service.import_tasks(request.stream(), format)
+
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkUpdateResultSchema,
+)
+def update_many(bulk_data: TaskBulkUpdateSchema, service: TaskService = Depends()):
+    """
+    Atualiza várias tarefas com um único comando UPDATE.
+
+    **Campos esperados**:
+    - **ids (list[int])**: IDs das tarefas a atualizar. **Opcional**.
+    - **status (str)**: Atualiza apenas as tarefas com este status. **Opcional**.
+        - **Nota**: Informe `ids`, `status` ou ambos.
+    - **patch**: Campos a alterar em todas as tarefas selecionadas (`description` e/ou `status`).
+
+    **Retorno**: Quantidade de tarefas alteradas e, quando o banco suporta `RETURNING`, seus IDs.
+    """
+    return service.update_tasks(bulk_data)
+
+
+@router.delete(
+    "/",
+    response_model=TaskBulkDeleteResultSchema,
+)
+def delete_many(
+        ids: Optional[List[int]] = Query(None),
+        status: Optional[TaskStatus] = None,
+        created_before: Optional[datetime] = None,
+        service: TaskService = Depends()
+):
+    """
+    Exclui várias tarefas de uma vez, em lotes de `BULK_CHUNK_SIZE` linhas por transação.
+
+    **Parâmetros** (informe ao menos um; quando combinados, todos precisam ser atendidos):
+    - **ids (list[int])**: IDs das tarefas a excluir (ex.: `?ids=1&ids=2`).
+    - **status (str)**: Exclui apenas as tarefas com este status.
+    - **created_before (datetime)**: Exclui apenas as tarefas criadas antes desta data.
+
+    **Retorno**: Quantidade de tarefas excluídas.
+    """
+    return service.delete_tasks(ids=ids, status=status, created_before=created_before)
@@ -0,0 +1,50 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
+
+from configs.changes import get_change_broker
+from configs.environment import get_environment_variables
+from services.helpers.task_changes import TaskChangeBroker, sse_events
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+env = get_environment_variables()
+
+
+@router.get(
+    "/changes",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def changes(
+        after: Optional[int] = None,
+        last_event_id: Optional[str] = Header(None),
+        broker: TaskChangeBroker = Depends(get_change_broker),
+):
+    """
+    Stream (Server-Sent Events) das criações, alterações e exclusões de tarefas, para substituir
+    a consulta periódica de GET /tasks/.
+
+    **Parâmetros**:
+    - **after**: Retoma o stream a partir do evento seguinte a este `seq` (opcional).
+        - **Nota**: O cabeçalho `Last-Event-ID`, enviado pelo navegador ao reconectar, tem precedência.
+
+    Cada evento tem `id` (o `seq`), `event` (`created`, `updated` ou `deleted`) e `data` com o
+    evento em JSON. Alterações em lote por filtro chegam com `task_id` nulo. Se os eventos pedidos já
+    saíram do buffer (CHANGES_BUFFER_SIZE), o stream começa com um evento `reset` e a lista deve ser
+    recarregada. Um cliente que acumula mais de CHANGES_QUEUE_SIZE eventos pendentes é desconectado
+    e retoma do último `seq` recebido.
+    """
+    resume_from = last_event_id if last_event_id is not None else after
+    try:
+        resume_from = int(resume_from) if resume_from is not None else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Last-Event-ID must be an integer sequence number")
+
+    subscription = broker.subscribe(after=resume_from)
+    return StreamingResponse(
+        sse_events(subscription, heartbeat=env.CHANGES_HEARTBEAT),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from schemas.enums import FileFormat, TaskStatus
+from services.task_service import TaskService
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+MEDIA_TYPES = {
+    FileFormat.NDJSON: "application/x-ndjson",
+    FileFormat.CSV: "text/csv",
+}
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in MEDIA_TYPES.values()}}},
+)
+def export(
+        format: FileFormat = FileFormat.NDJSON,
+        status: Optional[TaskStatus] = None,
+        service: TaskService = Depends()
+):
+    """
+    Exporta todas as tarefas em streaming, bloco a bloco, com uso de memória constante.
+
+    **Parâmetros**:
+    - **format (str)**: Formato da exportação: `ndjson` (padrão) ou `csv`.
+    - **status (str)**: Filtra tarefas por status (opcional).
+    """
+    return StreamingResponse(
+        service.export_tasks(format, status=status),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format.value}"'},
+    )
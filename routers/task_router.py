@@ -1,10 +1,20 @@
+from datetime import datetime
 from typing import List, Optional, Dict
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
+from starlette.status import HTTP_304_NOT_MODIFIED
 
-from schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskSchema
+from configs.metrics import track_serialization
+from schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskSchema, task_list_adapter
 from services.task_service import TaskService
-from schemas.enums import TaskStatus
+from schemas.enums import SortOrder, TaskSort, TaskStatus
+from services.helpers.conditional_requests import (
+    is_not_modified,
+    task_etag,
+    task_list_etag,
+    task_modified_at,
+    validator_headers,
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -38,6 +48,15 @@ def get_all(
         status: Optional[TaskStatus] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        fields: Optional[str] = None,
+        ids: Optional[str] = None,
+        sort: TaskSort = TaskSort.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+        created_after: Optional[datetime] = None,
+        updated_after: Optional[datetime] = None,
+        if_none_match: Optional[str] = Header(None),
         service: TaskService = Depends()
 ):
     """
@@ -50,29 +69,103 @@ def get_all(
         - `3`: completed
     - **limit**: Limita o número de tarefas retornadas (padrão: 50).
     - **offset**: Define o deslocamento inicial para paginação (padrão: 0).
+    - **cursor**: Cursor opaco retornado no cabeçalho `X-Next-Cursor` da página anterior (opcional).
+        - **Nota**: Quando informado, a página é buscada por keyset e `offset` é ignorado.
+    - **include_total**: Inclui o cabeçalho `X-Total-Count` com o total de tarefas do filtro (padrão: false).
+        - **Nota**: Sem `created_after`/`updated_after`, o total vem de contadores por status mantidos
+          pelo banco, sem `COUNT(*)`; com esses filtros, é um `COUNT(*)` com os mesmos filtros da listagem.
+    - **fields**: Campos retornados, separados por vírgula (ex.: `id,title,status`). Padrão: todos.
+        - **Nota**: Apenas as colunas necessárias são lidas do banco.
+    - **ids**: IDs separados por vírgula (ex.: `1,2,3`) para buscar várias tarefas de uma vez.
+        - **Nota**: As tarefas vêm na ordem dos IDs, com uma única consulta; os IDs inexistentes
+          são informados no cabeçalho `X-Missing-Ids`. Os filtros e a paginação são ignorados.
+
+    - **sort**: Campo de ordenação: `id`, `created_at` (padrão), `updated_at` ou `title`.
+        - **Nota**: `updated_at` ordena pela última alteração (data de criação se a tarefa nunca foi alterada).
+    - **order**: Direção da ordenação: `asc` (padrão) ou `desc`.
+    - **created_after**: Retorna apenas tarefas criadas depois desta data (opcional).
+    - **updated_after**: Retorna apenas tarefas criadas ou alteradas depois desta data (opcional).
+        - **Nota**: Com `sort=updated_at` e o cursor, permite sincronizar só o que mudou desde a última leitura.
+
+    As tarefas são ordenadas pelo campo de `sort` e pelo ID. Enquanto houver próxima página,
+    a resposta inclui o cabeçalho `X-Next-Cursor`, válido apenas para a mesma ordenação.
+
+    A resposta traz `ETag`, derivada dos parâmetros e das tarefas da página; com `If-None-Match` ainda
+    válido, retorna `304 Not Modified` sem corpo. Não há `Last-Modified`: a data da última alteração das
+    tarefas da página não muda quando uma delas é excluída ou quando entra uma tarefa com data antiga.
     """
-    return service.list_tasks(status=status, limit=limit, offset=offset)
+    fields = service.parse_fields(fields)
+    headers = {}
+    if ids is not None:
+        task_ids = service.parse_ids(ids)
+        tasks, missing = service.get_tasks(task_ids, fields=fields)
+        if missing:
+            headers["X-Missing-Ids"] = ",".join(str(task_id) for task_id in missing)
+        etag = task_list_etag(tasks, task_ids, fields)
+    else:
+        tasks = service.list_tasks(
+            status=status, limit=limit, offset=offset, cursor=cursor, fields=fields,
+            sort=sort, order=order, created_after=created_after, updated_after=updated_after,
+        )
+        next_cursor = service.next_cursor(tasks, limit, sort, order)
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        if include_total:
+            headers["X-Total-Count"] = str(
+                service.count_tasks(status, created_after=created_after, updated_after=updated_after)
+            )
+        etag = task_list_etag(tasks, status, limit, offset, cursor, fields, sort, order, created_after, updated_after)
+
+    headers.update(validator_headers(etag))
+    if is_not_modified(etag, None, if_none_match, None):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    # A lista já foi validada pelo serviço: serializa direto para bytes, sem a revalidação do response_model
+    with track_serialization():
+        content = task_list_adapter(fields).dump_json(tasks)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.get(
     "/{task_id}",
     response_model=TaskSchema,
 )
-def get(task_id: int, service: TaskService = Depends()):
+def get(
+        task_id: int,
+        fields: Optional[str] = None,
+        if_none_match: Optional[str] = Header(None),
+        if_modified_since: Optional[str] = Header(None),
+        service: TaskService = Depends()
+):
     """
     Obtém os detalhes de uma tarefa específica.
 
     **Parâmetros**:
     - **task_id (int)**: O identificador único da tarefa.
+    - **fields**: Campos retornados, separados por vírgula (ex.: `id,title,status`). Padrão: todos.
+
+    A resposta traz `ETag` e `Last-Modified`; com `If-None-Match` ou `If-Modified-Since`
+    ainda válidos, retorna `304 Not Modified` sem serializar a tarefa.
     """
-    return service.get_task(task_id)
+    task = service.get_task(task_id, fields=service.parse_fields(fields))
+    headers = validator_headers(task_etag(task), task_modified_at(task))
+    if is_not_modified(headers["ETag"], task_modified_at(task), if_none_match, if_modified_since):
+        return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    with track_serialization():
+        content = task.model_dump_json()
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.patch(
     "/{task_id}",
     response_model=TaskSchema,
 )
-def update(task_id: int, task: TaskUpdateSchema, service: TaskService = Depends()):
+def update(
+        task_id: int,
+        task: TaskUpdateSchema,
+        response: Response,
+        if_match: Optional[str] = Header(None),
+        service: TaskService = Depends()
+):
     """
     Atualiza os detalhes de uma tarefa existente.
 
@@ -86,8 +179,15 @@ def update(task_id: int, task: TaskUpdateSchema, service: TaskService = Depends(
         - `1`: pending
         - `2`: in progress
         - `3`: completed
+    - **version (int)**: A versão lida da tarefa. **Opcional**.
+        - **Nota**: Se a tarefa já tiver sido alterada (versão diferente), retorna `409 Conflict`.
+
+    Com o cabeçalho `If-Match`, a tarefa só é alterada se a sua `ETag` atual estiver na lista;
+    caso contrário, retorna `412 Precondition Failed`.
     """
-    return service.update_task(task_id, task)
+    updated_task = service.update_task(task_id, task, if_match=if_match)
+    response.headers.update(validator_headers(task_etag(updated_task), task_modified_at(updated_task)))
+    return updated_task
 
 
 @router.delete(
@@ -95,11 +195,18 @@ def update(task_id: int, task: TaskUpdateSchema, service: TaskService = Depends(
     status_code=status.HTTP_200_OK,
     response_description="Mensagem sobre a exclusão da tarefa."
 )
-def delete(task_id: int, service: TaskService = Depends()) -> Dict[str, str | int]:
+def delete(
+        task_id: int,
+        if_match: Optional[str] = Header(None),
+        service: TaskService = Depends()
+) -> Dict[str, str | int]:
     """
     Exclui uma tarefa específica do sistema.
 
     **Parâmetros**:
     - **task_id (int)**: O identificador único da tarefa.
+
+    Com o cabeçalho `If-Match`, a tarefa só é excluída se a sua `ETag` atual estiver na lista;
+    caso contrário, retorna `412 Precondition Failed`.
     """
-    return service.delete_task(task_id)
+    return service.delete_task(task_id, if_match=if_match)
@@ -0,0 +1,41 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from configs.metrics import track_serialization
+from schemas.task_schema import TASK_SEARCH_ADAPTER, TaskSearchResultSchema
+from services.task_service import TaskService
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.get(
+    "/search",
+    response_model=List[TaskSearchResultSchema],
+)
+def search(
+        q: str = Query(..., min_length=1),
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        service: TaskService = Depends()
+):
+    """
+    Busca tarefas por texto no título e na descrição, usando um índice de texto completo
+    (FTS5 no SQLite, tsvector com índice GIN no PostgreSQL).
+
+    **Parâmetros**:
+    - **q (str)**: Palavras buscadas. Todas precisam aparecer, casando também como prefixo.
+    - **limit**: Limita o número de resultados retornados (padrão: 50).
+    - **cursor**: Cursor opaco retornado no cabeçalho `X-Next-Cursor` da página anterior (opcional).
+
+    Os resultados são ordenados por relevância (`score` crescente, com o título pesando mais
+    que a descrição). Enquanto houver próxima página, a resposta inclui o cabeçalho `X-Next-Cursor`.
+    """
+    results = service.search_tasks(q, limit=limit, cursor=cursor)
+    headers = {}
+    next_cursor = service.next_search_cursor(results, limit)
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    with track_serialization():
+        content = TASK_SEARCH_ADAPTER.dump_json(results)
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+
+from schemas.task_schema import TaskStatsSchema
+from services.task_service import TaskService
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStatsSchema,
+)
+def get_stats(service: TaskService = Depends()):
+    """
+    Retorna a quantidade de tarefas, no total e por status.
+
+    Os valores vêm de contadores por status mantidos pelo banco a cada criação, mudança de
+    status e exclusão, então a consulta não percorre a tabela de tarefas.
+    """
+    return service.get_stats()
@@ -12,3 +12,26 @@ class TaskStatus(Enum):
             mapping = {1: "PENDING", 2: "IN_PROGRESS", 3: "COMPLETED"}
             return TaskStatus(mapping[value])
         return TaskStatus(value)
+
+
+class TaskSort(Enum):
+    ID = "id"
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    TITLE = "title"
+
+
+class SortOrder(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class TaskChangeType(Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+class FileFormat(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
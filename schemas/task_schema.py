@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, create_model, model_validator
 
-from schemas.enums import TaskStatus
+from schemas.enums import TaskChangeType, TaskStatus
 from pydantic import ConfigDict
 
 
@@ -18,10 +19,135 @@ class TaskUpdateSchema(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
+    version: Optional[int] = Field(
+        None, description="Versão lida da tarefa; se ela tiver mudado, a atualização retorna 409."
+    )
 
 
 class TaskSchema(TaskCreateSchema):
     id: int
     updated_at: Optional[datetime] = None
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TaskSearchResultSchema(TaskSchema):
+    score: float = Field(..., description="Relevância invertida: quanto menor, mais relevante.")
+
+
+# Validador/serializador de listas reutilizado entre requisições (validação única + JSON em bytes)
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskSchema])
+
+TASK_FIELDS = tuple(TaskSchema.model_fields)
+
+# Campos sempre lidos numa projeção (cursor de qualquer ordenação, ETag e Last-Modified), mesmo quando não pedidos
+TASK_KEY_FIELDS = ("id", "title", "created_at", "updated_at", "version")
+
+
+def parse_task_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Converte `?fields=id,title` em uma tupla de campos de TaskSchema, na ordem do schema.
+    Retorna None quando nenhum campo é informado e lança ValueError para campos desconhecidos.
+    """
+    names = {name.strip() for name in (value or "").split(",") if name.strip()}
+    if not names:
+        return None
+    unknown = names.difference(TASK_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(TASK_FIELDS)}.")
+    return tuple(name for name in TASK_FIELDS if name in names)
+
+
+@lru_cache
+def task_fields_schema(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Modelo de resposta dinâmico com apenas os campos pedidos. Os campos de TASK_KEY_FIELDS não pedidos
+    também são lidos, mas ficam fora da serialização. `model_fields` lista as colunas a selecionar.
+    """
+    definitions = {}
+    for name, field in TaskSchema.model_fields.items():
+        if name in fields:
+            definitions[name] = (field.annotation, field)
+        elif name in TASK_KEY_FIELDS:
+            definitions[name] = (field.annotation, Field(None, exclude=True))
+    return create_model("TaskFieldsSchema", __config__=ConfigDict(from_attributes=True), **definitions)
+
+
+@lru_cache
+def task_list_adapter(fields: Optional[Tuple[str, ...]] = None) -> TypeAdapter:
+    """Adaptador de listas para a projeção `fields` (TASK_LIST_ADAPTER quando não há projeção)."""
+    return TypeAdapter(List[task_fields_schema(fields)]) if fields else TASK_LIST_ADAPTER
+
+
+TASK_SEARCH_ADAPTER = TypeAdapter(List[TaskSearchResultSchema])
+
+
+class TaskBulkItemResultSchema(BaseModel):
+    index: int = Field(..., description="Posição do item na requisição.")
+    success: bool
+    task: Optional[TaskSchema] = None
+    detail: Optional[str] = None
+
+
+class TaskBulkCreateResultSchema(BaseModel):
+    created: int
+    failed: int
+    results: List[TaskBulkItemResultSchema]
+
+
+class TaskBulkPatchSchema(BaseModel):
+    description: Optional[str] = None
+    status: Optional[TaskStatus] = None
+
+
+class TaskBulkUpdateSchema(BaseModel):
+    ids: Optional[List[int]] = Field(None, description="IDs das tarefas a atualizar.")
+    status: Optional[TaskStatus] = Field(None, description="Atualiza apenas tarefas com este status.")
+    patch: TaskBulkPatchSchema
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if self.ids is None and self.status is None:
+            raise ValueError("Provide 'ids' and/or 'status' to select the tasks to update.")
+        return self
+
+
+class TaskBulkUpdateResultSchema(BaseModel):
+    updated: int
+    ids: Optional[List[int]] = Field(None, description="IDs alterados, quando o banco suporta RETURNING.")
+
+
+class TaskBulkDeleteResultSchema(BaseModel):
+    deleted: int
+
+
+class TaskImportErrorSchema(BaseModel):
+    line: int = Field(..., description="Linha do arquivo em que o registro começa.")
+    detail: str
+
+
+class TaskImportResultSchema(BaseModel):
+    processed: int
+    created: int
+    rejected: int
+    errors: List[TaskImportErrorSchema] = Field(
+        ..., description="Registros rejeitados (limitado a BULK_MAX_ITEMS entradas)."
+    )
+
+
+class TaskStatsSchema(BaseModel):
+    total: int
+    by_status: Dict[TaskStatus, int]
+
+
+class TaskChangeSchema(BaseModel):
+    seq: int = Field(..., description="Número de sequência do evento, usado para retomar o stream.")
+    type: TaskChangeType
+    task_id: Optional[int] = Field(
+        None, description="Tarefa alterada; nulo em alterações em lote por filtro (recarregue a lista)."
+    )
+    task: Optional[TaskSchema] = Field(
+        None, description="Tarefa após a alteração (apenas em alterações unitárias)."
+    )
+    at: datetime
@@ -0,0 +1,203 @@
+from datetime import datetime
+from typing import Any, List, Optional, Dict, Tuple
+
+from fastapi import Depends, HTTPException
+
+from configs.cache import get_cache
+from configs.changes import get_change_broker
+from configs.environment import get_environment_variables
+from repositories.cache import Cache
+from repositories.helpers.db_operations import RepositoryIntegrityException
+from repositories.helpers.pagination import decode_cursor, next_page_cursor
+from repositories.helpers.task_queries import task_sort_key, task_sort_value
+from repositories.models import Task
+from repositories.async_task_repository import AsyncTaskRepository
+from schemas.task_schema import (
+    TaskCreateSchema,
+    TaskSchema,
+    TaskUpdateSchema,
+    task_fields_schema,
+    task_list_adapter,
+)
+from schemas.enums import TaskChangeType, SortOrder, TaskSort, TaskStatus
+from services.helpers.task_changes import TaskChangeBroker
+from services.helpers.conditional_requests import etag_matches, task_etag
+from services.helpers.task_params import parse_fields, parse_ids
+from services.helpers.task_cache import task_cache_key
+
+env = get_environment_variables()
+
+
+class AsyncTaskService:
+    def __init__(
+            self,
+            repository: AsyncTaskRepository = Depends(),
+            cache: Cache = Depends(get_cache),
+            changes: TaskChangeBroker = Depends(get_change_broker),
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.changes = changes
+
+    async def create_task(self, task_data: TaskCreateSchema) -> TaskSchema:
+        task = Task(**task_data.model_dump(exclude_unset=True, exclude_none=True))
+        try:
+            await self.repository.create(task)
+        except RepositoryIntegrityException:
+            raise HTTPException(
+                status_code=400,
+                detail=f"A task with title '{task_data.title}' already exists."
+            )
+        self.changes.publish(TaskChangeType.CREATED, task.id, TaskSchema.model_validate(task))
+        return task
+
+    parse_fields = staticmethod(parse_fields)
+
+    parse_ids = staticmethod(parse_ids)
+
+    async def get_tasks(
+            self, task_ids: List[int], fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[TaskSchema], List[int]]:
+        """
+        Busca várias tarefas com uma única consulta. Retorna as encontradas na ordem de `task_ids`
+        e a lista de IDs inexistentes.
+        """
+        columns = tuple(task_fields_schema(fields).model_fields) if fields else None
+        rows = {row.id: row for row in await self.repository.get_rows(task_ids, fields=columns)}
+        found = [rows[task_id] for task_id in task_ids if task_id in rows]
+        missing = [task_id for task_id in task_ids if task_id not in rows]
+        return task_list_adapter(fields).validate_python(found, from_attributes=True), missing
+
+    async def get_task(self, task_id: int, fields: Optional[Tuple[str, ...]] = None) -> TaskSchema:
+        key = task_cache_key(task_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            task_schema = TaskSchema.model_validate_json(cached)
+            return task_fields_schema(fields).model_validate(task_schema) if fields else task_schema
+
+        if fields:
+            # Projeção: lê só as colunas pedidas (e as de TASK_KEY_FIELDS), sem passar pelo cache
+            fields_schema = task_fields_schema(fields)
+            row = await self.repository.get_row(task_id, tuple(fields_schema.model_fields))
+            if not row:
+                raise HTTPException(status_code=404, detail="Task not found")
+            return fields_schema.model_validate(row)
+
+        task = await self.repository.get(task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        task_schema = TaskSchema.model_validate(task.normalize())
+        # Só o primário preenche o cache: uma réplica atrasada gravaria nele a versão anterior a uma
+        # escrita recente, servida depois até ao próprio autor da escrita, por todo o CACHE_TTL
+        if not self.repository.reads_from_replica:
+            self.cache.set(key, task_schema.model_dump_json().encode())
+        return task_schema
+
+    async def list_tasks(
+            self,
+            status: Optional[TaskStatus] = None,
+            limit: int = 100,
+            offset: int = 0,
+            cursor: Optional[str] = None,
+            fields: Optional[Tuple[str, ...]] = None,
+            sort: TaskSort = TaskSort.CREATED_AT,
+            order: SortOrder = SortOrder.ASC,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> List[TaskSchema]:
+        try:
+            after = decode_cursor(cursor, task_sort_key(sort, order)) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        columns = tuple(task_fields_schema(fields).model_fields) if fields else None
+        rows = await self.repository.list_rows(
+            status=status, limit=limit, offset=offset, after=after, fields=columns,
+            sort=sort, order=order, created_after=created_after, updated_after=updated_after,
+        )
+        return task_list_adapter(fields).validate_python(rows, from_attributes=True)
+
+    async def count_tasks(
+            self,
+            status: Optional[TaskStatus] = None,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> int:
+        return await self.repository.count(
+            status=status,
+            estimate=env.TASK_COUNT_SOURCE == "estimate",
+            created_after=created_after,
+            updated_after=updated_after,
+        )
+
+    @staticmethod
+    def next_cursor(
+            tasks: List[TaskSchema], limit: int, sort: TaskSort = TaskSort.CREATED_AT, order: SortOrder = SortOrder.ASC
+    ) -> Optional[str]:
+        return next_page_cursor(
+            tasks, limit, key=lambda task: task_sort_value(task, sort), sort=task_sort_key(sort, order)
+        )
+
+    async def update_task(
+            self, task_id: int, task_data: TaskUpdateSchema, if_match: Optional[str] = None
+    ) -> TaskSchema:
+        updated_data = task_data.model_dump(exclude_unset=True)
+        expected_version = updated_data.pop("version", None)
+        if not updated_data:
+            raise HTTPException(status_code=400, detail="No fields to update provided")
+        if any(updated_data.get(field, "") is None for field in ("title", "status")):
+            raise HTTPException(status_code=400, detail="Title and status cannot be null")
+
+        expected = await self._check_if_match(task_id, if_match)
+        if expected_version is not None:
+            expected = {**(expected or {}), "version": expected_version}
+        try:
+            task = await self.repository.update(task_id, updated_data, expected)
+        except RepositoryIntegrityException:
+            raise HTTPException(
+                status_code=400,
+                detail=f"A task with title '{task_data.title}' already exists."
+            )
+
+        if not task:
+            current = await self.repository.get(task_id) if expected_version is not None else None
+            if current is not None:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Task was modified concurrently: expected version {expected_version}, "
+                           f"current version is {current.version}."
+                )
+            self._raise_not_found_or_precondition_failed(if_match)
+        self.cache.delete(task_cache_key(task_id))
+        self.changes.publish(TaskChangeType.UPDATED, task_id, TaskSchema.model_validate(task))
+        return task
+
+    async def delete_task(self, task_id: int, if_match: Optional[str] = None) -> Dict[str, str | int]:
+        expected = await self._check_if_match(task_id, if_match)
+        if not await self.repository.delete(task_id, expected):
+            if if_match is None:
+                raise HTTPException(status_code=404, detail=f"Task with id {task_id} not found")
+            self._raise_not_found_or_precondition_failed(if_match)
+        self.cache.delete(task_cache_key(task_id))
+        self.changes.publish(TaskChangeType.DELETED, task_id)
+
+        return {"message": f"Tarefa com ID {task_id} foi excluída com sucesso.", "task_id": task_id}
+
+    async def _check_if_match(self, task_id: int, if_match: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Avalia o cabeçalho If-Match contra a ETag atual da tarefa (412 se não coincidir) e retorna
+        a versão lida, usada como condição da escrita para que ela só ocorra se a tarefa não mudar
+        entre a verificação e o UPDATE/DELETE.
+        """
+        if if_match is None:
+            return None
+        task = await self.repository.get(task_id)
+        if not task or not etag_matches(if_match, task_etag(task), weak=False):
+            self._raise_not_found_or_precondition_failed(if_match)
+        return {"version": task.version}
+
+    @staticmethod
+    def _raise_not_found_or_precondition_failed(if_match: Optional[str]):
+        if if_match is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        raise HTTPException(status_code=412, detail="The task was modified or deleted (If-Match failed)")
@@ -0,0 +1,76 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def task_modified_at(task: Any) -> datetime:
+    """Data da última alteração da tarefa: `updated_at` ou, se ela nunca foi alterada, `created_at`."""
+    return _as_utc(task.updated_at or task.created_at)
+
+
+def task_etag(task: Any) -> str:
+    """ETag de uma tarefa, derivada do ID e da versão (incrementada a cada alteração)."""
+    return f'"{task.id}-{task.version}"'
+
+
+def task_list_etag(tasks: Iterable[Any], *params: Any) -> str:
+    """
+    ETag de uma página de tarefas, derivada dos parâmetros da consulta (filtro, paginação e cursor)
+    e do ID e da versão de cada tarefa, sem serializar o corpo da resposta.
+    """
+    digest = hashlib.blake2b(repr(params).encode(), digest_size=16)
+    for task in tasks:
+        digest.update(task_etag(task).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def validator_headers(etag: str, modified_at: Optional[datetime] = None) -> Dict[str, str]:
+    """Cabeçalhos ETag e Last-Modified de uma resposta."""
+    headers = {"ETag": etag}
+    if modified_at is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(modified_at), usegmt=True)
+    return headers
+
+
+def etag_matches(header: Optional[str], etag: str, weak: bool = True) -> bool:
+    """
+    Verifica se a lista de ETags de um cabeçalho If-Match/If-None-Match contém `etag` (ou `*`).
+    Com `weak=False` (If-Match), ETags fracas (`W/`) nunca coincidem.
+    """
+    if not header:
+        return False
+    for candidate in (value.strip() for value in header.split(",")):
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def is_not_modified(
+        etag: str,
+        modified_at: Optional[datetime],
+        if_none_match: Optional[str],
+        if_modified_since: Optional[str],
+) -> bool:
+    """
+    Avalia If-None-Match e, na sua ausência, If-Modified-Since (RFC 9110) para responder 304.
+    """
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if if_modified_since is None or modified_at is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(modified_at).replace(microsecond=0) <= _as_utc(since)
@@ -0,0 +1,10 @@
+from typing import Iterable, List
+
+
+def task_cache_key(task_id: int) -> str:
+    """Chave de uma tarefa no cache de leitura."""
+    return f"task:{task_id}"
+
+
+def task_cache_keys(task_ids: Iterable[int]) -> List[str]:
+    return [task_cache_key(task_id) for task_id in task_ids]
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import AsyncIterator, Deque, Optional, Set
+
+from schemas.enums import TaskChangeType
+from schemas.task_schema import TaskChangeSchema, TaskSchema
+
+# Sentinela que encerra a assinatura (assinante desconectado por excesso de eventos pendentes)
+_CLOSED = None
+
+
+class TaskChangeSubscription:
+    """
+    Assinatura de um cliente no TaskChangeBroker: primeiro entrega os eventos guardados desde `after`,
+    depois os novos, por uma fila limitada no event loop do assinante.
+    """
+
+    def __init__(self, broker: "TaskChangeBroker", loop: asyncio.AbstractEventLoop, queue_size: int):
+        self.broker = broker
+        self.loop = loop
+        self.backlog: Deque[TaskChangeSchema] = deque()
+        self.reset_seq: Optional[int] = None
+        self.overflowed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def notify(self, change: TaskChangeSchema) -> None:
+        """Encaminha o evento ao event loop do assinante; pode ser chamado de qualquer thread."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self.loop:
+            self._deliver(change)
+        else:
+            self.loop.call_soon_threadsafe(self._deliver, change)
+
+    def _deliver(self, change: TaskChangeSchema) -> None:
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            # Política de descarte: o publicador nunca espera. O assinante lento perde a fila e é
+            # desconectado; ao reconectar com o último `seq` recebido, recupera os eventos pelo buffer.
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_CLOSED)
+            self.broker.unsubscribe(self)
+
+    async def get(self) -> Optional[TaskChangeSchema]:
+        """Próximo evento, ou None quando a assinatura foi encerrada."""
+        if self.backlog:
+            return self.backlog.popleft()
+        return await self._queue.get()
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class TaskChangeBroker:
+    """
+    Distribui, dentro do processo, os eventos de criação, alteração e exclusão de tarefas para os
+    assinantes de /tasks/changes. Cada evento recebe um número de sequência crescente e os últimos
+    `buffer_size` ficam guardados para que um cliente retome o stream a partir do último que recebeu.
+    """
+
+    def __init__(self, buffer_size: int = 1000, queue_size: int = 100):
+        self.queue_size = queue_size
+        # Reentrante: a entrega no próprio event loop pode desinscrever o assinante durante o publish
+        self._lock = threading.RLock()
+        self._seq = 0
+        self._buffer: Deque[TaskChangeSchema] = deque(maxlen=buffer_size)
+        self._subscribers: Set[TaskChangeSubscription] = set()
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def publish(
+            self, change_type: TaskChangeType, task_id: Optional[int] = None, task: Optional[TaskSchema] = None
+    ) -> TaskChangeSchema:
+        with self._lock:
+            self._seq += 1
+            change = TaskChangeSchema(
+                seq=self._seq, type=change_type, task_id=task_id, task=task, at=datetime.now(timezone.utc)
+            )
+            self._buffer.append(change)
+            for subscription in list(self._subscribers):
+                try:
+                    subscription.notify(change)
+                except RuntimeError:
+                    # Event loop do assinante já encerrado
+                    self._subscribers.discard(subscription)
+        return change
+
+    def subscribe(self, after: Optional[int] = None) -> TaskChangeSubscription:
+        """
+        Registra um assinante no event loop atual. Com `after`, entrega antes os eventos guardados com
+        `seq` maior; se eles já saíram do buffer (ou `after` é de outra execução do servidor), a
+        assinatura começa por um `reset` com o `seq` atual e o cliente deve recarregar a lista.
+        """
+        subscription = TaskChangeSubscription(self, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            if after is not None:
+                oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+                if after > self._seq or after < oldest - 1:
+                    subscription.reset_seq = self._seq
+                else:
+                    subscription.backlog.extend(change for change in self._buffer if change.seq > after)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TaskChangeSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+async def sse_events(subscription: TaskChangeSubscription, heartbeat: float) -> AsyncIterator[str]:
+    """
+    Formata a assinatura como Server-Sent Events: `id` é o `seq` do evento (reenviado pelo navegador
+    em Last-Event-ID ao reconectar), `event` é o tipo da alteração e `data` o TaskChangeSchema em JSON.
+    Envia um comentário a cada `heartbeat` segundos sem eventos para manter a conexão aberta.
+    """
+    try:
+        if subscription.reset_seq is not None:
+            seq = subscription.reset_seq
+            yield f'id: {seq}\nevent: reset\ndata: {{"seq": {seq}}}\n\n'
+
+        while True:
+            try:
+                change = await asyncio.wait_for(subscription.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if change is _CLOSED:
+                return
+            yield f"id: {change.seq}\nevent: {change.type.value}\ndata: {change.model_dump_json()}\n\n"
+    finally:
+        subscription.close()
@@ -0,0 +1,44 @@
+import csv
+import io
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy import Row
+
+from schemas.task_schema import TASK_LIST_ADAPTER
+
+CSV_FIELDS = ["id", "title", "description", "status", "created_at", "updated_at", "version"]
+
+
+def ndjson_chunks(chunks: Iterable[Sequence[Row]]) -> Iterator[bytes]:
+    """Converte cada bloco de linhas em um bloco NDJSON (um objeto JSON por linha)."""
+    for rows in chunks:
+        tasks = TASK_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+        yield b"".join(task.model_dump_json().encode() + b"\n" for task in tasks)
+
+
+def csv_chunks(chunks: Iterable[Sequence[Row]]) -> Iterator[bytes]:
+    """Converte cada bloco de linhas em um bloco CSV, precedido pelo cabeçalho."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(CSV_FIELDS)
+    yield flush()
+
+    for rows in chunks:
+        for row in rows:
+            writer.writerow([
+                row.id,
+                row.title,
+                row.description or "",
+                row.status.value,
+                row.created_at.isoformat(),
+                row.updated_at.isoformat() if row.updated_at else "",
+                row.version,
+            ])
+        yield flush()
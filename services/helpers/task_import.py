@@ -0,0 +1,82 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, Tuple
+
+# (número da linha, registro lido, erro de leitura)
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decodifica o corpo recebido em blocos e devolve uma linha por vez, sem acumular o arquivo."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_ndjson_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRecord]:
+    """Lê um objeto JSON por linha, ignorando linhas em branco."""
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+            continue
+
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+async def iter_csv_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRecord]:
+    """
+    Lê registros CSV cuja primeira linha é o cabeçalho. Campos entre aspas podem conter
+    quebras de linha (como as descrições geradas pela exportação); valores vazios viram None.
+    """
+    header = None
+    record = ""
+    start_line = line_number = 0
+
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not record:
+            start_line = line_number
+            record = line
+        else:
+            record = f"{record}\n{line}"
+
+        if record.count('"') % 2:
+            # Campo entre aspas continua na próxima linha
+            continue
+
+        values = next(csv.reader([record]), [])
+        record = ""
+        if not any(values):
+            continue
+
+        if header is None:
+            header = values
+            continue
+
+        if len(values) != len(header):
+            yield start_line, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start_line, {key: value or None for key, value in zip(header, values)}, None
+
+    if record:
+        yield start_line, None, "Unterminated quoted field"
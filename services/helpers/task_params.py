@@ -0,0 +1,32 @@
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from configs.environment import get_environment_variables
+from schemas.task_schema import parse_task_fields
+
+env = get_environment_variables()
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Converte `?fields=id,title` nos campos da projeção; campos desconhecidos retornam 400."""
+    try:
+        return parse_task_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def parse_ids(ids: str) -> List[int]:
+    """Converte `?ids=1,2,3` em uma lista de IDs sem repetições, na ordem da requisição."""
+    try:
+        parsed = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="'ids' must be a comma-separated list of integers")
+    if not parsed:
+        raise HTTPException(status_code=400, detail="'ids' must contain at least one id")
+    if len(parsed) > env.BATCH_GET_MAX_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch lookup accepts at most {env.BATCH_GET_MAX_IDS} ids."
+        )
+    return parsed
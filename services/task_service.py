@@ -1,63 +1,417 @@
-from typing import List, Optional, Dict
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, Iterator, List, Optional, Dict, Tuple
 
 from fastapi import Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 
+from configs.cache import get_cache
+from configs.changes import get_change_broker
+from configs.environment import get_environment_variables
+from repositories.cache import Cache
+from repositories.helpers.db_operations import RepositoryIntegrityException
+from repositories.helpers.pagination import (
+    decode_cursor,
+    decode_search_cursor,
+    encode_search_cursor,
+    next_page_cursor,
+)
+from repositories.helpers.task_queries import task_sort_key, task_sort_value
 from repositories.models import Task
 from repositories.task_repository import TaskRepository
-from schemas.task_schema import TaskCreateSchema, TaskUpdateSchema, TaskSchema
-from schemas.enums import TaskStatus
+from schemas.task_schema import (
+    TASK_SEARCH_ADAPTER,
+    TaskBulkCreateResultSchema,
+    TaskBulkDeleteResultSchema,
+    TaskBulkItemResultSchema,
+    TaskBulkUpdateResultSchema,
+    TaskBulkUpdateSchema,
+    TaskCreateSchema,
+    TaskImportErrorSchema,
+    TaskImportResultSchema,
+    TaskSchema,
+    TaskSearchResultSchema,
+    TaskStatsSchema,
+    TaskUpdateSchema,
+    task_fields_schema,
+    task_list_adapter,
+)
+from schemas.enums import TaskChangeType, SortOrder, TaskSort, FileFormat, TaskStatus
+from services.helpers.task_changes import TaskChangeBroker
+from services.helpers.conditional_requests import etag_matches, task_etag
+from services.helpers.task_params import parse_fields, parse_ids
+from services.helpers.task_cache import task_cache_key, task_cache_keys
+from services.helpers.task_export import csv_chunks, ndjson_chunks
+from services.helpers.task_import import iter_csv_records, iter_ndjson_records
+
+env = get_environment_variables()
 
 
 class TaskService:
-    def __init__(self, repository: TaskRepository = Depends()):
+    def __init__(
+            self,
+            repository: TaskRepository = Depends(),
+            cache: Cache = Depends(get_cache),
+            changes: TaskChangeBroker = Depends(get_change_broker),
+    ):
         self.repository = repository
+        self.cache = cache
+        self.changes = changes
 
     def create_task(self, task_data: TaskCreateSchema) -> TaskSchema:
-        existing_task = self.repository.get_by_title(task_data.title)
-        if existing_task:
+        task = Task(**task_data.model_dump(exclude_unset=True, exclude_none=True))
+        try:
+            self.repository.create(task)
+        except RepositoryIntegrityException:
             raise HTTPException(
                 status_code=400,
                 detail=f"A task with title '{task_data.title}' already exists."
             )
-
-        task = Task(**task_data.model_dump(exclude_unset=True))
-        self.repository.create(task)
+        self.changes.publish(TaskChangeType.CREATED, task.id, TaskSchema.model_validate(task))
         return task
 
-    def get_task(self, task_id: int) -> TaskSchema:
-        task = self.repository.get(task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-        return TaskSchema.model_validate(task.normalize())
+    def create_tasks(self, tasks_data: List[TaskCreateSchema]) -> TaskBulkCreateResultSchema:
+        if len(tasks_data) > env.BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"A bulk request accepts at most {env.BULK_MAX_ITEMS} tasks."
+            )
+
+        existing_titles = self.repository.get_existing_titles(list({task.title for task in tasks_data}))
+        results: Dict[int, TaskBulkItemResultSchema] = {}
+        seen_titles = set()
+        rows = []
+        row_indexes = []
+
+        for index, task_data in enumerate(tasks_data):
+            if task_data.title in existing_titles:
+                detail = f"A task with title '{task_data.title}' already exists."
+            elif task_data.title in seen_titles:
+                detail = f"The title '{task_data.title}' is duplicated in this request."
+            else:
+                detail = None
+
+            if detail:
+                results[index] = TaskBulkItemResultSchema(index=index, success=False, detail=detail)
+                continue
+
+            seen_titles.add(task_data.title)
+            row = task_data.model_dump()
+            row["status"] = row["status"] or TaskStatus.PENDING
+            row["created_at"] = row["created_at"] or datetime.now(timezone.utc)
+            rows.append(row)
+            row_indexes.append(index)
+
+        created = []
+        while rows:
+            try:
+                created = self.repository.create_many(rows)
+                break
+            except RepositoryIntegrityException:
+                # Outra requisição gravou algum dos títulos depois da consulta: reporta-os e grava o restante
+                taken_titles = self.repository.get_existing_titles([row["title"] for row in rows])
+                if not taken_titles:
+                    raise
+                for index in row_indexes:
+                    if tasks_data[index].title in taken_titles:
+                        results[index] = TaskBulkItemResultSchema(
+                            index=index,
+                            success=False,
+                            detail=f"A task with title '{tasks_data[index].title}' already exists.",
+                        )
+                rows = [row for row in rows if row["title"] not in taken_titles]
+                row_indexes = [index for index in row_indexes if tasks_data[index].title not in taken_titles]
+
+        created_tasks = {task.title: task for task in created}
+        for index in row_indexes:
+            task = TaskSchema.model_validate(created_tasks[tasks_data[index].title])
+            results[index] = TaskBulkItemResultSchema(index=index, success=True, task=task)
+            self.changes.publish(TaskChangeType.CREATED, task.id, task)
+
+        return TaskBulkCreateResultSchema(
+            created=len(created_tasks),
+            failed=len(tasks_data) - len(created_tasks),
+            results=[results[index] for index in range(len(tasks_data))],
+        )
+
+    parse_fields = staticmethod(parse_fields)
 
-    def list_tasks(self, status: Optional[TaskStatus] = None, limit: int = 100, offset: int = 0) -> List[TaskSchema]:
-        tasks = self.repository.list(status=status, limit=limit, offset=offset)
-        return [TaskSchema.model_validate(task.normalize()) for task in tasks]
+    parse_ids = staticmethod(parse_ids)
+
+    def get_tasks(
+            self, task_ids: List[int], fields: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[List[TaskSchema], List[int]]:
+        """
+        Busca várias tarefas com uma única consulta. Retorna as encontradas na ordem de `task_ids`
+        e a lista de IDs inexistentes.
+        """
+        columns = tuple(task_fields_schema(fields).model_fields) if fields else None
+        rows = {row.id: row for row in self.repository.get_rows(task_ids, fields=columns)}
+        found = [rows[task_id] for task_id in task_ids if task_id in rows]
+        missing = [task_id for task_id in task_ids if task_id not in rows]
+        return task_list_adapter(fields).validate_python(found, from_attributes=True), missing
+
+    def get_task(self, task_id: int, fields: Optional[Tuple[str, ...]] = None) -> TaskSchema:
+        key = task_cache_key(task_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            task_schema = TaskSchema.model_validate_json(cached)
+            return task_fields_schema(fields).model_validate(task_schema) if fields else task_schema
+
+        if fields:
+            # Projeção: lê só as colunas pedidas (e as de TASK_KEY_FIELDS), sem passar pelo cache
+            fields_schema = task_fields_schema(fields)
+            row = self.repository.get_row(task_id, tuple(fields_schema.model_fields))
+            if not row:
+                raise HTTPException(status_code=404, detail="Task not found")
+            return fields_schema.model_validate(row)
 
-    def update_task(self, task_id: int, task_data: TaskUpdateSchema) -> TaskSchema:
         task = self.repository.get(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
+        task_schema = TaskSchema.model_validate(task.normalize())
+        # Só o primário preenche o cache: uma réplica atrasada gravaria nele a versão anterior a uma
+        # escrita recente, servida depois até ao próprio autor da escrita, por todo o CACHE_TTL
+        if not self.repository.reads_from_replica:
+            self.cache.set(key, task_schema.model_dump_json().encode())
+        return task_schema
+
+    def list_tasks(
+            self,
+            status: Optional[TaskStatus] = None,
+            limit: int = 100,
+            offset: int = 0,
+            cursor: Optional[str] = None,
+            fields: Optional[Tuple[str, ...]] = None,
+            sort: TaskSort = TaskSort.CREATED_AT,
+            order: SortOrder = SortOrder.ASC,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> List[TaskSchema]:
+        try:
+            after = decode_cursor(cursor, task_sort_key(sort, order)) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        columns = tuple(task_fields_schema(fields).model_fields) if fields else None
+        rows = self.repository.list_rows(
+            status=status, limit=limit, offset=offset, after=after, fields=columns,
+            sort=sort, order=order, created_after=created_after, updated_after=updated_after,
+        )
+        return task_list_adapter(fields).validate_python(rows, from_attributes=True)
+
+    def search_tasks(
+            self, query: str, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[TaskSearchResultSchema]:
+        try:
+            after = decode_search_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        rows = self.repository.search_rows(query, limit=limit, after=after)
+        return TASK_SEARCH_ADAPTER.validate_python(rows, from_attributes=True)
+
+    @staticmethod
+    def next_search_cursor(results: List[TaskSearchResultSchema], limit: int) -> Optional[str]:
+        if limit <= 0 or len(results) < limit:
+            return None
+        return encode_search_cursor(results[-1].score, results[-1].id)
+
+    def count_tasks(
+            self,
+            status: Optional[TaskStatus] = None,
+            created_after: Optional[datetime] = None,
+            updated_after: Optional[datetime] = None,
+    ) -> int:
+        return self.repository.count(
+            status=status,
+            estimate=env.TASK_COUNT_SOURCE == "estimate",
+            created_after=created_after,
+            updated_after=updated_after,
+        )
+
+    def get_stats(self) -> TaskStatsSchema:
+        counts = self.repository.count_by_status()
+        return TaskStatsSchema(total=sum(counts.values()), by_status=counts)
+
+    @staticmethod
+    def next_cursor(
+            tasks: List[TaskSchema], limit: int, sort: TaskSort = TaskSort.CREATED_AT, order: SortOrder = SortOrder.ASC
+    ) -> Optional[str]:
+        return next_page_cursor(
+            tasks, limit, key=lambda task: task_sort_value(task, sort), sort=task_sort_key(sort, order)
+        )
+
+    def export_tasks(self, export_format: FileFormat, status: Optional[TaskStatus] = None) -> Iterator[bytes]:
+        chunks = self.repository.stream_rows(status=status, chunk_size=env.BULK_CHUNK_SIZE)
+        if export_format == FileFormat.CSV:
+            return csv_chunks(chunks)
+        return ndjson_chunks(chunks)
+
+    async def import_tasks(self, chunks: AsyncIterable[bytes], file_format: FileFormat) -> TaskImportResultSchema:
+        """
+        Importa um arquivo NDJSON/CSV lido em streaming: valida cada registro com TaskCreateSchema e
+        grava blocos de BULK_CHUNK_SIZE tarefas, um por transação, via create_tasks.
+        """
+        records = iter_csv_records(chunks) if file_format == FileFormat.CSV else iter_ndjson_records(chunks)
+        batch: List[Tuple[int, TaskCreateSchema]] = []
+        errors: List[TaskImportErrorSchema] = []
+        processed = created = rejected = 0
+
+        def reject(line: int, detail: str):
+            nonlocal rejected
+            rejected += 1
+            if len(errors) < env.BULK_MAX_ITEMS:
+                errors.append(TaskImportErrorSchema(line=line, detail=detail))
 
+        async def flush():
+            nonlocal created
+            result = await run_in_threadpool(self.create_tasks, [task_data for _, task_data in batch])
+            created += result.created
+            for (line, _), item in zip(batch, result.results):
+                if not item.success:
+                    reject(line, item.detail)
+            batch.clear()
+
+        async for line, record, error in records:
+            processed += 1
+            if error:
+                reject(line, error)
+                continue
+
+            try:
+                batch.append((line, TaskCreateSchema.model_validate(record)))
+            except ValidationError as e:
+                reject(line, "; ".join(
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+                ))
+                continue
+
+            if len(batch) >= env.BULK_CHUNK_SIZE:
+                await flush()
+
+        if batch:
+            await flush()
+
+        return TaskImportResultSchema(processed=processed, created=created, rejected=rejected, errors=errors)
+
+    def update_task(self, task_id: int, task_data: TaskUpdateSchema, if_match: Optional[str] = None) -> TaskSchema:
         updated_data = task_data.model_dump(exclude_unset=True)
+        expected_version = updated_data.pop("version", None)
         if not updated_data:
             raise HTTPException(status_code=400, detail="No fields to update provided")
+        if any(updated_data.get(field, "") is None for field in ("title", "status")):
+            raise HTTPException(status_code=400, detail="Title and status cannot be null")
 
-        for key, value in updated_data.items():
-            setattr(task, key, value)
+        expected = self._check_if_match(task_id, if_match)
+        if expected_version is not None:
+            expected = {**(expected or {}), "version": expected_version}
+        try:
+            task = self.repository.update(task_id, updated_data, expected)
+        except RepositoryIntegrityException:
+            raise HTTPException(
+                status_code=400,
+                detail=f"A task with title '{task_data.title}' already exists."
+            )
 
-        self.repository.update(task_id, task)
+        if not task:
+            current = self.repository.get(task_id) if expected_version is not None else None
+            if current is not None:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Task was modified concurrently: expected version {expected_version}, "
+                           f"current version is {current.version}."
+                )
+            self._raise_not_found_or_precondition_failed(if_match)
+        self.cache.delete(task_cache_key(task_id))
+        self.changes.publish(TaskChangeType.UPDATED, task_id, TaskSchema.model_validate(task))
         return task
 
-    def delete_task(self, task_id: int) -> Dict[str, str | int]:
-        task = self.repository.get(task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail=f"Task with id {task_id} not found")
+    def update_tasks(self, bulk_data: TaskBulkUpdateSchema) -> TaskBulkUpdateResultSchema:
+        if bulk_data.ids is not None and len(bulk_data.ids) > env.BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"A bulk request accepts at most {env.BULK_MAX_ITEMS} tasks."
+            )
+
+        updated_data = bulk_data.patch.model_dump(exclude_unset=True)
+        if not updated_data:
+            raise HTTPException(status_code=400, detail="No fields to update provided")
+        if "status" in updated_data and updated_data["status"] is None:
+            raise HTTPException(status_code=400, detail="Status cannot be null")
+
+        updated, ids = self.repository.update_many(updated_data, ids=bulk_data.ids, status=bulk_data.status)
+        self._invalidate(ids if ids is not None else bulk_data.ids)
+        self._publish_bulk(TaskChangeType.UPDATED, ids if ids is not None else bulk_data.ids, updated)
+        return TaskBulkUpdateResultSchema(updated=updated, ids=ids)
 
-        if self.repository.delete(task_id):
-            return {"message": f"Tarefa com ID {task_id} foi excluída com sucesso.", "task_id": task_id}
+    def delete_tasks(
+            self,
+            ids: Optional[List[int]] = None,
+            status: Optional[TaskStatus] = None,
+            created_before: Optional[datetime] = None,
+    ) -> TaskBulkDeleteResultSchema:
+        if ids is None and status is None and created_before is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Provide 'ids', 'status' and/or 'created_before' to select the tasks to delete."
+            )
+        if ids is not None and len(ids) > env.BULK_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"A bulk request accepts at most {env.BULK_MAX_ITEMS} tasks."
+            )
 
-        raise HTTPException(
-            status_code=500,
-            detail=f"Erro ao tentar excluir a tarefa com ID {task_id}.",
+        deleted = self.repository.delete_many(
+            ids=ids, status=status, created_before=created_before, chunk_size=env.BULK_CHUNK_SIZE
         )
+        self._invalidate(ids)
+        self._publish_bulk(TaskChangeType.DELETED, ids, deleted)
+        return TaskBulkDeleteResultSchema(deleted=deleted)
+
+    def _invalidate(self, ids: Optional[List[int]]) -> None:
+        """Remove do cache as tarefas alteradas em lote; sem os IDs (seleção por filtros), limpa o cache todo."""
+        if ids is None:
+            self.cache.clear()
+        else:
+            self.cache.delete_many(task_cache_keys(ids))
+
+    def _publish_bulk(self, change_type: TaskChangeType, ids: Optional[List[int]], affected: int) -> None:
+        """Publica um evento por tarefa alterada em lote; sem os IDs (seleção por filtros), um único sem task_id."""
+        if not affected:
+            return
+        if ids is None:
+            self.changes.publish(change_type)
+        else:
+            for task_id in ids:
+                self.changes.publish(change_type, task_id)
+
+    def delete_task(self, task_id: int, if_match: Optional[str] = None) -> Dict[str, str | int]:
+        expected = self._check_if_match(task_id, if_match)
+        if not self.repository.delete(task_id, expected):
+            if if_match is None:
+                raise HTTPException(status_code=404, detail=f"Task with id {task_id} not found")
+            self._raise_not_found_or_precondition_failed(if_match)
+        self.cache.delete(task_cache_key(task_id))
+        self.changes.publish(TaskChangeType.DELETED, task_id)
+
+        return {"message": f"Tarefa com ID {task_id} foi excluída com sucesso.", "task_id": task_id}
+
+    def _check_if_match(self, task_id: int, if_match: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Avalia o cabeçalho If-Match contra a ETag atual da tarefa (412 se não coincidir) e retorna
+        a versão lida, usada como condição da escrita para que ela só ocorra se a tarefa não mudar
+        entre a verificação e o UPDATE/DELETE.
+        """
+        if if_match is None:
+            return None
+        task = self.repository.get(task_id)
+        if not task or not etag_matches(if_match, task_etag(task), weak=False):
+            self._raise_not_found_or_precondition_failed(if_match)
+        return {"version": task.version}
+
+    @staticmethod
+    def _raise_not_found_or_precondition_failed(if_match: Optional[str]):
+        if if_match is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        raise HTTPException(status_code=412, detail="The task was modified or deleted (If-Match failed)")
@@ -0,0 +1,70 @@
+import json
+
+from benchmarks.load import run_load_test
+from benchmarks.micro import run_micro_benchmarks
+from benchmarks.seed import create_seeded_database
+from benchmarks.stats import percentile, summarize, write_report
+
+
+def test_percentile_nearest_rank():
+    """
+    Testa o cálculo dos percentis pelo método nearest-rank.
+    """
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_summarize_reports_milliseconds_and_throughput():
+    """
+    Testa o resumo das durações em milissegundos e a vazão por segundo.
+    """
+    summary = summarize([0.001, 0.002, 0.003, 0.004], elapsed=2.0)
+    assert summary["count"] == 4
+    assert summary["p50_ms"] == 2.0
+    assert summary["max_ms"] == 4.0
+    assert summary["throughput_per_s"] == 2.0
+
+
+def test_seeded_database_is_reproducible(tmp_path):
+    """
+    Testa se a mesma semente gera as mesmas tarefas.
+    """
+    titles = []
+    for name in ("first.db", "second.db"):
+        engine, session_factory, ids = create_seeded_database(str(tmp_path / name), 30, seed=7)
+        assert len(ids) == 30
+        with engine.connect() as connection:
+            titles.append(connection.exec_driver_sql("SELECT title FROM tasks ORDER BY id").scalars().all())
+        engine.dispose()
+    assert titles[0] == titles[1]
+
+
+def test_micro_benchmarks_report(tmp_path):
+    """
+    Testa se os micro-benchmarks medem todos os casos.
+    """
+    report = run_micro_benchmarks(str(tmp_path / "micro.db"), tasks=60, iterations=3)
+    assert set(report["results"]) == {
+        "repository.list", "repository.get", "service.list_tasks",
+        "serialization.list_page", "update.returning", "update.copy_attributes",
+    }
+    assert all(result["count"] == 3 for result in report["results"].values())
+
+
+def test_load_test_reports_percentiles_per_endpoint(tmp_path):
+    """
+    Testa o gerador de carga: todas as requisições são atendidas sem erro e o relatório JSON traz os
+    percentis por endpoint.
+    """
+    output = tmp_path / "load.json"
+    report = run_load_test(str(tmp_path / "load.db"), tasks=40, requests=60, concurrency=4)
+    write_report(report, str(output))
+
+    saved = json.loads(output.read_text())
+    assert saved["total"]["count"] == 60
+    assert sum(endpoint["count"] for endpoint in saved["endpoints"].values()) == 60
+    assert all(endpoint["errors"] == 0 for endpoint in saved["endpoints"].values())
+    assert {"p50_ms", "p95_ms", "p99_ms", "throughput_per_s"} <= set(saved["endpoints"]["GET /tasks/{task_id}"])
@@ -0,0 +1,57 @@
+from sqlalchemy import create_engine, event, text
+
+from configs.database import engine_options, set_sqlite_pragmas
+from configs.pool import InstrumentedQueuePool, pool_stats, register_pool_events
+
+
+def test_engine_options_use_instrumented_pool():
+    """
+    Testa se o engine configurado usa o pool instrumentado com os limites do ambiente.
+    """
+    options = engine_options()
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] >= 1
+    assert options["max_overflow"] >= 0
+    assert "pool_timeout" in options
+    assert "pool_recycle" in options
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """
+    Testa se os PRAGMAs de desempenho são aplicados a cada nova conexão SQLite.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
+    with engine.connect() as connection:
+        journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+        synchronous = connection.execute(text("PRAGMA synchronous")).scalar()
+        busy_timeout = connection.execute(text("PRAGMA busy_timeout")).scalar()
+
+    engine.dispose()
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == 5000
+
+
+def test_pool_stats_track_checkouts(tmp_path):
+    """
+    Testa se checkouts, checkins e conexões criadas são contabilizados.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}", poolclass=InstrumentedQueuePool, pool_size=1)
+    register_pool_events(engine)
+    pool_stats.reset()
+
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    stats = pool_stats.snapshot(engine.pool)
+    engine.dispose()
+
+    assert stats["checkouts"] == 3
+    assert stats["checkins"] == 3
+    assert stats["connections_created"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["wait_time_max"] >= 0
@@ -0,0 +1,236 @@
+import time
+
+import pytest
+from faker import Faker
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from configs.database import SessionLocal
+from configs.idempotency import (
+    IN_PROGRESS,
+    RESERVED,
+    BodyTooLarge,
+    IdempotencyMiddleware,
+    read_body,
+    request_fingerprint,
+)
+from main import app
+from repositories.idempotency_repository import IdempotencyRepository
+
+faker = Faker()
+
+
+def test_post_replays_stored_response():
+    """
+    Testa se a repetição de um POST com a mesma Idempotency-Key devolve a resposta guardada sem criar
+    a tarefa de novo (sem a chave, o mesmo título retornaria 400).
+    """
+    client = TestClient(app)
+    headers = {"Idempotency-Key": faker.uuid4()}
+    payload = {"title": faker.unique.sentence(nb_words=4), "status": "PENDING"}
+
+    first = client.post("/tasks/", json=payload, headers=headers)
+    assert first.status_code == 201, first.text
+    assert "idempotent-replayed" not in first.headers
+
+    replay = client.post("/tasks/", json=payload, headers=headers)
+    assert replay.status_code == 201, replay.text
+    assert replay.headers["idempotent-replayed"] == "true"
+    assert replay.json() == first.json()
+
+    assert client.post("/tasks/", json=payload).status_code == 400
+
+
+def test_patch_replay_does_not_apply_update_twice():
+    """
+    Testa se o PATCH repetido com a mesma chave não incrementa a versão novamente.
+    """
+    client = TestClient(app)
+    task_id = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+    headers = {"Idempotency-Key": faker.uuid4()}
+
+    first = client.patch(f"/tasks/{task_id}", json={"status": "COMPLETED"}, headers=headers)
+    replay = client.patch(f"/tasks/{task_id}", json={"status": "COMPLETED"}, headers=headers)
+
+    assert first.json()["version"] == replay.json()["version"] == 2
+    assert replay.headers["etag"] == first.headers["etag"]
+    assert client.get(f"/tasks/{task_id}").json()["version"] == 2
+
+
+def test_key_reused_with_different_request():
+    """
+    Testa se a mesma chave com outro corpo retorna 422 e uma chave inválida retorna 400.
+    """
+    client = TestClient(app)
+    headers = {"Idempotency-Key": faker.uuid4()}
+
+    assert client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}, headers=headers).status_code == 201
+    response = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}, headers=headers)
+    assert response.status_code == 422
+
+    response = client.post(
+        "/tasks/", json={"title": faker.unique.sentence(nb_words=4)}, headers={"Idempotency-Key": "k" * 256}
+    )
+    assert response.status_code == 400
+
+
+def test_key_in_progress_returns_conflict():
+    """
+    Testa se uma repetição enquanto a requisição original ainda executa retorna 409.
+    """
+    client = TestClient(app)
+    key = faker.uuid4()
+    body = b'{"title": "in progress"}'
+    fingerprint = request_fingerprint("POST", "/tasks/", b"", body)
+    assert IdempotencyMiddleware(app=None).reserve(key, fingerprint)[0] == RESERVED
+
+    response = client.post(
+        "/tasks/", content=body, headers={"Idempotency-Key": key, "Content-Type": "application/json"}
+    )
+    assert response.status_code == 409
+    assert response.headers["retry-after"] == "1"
+
+
+def test_server_error_releases_key():
+    """
+    Testa se uma resposta 5xx não é guardada: a retentativa com a mesma chave executa a rota de novo.
+    """
+    calls = []
+    failing_app = FastAPI()
+
+    @failing_app.post("/jobs")
+    def create_job():
+        calls.append(1)
+        if len(calls) == 1:
+            raise HTTPException(status_code=503, detail="Unavailable")
+        return {"calls": len(calls)}
+
+    failing_app.add_middleware(IdempotencyMiddleware)
+    client = TestClient(failing_app)
+    headers = {"Idempotency-Key": faker.uuid4()}
+
+    assert client.post("/jobs", headers=headers).status_code == 503
+    assert client.post("/jobs", headers=headers).json() == {"calls": 2}
+    replay = client.post("/jobs", headers=headers)
+    assert replay.json() == {"calls": 2}
+    assert replay.headers["idempotent-replayed"] == "true"
+
+
+def test_expired_keys_are_cleaned_up():
+    """
+    Testa se as chaves expiradas são removidas e podem ser reutilizadas.
+    """
+    middleware = IdempotencyMiddleware(app=None, ttl=0.01, cleanup_interval=0.01)
+    key, fingerprint = faker.uuid4(), "a" * 64
+    assert middleware.reserve(key, fingerprint)[0] == RESERVED
+    assert middleware.reserve(key, fingerprint)[0] == IN_PROGRESS
+
+    time.sleep(0.02)
+    assert middleware.reserve(key, fingerprint)[0] == RESERVED
+
+    time.sleep(0.02)
+    with SessionLocal() as db:
+        repository = IdempotencyRepository(db)
+        assert repository.delete_expired(now=repository.get(key).expires_at) >= 1
+        assert repository.get(key) is None
+
+
+def counting_app(**middleware_options):
+    """
+    App mínimo com o middleware: POST /jobs conta as execuções e POST /fail levanta uma exceção.
+    """
+    calls = []
+    jobs_app = FastAPI()
+
+    @jobs_app.post("/jobs")
+    def create_job(size: int = 0):
+        calls.append(1)
+        return {"calls": len(calls), "padding": "x" * size}
+
+    @jobs_app.post("/fail")
+    def fail():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    jobs_app.add_middleware(IdempotencyMiddleware, **middleware_options)
+    return jobs_app, calls
+
+
+def test_request_body_over_limit_returns_413():
+    """
+    Testa se um corpo acima do limite retorna 413 sem executar a rota nem ler o corpo inteiro.
+    """
+    jobs_app, calls = counting_app(max_body_size=16)
+    client = TestClient(jobs_app)
+
+    response = client.post("/jobs", content=b"x" * 17, headers={"Idempotency-Key": faker.uuid4()})
+    assert response.status_code == 413
+    assert calls == []
+    assert client.post("/jobs", content=b"x" * 16, headers={"Idempotency-Key": faker.uuid4()}).status_code == 200
+
+
+@pytest.mark.anyio
+async def test_read_body_stops_at_limit_without_content_length():
+    """
+    Testa o limite na leitura em partes (sem Content-Length): a leitura para ao passar do limite.
+    """
+    messages = iter([{"type": "http.request", "body": b"x" * 8, "more_body": True}] * 10)
+    received = []
+
+    async def receive():
+        received.append(1)
+        return next(messages)
+
+    with pytest.raises(BodyTooLarge):
+        await read_body(receive, max_size=20)
+    assert len(received) == 3
+
+
+def test_response_over_limit_is_not_stored():
+    """
+    Testa se uma resposta acima do limite é entregue, mas não guardada: a retentativa executa de novo.
+    """
+    jobs_app, calls = counting_app(max_body_size=256)
+    client = TestClient(jobs_app)
+    headers = {"Idempotency-Key": faker.uuid4()}
+
+    assert client.post("/jobs?size=1000", headers=headers).json()["calls"] == 1
+    response = client.post("/jobs?size=1000", headers=headers)
+    assert response.json()["calls"] == 2
+    assert "idempotent-replayed" not in response.headers
+
+
+def test_exception_releases_key():
+    """
+    Testa se uma exceção na rota libera a chave, permitindo a retentativa.
+    """
+    jobs_app, calls = counting_app()
+    client = TestClient(jobs_app, raise_server_exceptions=False)
+    headers = {"Idempotency-Key": faker.uuid4()}
+
+    assert client.post("/fail", headers=headers).status_code == 500
+    assert client.post("/fail", headers=headers).status_code == 500
+    assert len(calls) == 2
+
+
+def test_stale_reservation_is_reclaimed_after_lease():
+    """
+    Testa se uma reserva sem resposta além do lease é retomada, e se a requisição original,
+    ao terminar depois disso, não sobrescreve a nova reserva.
+    """
+    middleware = IdempotencyMiddleware(app=None, lease=0.2)
+    key = faker.uuid4()
+    outcome, stale_reserved_at, *_ = middleware.reserve(key, "a" * 64)
+    assert outcome == RESERVED
+
+    time.sleep(0.25)
+    outcome, reserved_at, *_ = middleware.reserve(key, "a" * 64)
+    assert outcome == RESERVED
+    assert reserved_at > stale_reserved_at
+
+    middleware.store(key, stale_reserved_at, 201, [], b"stale")
+    middleware.release(key, stale_reserved_at)
+    assert middleware.reserve(key, "a" * 64)[0] == IN_PROGRESS
+
+    middleware.store(key, reserved_at, 201, [], b"fresh")
+    assert middleware.reserve(key, "a" * 64)[4] == b"fresh"
@@ -0,0 +1,83 @@
+import re
+
+from faker import Faker
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from configs.metrics import (
+    MetricsRegistry,
+    RequestMetrics,
+    current_request_metrics,
+    metrics_registry,
+    register_query_metrics,
+    track_serialization,
+)
+from main import app
+
+faker = Faker()
+
+
+def test_query_metrics_accumulate_in_current_request(tmp_path):
+    """
+    Testa se as consultas executadas durante a requisição somam contagem, tempo e linhas afetadas.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+    register_query_metrics(engine)
+    metrics = RequestMetrics()
+    token = current_request_metrics.set(metrics)
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            connection.execute(text("INSERT INTO items (id) VALUES (1), (2), (3)"))
+            connection.execute(text("SELECT * FROM items")).all()
+        with track_serialization():
+            pass
+    finally:
+        current_request_metrics.reset(token)
+        engine.dispose()
+
+    assert metrics.queries == 3
+    assert metrics.rows == 3
+    assert metrics.db_time > 0
+    assert metrics.serialization_time > 0
+
+
+def test_registry_renders_prometheus_text():
+    """
+    Testa o formato texto do Prometheus: contador por status e histograma cumulativo por rota.
+    """
+    registry = MetricsRegistry()
+    for duration in (0.003, 0.2, 20.0):
+        registry.observe("GET", "/tasks/", 200, duration, RequestMetrics(queries=2, rows=10))
+    registry.observe("GET", "/tasks/", 404, 0.001, RequestMetrics())
+
+    output = registry.render()
+
+    assert 'http_requests_total{method="GET",route="/tasks/",status="200"} 3' in output
+    assert 'http_requests_total{method="GET",route="/tasks/",status="404"} 1' in output
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/tasks/",le="0.005"} 2' in output
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/tasks/",le="0.25"} 3' in output
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/tasks/",le="+Inf"} 4' in output
+    assert 'http_request_duration_seconds_count{method="GET",route="/tasks/"} 4' in output
+    assert 'http_request_db_queries_total{method="GET",route="/tasks/"} 6' in output
+    assert 'http_request_db_rows_total{method="GET",route="/tasks/"} 30' in output
+
+
+def test_requests_are_measured_per_route():
+    """
+    Testa o cabeçalho Server-Timing e as métricas expostas em /metrics, agrupadas pelo template da rota.
+    """
+    metrics_registry.reset()
+    client = TestClient(app)
+    task = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()
+
+    response = client.get(f"/tasks/?ids={task['id']}")
+    assert re.match(r'db;dur=[\d.]+;desc="[1-9]\d* queries", serialize;dur=[\d.]+, app;dur=[\d.]+$',
+                    response.headers["Server-Timing"])
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="POST",route="/tasks/",status="201"} 1' in response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/tasks/"} 1' in response.text
+    queries = re.search(r'http_request_db_queries_total\{method="POST",route="/tasks/"} (\d+)', response.text)
+    assert int(queries.group(1)) >= 1
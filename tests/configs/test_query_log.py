@@ -0,0 +1,147 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+from faker import Faker
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from configs.query_log import (
+    QueryLogMiddleware,
+    calling_repository_method,
+    current_request_queries,
+    frame_qualname,
+    register_query_log,
+)
+from main import app
+from repositories.models import EntityMeta, Task
+from repositories.task_repository import TaskRepository
+
+faker = Faker()
+
+
+def test_slow_queries_are_logged_with_parameters(tmp_path, caplog):
+    """
+    Testa se as consultas acima do limite são registradas com os parâmetros e anotadas na requisição.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'query_log.db'}")
+    register_query_log(engine, threshold_ms=0)
+    title = faker.sentence(nb_words=3)
+    queries = []
+    token = current_request_queries.set(queries)
+    try:
+        with caplog.at_level(logging.WARNING, logger="todolist.sql"), engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, title TEXT)"))
+            connection.execute(text("INSERT INTO items (title) VALUES (:title)"), {"title": title})
+    finally:
+        current_request_queries.reset(token)
+        engine.dispose()
+
+    assert len(queries) == 2
+    assert "INSERT INTO items" in caplog.records[-1].getMessage()
+    assert title in caplog.records[-1].getMessage()
+
+
+def test_fast_queries_are_not_logged(tmp_path, caplog):
+    """
+    Testa se consultas abaixo do limite não geram log.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'query_log.db'}")
+    register_query_log(engine, threshold_ms=60_000)
+    try:
+        with caplog.at_level(logging.WARNING, logger="todolist.sql"), engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    finally:
+        engine.dispose()
+
+    assert not caplog.records
+
+
+def test_slow_query_logs_calling_repository_method(tmp_path, caplog):
+    """
+    Testa se o log de uma consulta lenta feita por um repositório identifica o método que a executou.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'query_log.db'}")
+    EntityMeta.metadata.create_all(bind=engine)
+    register_query_log(engine, threshold_ms=0)
+    repository = TaskRepository(sessionmaker(bind=engine)())
+    try:
+        task = repository.create(Task(title=faker.sentence(nb_words=3)))
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="todolist.sql"):
+            repository.get(task.id)
+    finally:
+        repository.db.close()
+        engine.dispose()
+
+    assert len(caplog.records) == 1
+    assert "in TaskRepository.get:" in caplog.records[0].getMessage()
+    assert str(task.id) in caplog.records[0].getMessage()
+
+
+def test_frame_qualname_without_co_qualname():
+    """
+    Testa o nome do método montado pela classe de `self` quando o código não tem co_qualname (Python 3.10).
+    """
+    repository = TaskRepository(db=None)
+    frame = SimpleNamespace(f_code=SimpleNamespace(co_name="get"), f_locals={"self": repository})
+    assert frame_qualname(frame) == "TaskRepository.get"
+
+    frame = SimpleNamespace(f_code=SimpleNamespace(co_name="helper"), f_locals={})
+    assert frame_qualname(frame) == "helper"
+
+
+def test_calling_repository_method_outside_repositories():
+    """
+    Testa o chamador desconhecido quando a consulta não parte de um repositório.
+    """
+    assert calling_repository_method() == "<unknown>"
+
+
+def test_middleware_flags_repeated_statements(caplog):
+    """
+    Testa se o middleware sinaliza o mesmo statement repetido (N+1) e o excesso de consultas.
+    """
+    middleware = QueryLogMiddleware(app=None, max_queries=3, max_repeats=1)
+    statement = "SELECT * FROM tasks WHERE tasks.id = ?"
+
+    with caplog.at_level(logging.WARNING, logger="todolist.sql"):
+        middleware.check("GET", "/tasks/1", ["SELECT 1", "SELECT 2"])
+        assert not caplog.records
+
+        middleware.check("PATCH", "/tasks/1", [statement, "UPDATE tasks SET status=?", statement])
+        assert "2x SELECT * FROM tasks" in caplog.records[-1].getMessage()
+
+        middleware.check("GET", "/tasks/", ["SELECT 1", "SELECT 2", "SELECT 3", "SELECT 4"])
+        assert "issued 4 queries" in caplog.records[-1].getMessage()
+
+
+def test_query_counter_counts_request_queries(query_counter):
+    """
+    Testa a fixture query_counter: um GET por ID sem cache faz uma única consulta.
+    """
+    client = TestClient(app)
+    task_id = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+
+    query_counter.clear()
+    assert client.get(f"/tasks/{task_id}").status_code == 200
+    assert len(query_counter) == 1
+
+    query_counter.clear()
+    assert client.get(f"/tasks/{task_id}").status_code == 200
+    assert len(query_counter) == 0
+
+
+@pytest.mark.max_queries(5)
+def test_update_with_if_match_query_budget():
+    """
+    Testa o limite de consultas de criar, ler e alterar com If-Match uma tarefa: o PATCH faz apenas a
+    leitura da ETag e o UPDATE ... RETURNING, sem reler a tarefa depois da escrita.
+    """
+    client = TestClient(app)
+    task_id = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+    etag = client.get(f"/tasks/{task_id}").headers["ETag"]
+
+    response = client.patch(f"/tasks/{task_id}", json={"status": "COMPLETED"}, headers={"If-Match": etag})
+    assert response.status_code == 200, response.text
@@ -0,0 +1,147 @@
+import pytest
+from faker import Faker
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from configs import database
+from configs.database import READ_YOUR_WRITES_COOKIE, reads_from_replica
+from configs.replicas import ReplicaSet, RoutingSession
+from main import app
+from repositories.models import EntityMeta, Task
+from repositories.task_repository import TaskRepository
+from schemas.enums import TaskStatus
+
+faker = Faker()
+
+
+@pytest.fixture
+def primary_and_replica(tmp_path):
+    """
+    Dois bancos SQLite em arquivo com o mesmo schema: um primário e uma réplica (sem replicação).
+    """
+    engines = [create_engine(f"sqlite:///{tmp_path / name}") for name in ("primary.db", "replica.db")]
+    for engine in engines:
+        EntityMeta.metadata.create_all(engine)
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def test_routing_session_reads_from_replica_and_writes_to_primary(primary_and_replica):
+    """
+    Testa que as leituras vão à réplica, as escritas ao primário, e que após escrever a sessão lê do primário.
+    """
+    primary, replica = primary_and_replica
+    with sessionmaker(bind=replica)() as replica_session:
+        replica_task = TaskRepository(replica_session).create(Task(title=faker.unique.sentence(nb_words=4)))
+
+    session = sessionmaker(class_=RoutingSession, bind=primary)(replica=replica)
+    repository = TaskRepository(session)
+    assert repository.get_by_title(replica_task.title) is not None
+    assert [task.id for task in repository.list()] == [replica_task.id]
+
+    created = repository.create(Task(title=faker.unique.sentence(nb_words=4)))
+    assert session.replica is None
+    assert repository.get(created.id).title == created.title
+    session.close()
+
+    with sessionmaker(bind=primary)() as primary_session:
+        assert primary_session.scalar(select(Task.title)) == created.title
+
+
+def test_replica_set_round_robin_skips_unhealthy(tmp_path):
+    """
+    Testa o round-robin entre réplicas e o desvio de uma réplica indisponível.
+    """
+    first = create_engine(f"sqlite:///{tmp_path / 'first.db'}")
+    second = create_engine(f"sqlite:///{tmp_path / 'second.db'}")
+    broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'broken.db'}")
+    replicas = ReplicaSet([first, broken, second], check_interval=60)
+
+    chosen = [replicas.choose() for _ in range(6)]
+
+    assert set(chosen) == {first, second}
+    assert chosen[:3] == [first, second, second]
+    assert [replica["healthy"] for replica in replicas.status()] == [True, False, True]
+    assert ReplicaSet([broken]).choose() is None
+
+
+@pytest.mark.anyio
+async def test_replica_set_async_health_check(tmp_path):
+    """
+    Testa a verificação de saúde assíncrona das réplicas (engines aiosqlite).
+    """
+    healthy = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'broken.db'}")
+    try:
+        assert await ReplicaSet([broken, healthy]).choose_async() is healthy.sync_engine
+        assert await ReplicaSet([broken]).choose_async() is None
+    finally:
+        await healthy.dispose()
+        await broken.dispose()
+
+
+def test_read_your_writes_window(monkeypatch):
+    """
+    Testa que, após uma escrita, o cliente lê do primário durante a janela de read-your-writes.
+    """
+    monkeypatch.setattr(database.env, "REPLICA_READ_YOUR_WRITES_WINDOW", 30.0)
+    routing_app = FastAPI()
+
+    @routing_app.api_route("/", methods=["GET", "POST"])
+    def route(request: Request, response: Response):
+        return {"replica": reads_from_replica(request, response)}
+
+    client = TestClient(routing_app)
+    assert client.get("/").json() == {"replica": True}
+
+    response = client.post("/")
+    assert response.json() == {"replica": False}
+    assert READ_YOUR_WRITES_COOKIE in response.cookies
+    assert client.get("/").json() == {"replica": False}
+
+    client.cookies.clear()
+    assert client.get("/").json() == {"replica": True}
+
+
+def test_task_routes_use_replica_outside_read_your_writes_window(primary_and_replica, monkeypatch):
+    """
+    Testa as rotas de tarefas com uma réplica configurada: a leitura logo após a escrita vem do primário;
+    sem o cookie de read-your-writes, vem da réplica (que aqui não recebe replicação).
+    """
+    _, replica = primary_and_replica
+    monkeypatch.setattr(database, "ReadReplicas", ReplicaSet([replica]))
+    client = TestClient(app)
+
+    task = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()
+    assert [item["id"] for item in client.get(f"/tasks/?ids={task['id']}").json()] == [task["id"]]
+
+    client.cookies.clear()
+    response = client.get(f"/tasks/?ids={task['id']}")
+    assert response.json() == []
+    assert response.headers["X-Missing-Ids"] == str(task["id"])
+
+
+def test_replica_reads_do_not_fill_cache_after_write(primary_and_replica, monkeypatch):
+    """
+    Testa o read-your-writes com o cache: depois do PATCH, a leitura de outro cliente na réplica
+    atrasada não grava a versão antiga no cache, e o autor da escrita continua lendo a versão nova.
+    """
+    _, replica = primary_and_replica
+    monkeypatch.setattr(database, "ReadReplicas", ReplicaSet([replica]))
+    writer, reader = TestClient(app), TestClient(app)
+
+    task = writer.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()
+    with sessionmaker(bind=replica)() as replica_session:
+        replica_session.add(Task(id=task["id"], title=task["title"], status=TaskStatus.PENDING, version=1))
+        replica_session.commit()
+
+    assert writer.get(f"/tasks/{task['id']}").json()["status"] == "PENDING"
+    response = writer.patch(f"/tasks/{task['id']}", json={"status": "COMPLETED"})
+    assert response.status_code == 200, response.text
+
+    assert reader.get(f"/tasks/{task['id']}").json()["status"] == "PENDING"
+    assert writer.get(f"/tasks/{task['id']}").json()["status"] == "COMPLETED"
@@ -2,9 +2,13 @@ import os
 import sys
 import pytest
 from dotenv import load_dotenv
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Adiciona o diretório raiz ao PYTHONPATH
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
@@ -17,10 +21,40 @@ load_dotenv(dotenv_path)
 
 from main import app  # Importa o app após corrigir o caminho
 from repositories.models import EntityMeta
-from configs.database import get_db_connection
+from configs.cache import get_cache
+from configs.database import get_async_db_connection, get_db_connection
+from configs.query_log import count_queries
+from routers.async_task_router import router as async_task_router
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "max_queries(n): falha o teste se ele executar mais de n consultas SQL"
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Conta as consultas executadas pelo corpo dos testes marcados com `max_queries` (as fixtures
+    ficam de fora) e falha o teste se o limite for ultrapassado, listando os statements.
+    """
+    marker = item.get_closest_marker("max_queries")
+    if marker is None:
+        return (yield)
+
+    with count_queries() as statements:
+        result = yield
+    limit = marker.args[0]
+    if len(statements) > limit:
+        listing = "\n".join(" ".join(statement.split()) for statement in statements)
+        pytest.fail(f"{len(statements)} consultas executadas (máximo {limit}):\n{listing}", pytrace=False)
+    return result
+
 
 # Configuração do banco de dados SQLite em memória para testes
 TEST_DATABASE_URL = "sqlite:///:memory:"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -58,6 +92,14 @@ def clear_database(db):
     db.commit()
 
 
+@pytest.fixture(scope="function", autouse=True)
+def clear_cache():
+    """
+    Esvazia o cache de leitura antes de cada teste, já que os IDs são reutilizados entre bancos limpos.
+    """
+    get_cache().clear()
+
+
 @pytest.fixture(scope="function")
 def api_client(db):
     """
@@ -65,3 +107,50 @@ def api_client(db):
     """
     app.dependency_overrides[get_db_connection] = lambda: db
     return TestClient(app)
+
+
+@pytest.fixture
+def query_counter():
+    """
+    Lista dos statements SQL executados durante o teste, para asserções sobre o número de consultas.
+    """
+    with count_queries() as statements:
+        yield statements
+
+
+@pytest.fixture
+def anyio_backend():
+    """
+    Executa os testes assíncronos apenas com asyncio.
+    """
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_db():
+    """
+    Gera uma sessão assíncrona (aiosqlite) sobre um banco em memória exclusivo do teste.
+    """
+    async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=StaticPool)
+    async with async_engine.begin() as connection:
+        await connection.run_sync(EntityMeta.metadata.create_all)
+
+    session = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await async_engine.dispose()
+
+
+@pytest.fixture
+async def async_api_client(async_db):
+    """
+    Cliente HTTP assíncrono para as rotas assíncronas, usando a sessão de teste.
+    """
+    async_app = FastAPI()
+    async_app.include_router(async_task_router)
+    async_app.dependency_overrides[get_async_db_connection] = lambda: async_db
+
+    async with AsyncClient(transport=ASGITransport(app=async_app), base_url="http://test") as client:
+        yield client
@@ -0,0 +1,85 @@
+import pytest
+from faker import Faker
+from repositories.models import Task
+from repositories.async_task_repository import AsyncTaskRepository
+from schemas.enums import TaskStatus
+
+faker = Faker()
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_task(async_db):
+    """
+    Testa a criação de uma nova tarefa no repositório assíncrono.
+    """
+    repository = AsyncTaskRepository(async_db)
+    task = Task(title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING)
+
+    created_task = await repository.create(task)
+
+    assert created_task.id is not None
+    assert created_task.title == task.title
+    assert created_task.status == TaskStatus.PENDING
+
+
+async def test_get_task(async_db):
+    """
+    Testa a recuperação de uma tarefa pelo ID e pelo título.
+    """
+    repository = AsyncTaskRepository(async_db)
+    created_task = await repository.create(
+        Task(title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.IN_PROGRESS)
+    )
+
+    fetched_task = await repository.get(created_task.id)
+    fetched_by_title = await repository.get_by_title(created_task.title)
+
+    assert fetched_task is not None
+    assert fetched_task.id == created_task.id
+    assert fetched_by_title.id == created_task.id
+    assert await repository.get(99999) is None
+
+
+async def test_list_tasks_with_status_filter(async_db):
+    """
+    Testa a listagem com filtro por status e paginação.
+    """
+    repository = AsyncTaskRepository(async_db)
+    await repository.create(Task(title=faker.sentence(nb_words=3), status=TaskStatus.PENDING))
+    await repository.create(Task(title=faker.sentence(nb_words=3), status=TaskStatus.COMPLETED))
+
+    all_tasks = await repository.list()
+    completed = await repository.list(status=TaskStatus.COMPLETED)
+    paged = await repository.list(limit=1, offset=1)
+
+    assert len(all_tasks) == 2
+    assert [task.status for task in completed] == [TaskStatus.COMPLETED]
+    assert len(paged) == 1
+
+
+async def test_update_task(async_db):
+    """
+    Testa a atualização de uma tarefa existente.
+    """
+    repository = AsyncTaskRepository(async_db)
+    created_task = await repository.create(Task(title=faker.sentence(nb_words=3), status=TaskStatus.PENDING))
+
+    updated_task = await repository.update(created_task.id, {"status": TaskStatus.COMPLETED})
+
+    assert updated_task is not None
+    assert updated_task.status == TaskStatus.COMPLETED
+    assert updated_task.updated_at is not None
+    assert await repository.update(99999, {"status": TaskStatus.PENDING}) is None
+
+
+async def test_delete_task(async_db):
+    """
+    Testa a exclusão de uma tarefa existente.
+    """
+    repository = AsyncTaskRepository(async_db)
+    created_task = await repository.create(Task(title=faker.sentence(nb_words=3), status=TaskStatus.PENDING))
+
+    assert await repository.delete(created_task.id) is True
+    assert await repository.get(created_task.id) is None
+    assert await repository.delete(created_task.id) is False
@@ -0,0 +1,134 @@
+import time
+from fnmatch import fnmatch
+
+from faker import Faker
+
+from repositories.cache import InMemoryCache, NullCache, RedisCache
+
+faker = Faker()
+
+
+class FakeRedis:
+    """
+    Cliente em memória com o subconjunto da API do redis-py usado por RedisCache.
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def set(self, key, value, px=None):
+        self.data[key] = (value, time.monotonic() + px / 1000 if px else None)
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match="*"):
+        return iter([key for key in list(self.data) if fnmatch(key, match)])
+
+
+def test_in_memory_cache_get_and_set():
+    """
+    Testa leitura, escrita e os contadores de acertos e falhas do cache em memória.
+    """
+    cache = InMemoryCache(max_size=10, ttl=60)
+    value = faker.text().encode()
+
+    assert cache.get("task:1") is None
+    cache.set("task:1", value)
+    assert cache.get("task:1") == value
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    """
+    Testa que, ao exceder o tamanho máximo, a entrada usada há mais tempo é removida.
+    """
+    cache = InMemoryCache(max_size=2, ttl=60)
+    cache.set("task:1", b"1")
+    cache.set("task:2", b"2")
+    cache.get("task:1")
+    cache.set("task:3", b"3")
+
+    assert cache.get("task:2") is None
+    assert cache.get("task:1") == b"1"
+    assert cache.get("task:3") == b"3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_in_memory_cache_expires_entries():
+    """
+    Testa que entradas com o TTL vencido não são retornadas e contam como remoção.
+    """
+    cache = InMemoryCache(max_size=10, ttl=60)
+    cache.set("task:1", b"1", ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("task:1") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_in_memory_cache_delete_and_clear():
+    """
+    Testa a remoção de entradas específicas e a limpeza completa do cache.
+    """
+    cache = InMemoryCache()
+    for task_id in range(1, 4):
+        cache.set(f"task:{task_id}", str(task_id).encode())
+
+    cache.delete_many(["task:1", "task:2"])
+    assert cache.get("task:1") is None
+    assert cache.get("task:3") == b"3"
+
+    cache.clear()
+    assert cache.get("task:3") is None
+
+
+def test_redis_cache_with_fake_client():
+    """
+    Testa o cache sobre um cliente compatível com Redis, com prefixo nas chaves e TTL em milissegundos.
+    """
+    client = FakeRedis()
+    client.set("other:1", b"x")
+    cache = RedisCache(client, ttl=60)
+    value = faker.text().encode()
+
+    assert cache.get("task:1") is None
+    cache.set("task:1", value)
+    assert cache.get("task:1") == value
+    assert "todolist:task:1" in client.data
+
+    cache.set("task:2", b"2", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("task:2") is None
+
+    cache.clear()
+    assert cache.get("task:1") is None
+    assert "other:1" in client.data
+
+    stats = cache.stats()
+    assert stats["backend"] == "RedisCache"
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+
+
+def test_null_cache():
+    """
+    Testa que o cache desativado nunca retorna valores.
+    """
+    cache = NullCache()
+    cache.set("task:1", b"1")
+
+    assert cache.get("task:1") is None
+    assert cache.stats()["misses"] == 1
@@ -0,0 +1,97 @@
+import re
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from faker import Faker
+from sqlalchemy import event
+
+from repositories.models import Task
+from repositories.task_repository import TaskRepository
+from schemas.enums import SortOrder, TaskSort, TaskStatus
+
+faker = Faker()
+
+TABLE_SCAN = re.compile(r"^SCAN (TABLE )?tasks$")
+
+
+@contextmanager
+def captured_statements(db):
+    """
+    Captura os SELECTs (com parâmetros) emitidos pela sessão durante o bloco.
+    """
+    statements = []
+    engine = db.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def query_plan(db, statement, parameters):
+    """
+    Executa EXPLAIN QUERY PLAN para o statement informado e retorna as linhas de detalhe.
+    """
+    connection = db.connection().connection.driver_connection
+    return [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()]
+
+
+@pytest.fixture
+def repository(db):
+    repository = TaskRepository(db)
+    for status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED):
+        repository.create(Task(title=faker.unique.sentence(nb_words=4), status=status))
+    return repository
+
+
+QUERIES = {
+    "get": lambda repository: repository.get(1),
+    "get_by_title": lambda repository: repository.get_by_title("title"),
+    "list": lambda repository: repository.list(limit=10),
+    "list_rows": lambda repository: repository.list_rows(limit=10, status=TaskStatus.PENDING),
+    "stream_rows": lambda repository: list(repository.stream_rows(status=TaskStatus.PENDING)),
+    "list_offset": lambda repository: repository.list(limit=10, offset=5),
+    "list_status": lambda repository: repository.list(limit=10, status=TaskStatus.PENDING),
+    "list_cursor": lambda repository: repository.list(limit=10, after=(datetime(2024, 1, 1), 1)),
+    "list_status_cursor": lambda repository: repository.list(
+        limit=10, status=TaskStatus.COMPLETED, after=(datetime(2024, 1, 1), 1)
+    ),
+    "list_sort_updated_at_desc": lambda repository: repository.list_rows(
+        limit=10, sort=TaskSort.UPDATED_AT, order=SortOrder.DESC
+    ),
+    "list_sort_title_cursor": lambda repository: repository.list_rows(
+        limit=10, sort=TaskSort.TITLE, after=("title", 1)
+    ),
+    "list_sort_id_desc_cursor": lambda repository: repository.list_rows(
+        limit=10, sort=TaskSort.ID, order=SortOrder.DESC, after=(10, 10)
+    ),
+    "list_created_after": lambda repository: repository.list_rows(limit=10, created_after=datetime(2024, 1, 1)),
+    "list_updated_after": lambda repository: repository.list_rows(
+        limit=10, sort=TaskSort.UPDATED_AT, updated_after=datetime(2024, 1, 1)
+    ),
+    "search_rows": lambda repository: repository.search_rows("title", limit=10),
+    "search_rows_cursor": lambda repository: repository.search_rows("title", limit=10, after=(-1.0, 1)),
+    "get_rows": lambda repository: repository.get_rows([3, 1, 2], fields=("id", "title")),
+    "count": lambda repository: repository.count(TaskStatus.PENDING),
+}
+
+
+@pytest.mark.parametrize("name", QUERIES)
+def test_repository_query_uses_index(db, repository, name):
+    """
+    Testa se cada consulta do repositório é resolvida por índice, sem varredura completa da tabela.
+    """
+    with captured_statements(db) as statements:
+        QUERIES[name](repository)
+
+    assert statements, f"{name} não emitiu nenhum SELECT"
+    for statement, parameters in statements:
+        plan = query_plan(db, statement, parameters)
+        table_scans = [detail for detail in plan if TABLE_SCAN.match(detail)]
+        assert not table_scans, f"{name} faz varredura completa da tabela: {plan}\n{statement}"
@@ -1,8 +1,14 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from faker import Faker
-from repositories.models import Task
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
+from repositories.helpers.db_operations import RepositoryIntegrityException
+from repositories.models import EntityMeta, Task
 from repositories.task_repository import TaskRepository
-from schemas.enums import TaskStatus
+from schemas.enums import SortOrder, TaskSort, TaskStatus
 
 faker = Faker()
 
@@ -81,17 +87,52 @@ def test_update_task(db):
 
     updated_title = faker.sentence(nb_words=3)
     updated_description = faker.text()
-    created_task.title = updated_title
-    created_task.description = updated_description
-    created_task.status = TaskStatus.COMPLETED
 
-    updated_task = repository.update(created_task.id, created_task)
+    updated_task = repository.update(
+        created_task.id,
+        {"title": updated_title, "description": updated_description, "status": TaskStatus.COMPLETED}
+    )
 
     assert updated_task is not None
     assert updated_task.id == created_task.id
     assert updated_task.title == updated_title
     assert updated_task.description == updated_description
     assert updated_task.status == TaskStatus.COMPLETED
+    assert updated_task.updated_at is not None
+    assert repository.update(99999, {"status": TaskStatus.PENDING}) is None
+
+
+def test_update_task_with_version(db):
+    """
+    Testa o incremento da versão a cada atualização e a atualização condicional pela versão esperada.
+    """
+    repository = TaskRepository(db)
+    task = repository.create(Task(title=faker.unique.sentence(nb_words=4)))
+    assert task.version == 1
+
+    updated_task = repository.update(task.id, {"status": TaskStatus.COMPLETED}, {"version": 1})
+    assert updated_task.version == 2
+
+    assert repository.update(task.id, {"status": TaskStatus.PENDING}, {"version": 1}) is None
+    assert repository.delete(task.id, {"version": 1}) is False
+    assert repository.delete(task.id, {"version": 2}) is True
+
+
+def test_stale_flush_is_detected(db):
+    """
+    Testa que o flush de uma tarefa lida antes de outra atualização levanta StaleDataError.
+    """
+    repository = TaskRepository(db)
+    task = repository.create(Task(title=faker.unique.sentence(nb_words=4)))
+
+    other_session = Session(bind=db.get_bind())
+    stale_task = other_session.get(Task, task.id)
+    repository.update(task.id, {"status": TaskStatus.COMPLETED})
+
+    stale_task.description = faker.text()
+    with pytest.raises(StaleDataError):
+        other_session.commit()
+    other_session.close()
 
 
 def test_delete_task(db):
@@ -111,3 +152,284 @@ def test_delete_task(db):
 
     assert is_deleted is True
     assert repository.get(created_task.id) is None
+
+
+def test_list_tasks_with_cursor(db):
+    """
+    Testa a paginação por keyset (created_at, id) a partir do último item da página anterior.
+    """
+    repository = TaskRepository(db)
+    for _ in range(5):
+        repository.create(Task(title=faker.unique.sentence(nb_words=4), status=TaskStatus.PENDING))
+
+    first_page = repository.list(limit=2)
+    last = first_page[-1]
+    second_page = repository.list(limit=2, after=(last.created_at, last.id))
+    offset_page = repository.list(limit=2, offset=2)
+
+    assert [task.id for task in second_page] == [task.id for task in offset_page]
+    assert not {task.id for task in first_page} & {task.id for task in second_page}
+
+
+def test_list_tasks_with_sort_and_range_filters(db):
+    """
+    Testa a ordenação por coluna/direção, o cursor de cada ordenação e os filtros created_after/updated_after.
+    """
+    repository = TaskRepository(db)
+    tasks = [
+        repository.create(Task(title=title, status=TaskStatus.PENDING, created_at=datetime(2024, 1, day)))
+        for day, title in enumerate(("Banana", "Abacate", "Caju"), start=1)
+    ]
+    updated = repository.update(tasks[0].id, {"status": TaskStatus.COMPLETED})
+    ids = [task.id for task in tasks]
+
+    by_title = repository.list_rows(limit=1000, sort=TaskSort.TITLE, created_after=datetime(2023, 12, 31))
+    assert [row.id for row in by_title if row.id in ids] == [ids[1], ids[0], ids[2]]
+
+    newest_first = repository.list_rows(limit=2, sort=TaskSort.ID, order=SortOrder.DESC)
+    next_page = repository.list_rows(limit=2, sort=TaskSort.ID, order=SortOrder.DESC, after=(None, ids[1]))
+    assert [row.id for row in newest_first] == [ids[2], ids[1]]
+    assert next_page[0].id == ids[0]
+
+    changed = repository.list_rows(limit=1000, sort=TaskSort.UPDATED_AT, updated_after=datetime(2024, 1, 2))
+    assert [row.id for row in changed if row.id in ids] == [ids[2], updated.id]
+
+    after_first = repository.list_rows(
+        limit=1000, sort=TaskSort.CREATED_AT, order=SortOrder.DESC, created_after=datetime(2024, 1, 1, 12),
+        after=(datetime(2024, 1, 3), ids[2]),
+    )
+    assert [row.id for row in after_first] == [ids[1]]
+
+
+def test_create_many_tasks(db):
+    """
+    Testa a criação de várias tarefas em uma única transação.
+    """
+    repository = TaskRepository(db)
+    titles = [faker.unique.sentence(nb_words=4) for _ in range(3)]
+
+    created_tasks = repository.create_many(
+        [{"title": title, "status": TaskStatus.PENDING} for title in titles]
+    )
+
+    assert {task.title for task in created_tasks} == set(titles)
+    assert all(task.id is not None and task.created_at is not None for task in created_tasks)
+    assert repository.get_existing_titles(titles + ["missing"]) == set(titles)
+
+
+def test_update_many_tasks(db):
+    """
+    Testa a atualização em lote por status com um único UPDATE.
+    """
+    repository = TaskRepository(db)
+    created_tasks = repository.create_many([
+        {"title": faker.unique.sentence(nb_words=4), "status": status}
+        for status in (TaskStatus.IN_PROGRESS, TaskStatus.IN_PROGRESS, TaskStatus.PENDING)
+    ])
+    in_progress_ids = {task.id for task in created_tasks if task.status == TaskStatus.IN_PROGRESS}
+
+    updated, ids = repository.update_many({"status": TaskStatus.COMPLETED}, status=TaskStatus.IN_PROGRESS)
+
+    assert updated == 2
+    assert set(ids) == in_progress_ids
+    assert {task.id for task in repository.list(status=TaskStatus.COMPLETED)} == in_progress_ids
+
+
+def test_delete_many_tasks_in_chunks(db):
+    """
+    Testa a exclusão em lote por status, processada em vários lotes.
+    """
+    repository = TaskRepository(db)
+    repository.create_many([
+        {"title": faker.unique.sentence(nb_words=4), "status": status}
+        for status in [TaskStatus.COMPLETED] * 5 + [TaskStatus.PENDING]
+    ])
+
+    deleted = repository.delete_many(status=TaskStatus.COMPLETED, chunk_size=2)
+
+    assert deleted == 5
+    assert repository.list(status=TaskStatus.COMPLETED) == []
+    assert len(repository.list(status=TaskStatus.PENDING)) == 1
+
+
+def test_create_task_with_existing_title(db):
+    """
+    Testa se a restrição de título único é reportada como erro de integridade.
+    """
+    repository = TaskRepository(db)
+    title = faker.unique.sentence(nb_words=4)
+    repository.create(Task(title=title, status=TaskStatus.PENDING))
+
+    with pytest.raises(RepositoryIntegrityException):
+        repository.create(Task(title=title, status=TaskStatus.PENDING))
+
+
+def test_list_task_rows(db):
+    """
+    Testa a listagem como linhas Row, apenas com as colunas da resposta.
+    """
+    repository = TaskRepository(db)
+    created_task = repository.create(Task(title=faker.unique.sentence(nb_words=4), status=TaskStatus.COMPLETED))
+
+    rows = repository.list_rows(status=TaskStatus.COMPLETED)
+
+    assert [row.id for row in rows] == [created_task.id]
+    assert rows[0].title == created_task.title
+    assert rows[0].status == TaskStatus.COMPLETED
+    assert set(rows[0]._fields) == {"id", "title", "description", "status", "created_at", "updated_at", "version"}
+
+
+def test_stream_task_rows(db):
+    """
+    Testa a leitura em blocos das tarefas, com filtro por status.
+    """
+    repository = TaskRepository(db)
+    repository.create_many([
+        {"title": faker.unique.sentence(nb_words=4), "status": status}
+        for status in [TaskStatus.PENDING] * 5 + [TaskStatus.COMPLETED]
+    ])
+
+    chunks = list(repository.stream_rows(status=TaskStatus.PENDING, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(row.status == TaskStatus.PENDING for chunk in chunks for row in chunk)
+
+
+def test_delete_many_tasks_created_before_with_offset(db):
+    """
+    Testa se created_before com fuso é convertido para UTC antes de comparar com as datas guardadas.
+    """
+    repository = TaskRepository(db)
+    kept_id, deleted_id = (
+        repository.create(Task(title=faker.unique.sentence(nb_words=4), created_at=datetime(2024, 1, 1, hour))).id
+        for hour in (4, 2)
+    )
+
+    # 2024-01-01T00:00:00-03:00 é 03:00 em UTC: só a tarefa das 02:00 foi criada antes
+    cutoff = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=-3)))
+    assert repository.delete_many(created_before=cutoff) == 1
+
+    assert repository.get(deleted_id) is None
+    assert repository.get(kept_id) is not None
+
+
+def test_count_tasks(db):
+    """
+    Testa os contadores por status mantidos pelos triggers, inclusive nas operações em lote.
+    """
+    repository = TaskRepository(db)
+    repository.create_many([
+        {"title": faker.unique.sentence(nb_words=4), "status": status}
+        for status in (TaskStatus.PENDING, TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+    ])
+    assert repository.count() == 3
+    assert repository.count(TaskStatus.PENDING) == 2
+
+    repository.update_many({"status": TaskStatus.COMPLETED}, status=TaskStatus.PENDING)
+    repository.delete_many(status=TaskStatus.IN_PROGRESS)
+
+    assert repository.count_by_status() == {
+        TaskStatus.PENDING: 0,
+        TaskStatus.IN_PROGRESS: 0,
+        TaskStatus.COMPLETED: 2,
+    }
+    assert repository.count(estimate=True) == 2
+
+
+def test_count_tasks_with_date_filters(db):
+    """
+    Testa se o total com created_after/updated_after usa os mesmos filtros da listagem.
+    """
+    repository = TaskRepository(db)
+    for day, status in ((1, TaskStatus.PENDING), (2, TaskStatus.PENDING), (3, TaskStatus.COMPLETED)):
+        repository.create(
+            Task(title=faker.unique.sentence(nb_words=4), status=status, created_at=datetime(2024, 1, day))
+        )
+
+    created_after = datetime(2024, 1, 1, 12)
+    assert repository.count(created_after=created_after) == 2
+    assert repository.count(TaskStatus.PENDING, created_after=created_after) == 1
+    assert repository.count(updated_after=datetime(2024, 1, 3)) == 0
+    assert repository.count(created_after=created_after) == len(
+        repository.list_rows(limit=1000, created_after=created_after)
+    )
+
+
+def test_search_task_rows(db):
+    """
+    Testa a busca textual: todos os termos precisam casar (também por prefixo), o título pesa mais
+    que a descrição e o índice acompanha atualizações e exclusões.
+    """
+    repository = TaskRepository(db)
+    in_title = repository.create(Task(title="Comprar leite integral", description="mercado"))
+    in_description = repository.create(Task(title="Mercado", description="comprar leite e pão"))
+    repository.create(Task(title="Passear com o cachorro", description=None))
+
+    rows = repository.search_rows("leite comp")
+    assert [row.id for row in rows] == [in_title.id, in_description.id]
+    assert rows[0].score <= rows[1].score
+
+    assert repository.search_rows("cachorro leite") == []
+    assert repository.search_rows('"; DROP') == []
+    assert repository.search_rows("!!!") == []
+
+    repository.update(in_title.id, {"title": "Comprar café"})
+    repository.delete(in_description.id)
+    assert repository.search_rows("leite") == []
+    assert [row.id for row in repository.search_rows("café")] == [in_title.id]
+
+
+def test_get_and_list_rows_with_fields(db):
+    """
+    Testa que a projeção lê apenas as colunas pedidas.
+    """
+    repository = TaskRepository(db)
+    task = repository.create(Task(title=faker.unique.sentence(nb_words=4), description=faker.text()))
+
+    row = repository.get_row(task.id, ("id", "title"))
+    assert row._fields == ("id", "title")
+    assert row.title == task.title
+    assert repository.get_row(99999, ("id",)) is None
+
+    rows = repository.list_rows(limit=10, fields=("id", "status"))
+    assert rows[0]._fields == ("id", "status")
+
+
+def test_get_rows_by_ids(db):
+    """
+    Testa a busca de várias tarefas pelo ID em uma única consulta.
+    """
+    repository = TaskRepository(db)
+    tasks = [repository.create(Task(title=faker.unique.sentence(nb_words=4))) for _ in range(3)]
+
+    rows = repository.get_rows([tasks[2].id, tasks[0].id, 99999], fields=("id", "title"))
+    assert {row.id for row in rows} == {tasks[2].id, tasks[0].id}
+    assert rows[0]._fields == ("id", "title")
+
+
+def test_init_adds_version_column_to_existing_tasks_table(tmp_path):
+    """
+    Testa a migração de um banco anterior à coluna version: a criação das tabelas adiciona a coluna
+    com valor 1 nas linhas existentes e nas inseridas fora do ORM.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL UNIQUE, description VARCHAR, "
+            "status VARCHAR(11) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME)"
+        ))
+        connection.execute(text(
+            "INSERT INTO tasks (title, status, created_at) VALUES ('legacy', 'PENDING', '2024-01-01 00:00:00')"
+        ))
+
+    EntityMeta.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO tasks (title, status, created_at) VALUES ('raw', 'PENDING', '2024-01-02 00:00:00')"
+        ))
+
+    with sessionmaker(bind=engine)() as session:
+        repository = TaskRepository(session)
+        assert [task.version for task in repository.list()] == [1, 1]
+        assert repository.update(1, {"status": TaskStatus.COMPLETED}, {"version": 1}).version == 2
+    engine.dispose()
@@ -0,0 +1,187 @@
+import pytest
+from faker import Faker
+
+from configs.changes import get_change_broker
+from schemas.enums import TaskChangeType
+
+faker = Faker()
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_and_get_task(async_api_client):
+    """
+    Testa a criação e a busca de uma tarefa pelas rotas assíncronas.
+    """
+    title = faker.sentence(nb_words=3)
+    response = await async_api_client.post("/tasks/", json={"title": title, "status": "PENDING"})
+    assert response.status_code == 201, response.text
+
+    task_id = response.json()["id"]
+    response = await async_api_client.get(f"/tasks/{task_id}")
+    assert response.status_code == 200, response.text
+    assert response.json()["title"] == title
+
+
+async def test_create_task_with_existing_title(async_api_client):
+    """
+    Testa a criação de uma tarefa com título duplicado.
+    """
+    payload = {"title": faker.sentence(nb_words=3)}
+    await async_api_client.post("/tasks/", json=payload)
+
+    response = await async_api_client.post("/tasks/", json=payload)
+    assert response.status_code == 400
+
+
+async def test_list_tasks_with_status_filter(async_api_client):
+    """
+    Testa a listagem de tarefas filtradas pelo status.
+    """
+    payloads = [
+        {"title": faker.unique.sentence(nb_words=4), "status": status}
+        for status in ("PENDING", "COMPLETED", "PENDING")
+    ]
+    for payload in payloads:
+        await async_api_client.post("/tasks/", json=payload)
+
+    response = await async_api_client.get("/tasks/?status=PENDING")
+    assert response.status_code == 200, response.text
+    assert [task["status"] for task in response.json()] == ["PENDING", "PENDING"]
+
+
+async def test_update_and_delete_task(async_api_client):
+    """
+    Testa a atualização e a exclusão de uma tarefa pelas rotas assíncronas.
+    """
+    response = await async_api_client.post("/tasks/", json={"title": faker.sentence(nb_words=3)})
+    task_id = response.json()["id"]
+
+    response = await async_api_client.patch(f"/tasks/{task_id}", json={"status": "COMPLETED"})
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == "COMPLETED"
+
+    response = await async_api_client.delete(f"/tasks/{task_id}")
+    assert response.status_code == 200, response.text
+    assert response.json()["task_id"] == task_id
+
+    response = await async_api_client.get(f"/tasks/{task_id}")
+    assert response.status_code == 404
+
+
+async def test_list_tasks_with_cursor(async_api_client):
+    """
+    Testa a paginação por cursor nas rotas assíncronas.
+    """
+    for _ in range(3):
+        await async_api_client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)})
+
+    first_page = await async_api_client.get("/tasks/", params={"limit": 2})
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = await async_api_client.get("/tasks/", params={"limit": 2, "cursor": cursor})
+
+    assert len(first_page.json()) == 2
+    assert len(second_page.json()) == 1
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+async def test_conditional_requests(async_api_client):
+    """
+    Testa ETag/304 e If-Match nas rotas assíncronas.
+    """
+    response = await async_api_client.post("/tasks/", json={"title": faker.sentence(nb_words=3)})
+    task_id = response.json()["id"]
+
+    etag = (await async_api_client.get(f"/tasks/{task_id}")).headers["ETag"]
+    response = await async_api_client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = await async_api_client.patch(
+        f"/tasks/{task_id}", json={"status": "COMPLETED"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 200, response.text
+
+    response = await async_api_client.delete(f"/tasks/{task_id}", headers={"If-Match": etag})
+    assert response.status_code == 412
+
+
+async def test_list_tasks_sorted(async_api_client):
+    """
+    Testa a ordenação (sort/order) e o filtro created_after nas rotas assíncronas.
+    """
+    ids = []
+    for _ in range(3):
+        response = await async_api_client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)})
+        ids.append(response.json()["id"])
+
+    response = await async_api_client.get("/tasks/", params={"sort": "id", "order": "desc", "limit": 2})
+    assert [task["id"] for task in response.json()] == [ids[2], ids[1]]
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = await async_api_client.get("/tasks/", params={"sort": "id", "order": "desc", "cursor": cursor})
+    assert [task["id"] for task in response.json()] == [ids[0]]
+
+    response = await async_api_client.get("/tasks/", params={"created_after": "2100-01-01T00:00:00Z"})
+    assert response.json() == []
+
+
+async def test_list_tasks_with_total_count(async_api_client):
+    """
+    Testa o cabeçalho X-Total-Count nas rotas assíncronas.
+    """
+    for status in ("PENDING", "COMPLETED"):
+        await async_api_client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4), "status": status})
+
+    response = await async_api_client.get("/tasks/?include_total=true&limit=1")
+    assert response.headers["X-Total-Count"] == "2"
+    response = await async_api_client.get("/tasks/?status=PENDING&include_total=true")
+    assert response.headers["X-Total-Count"] == "1"
+    response = await async_api_client.get(
+        "/tasks/?include_total=true", params={"created_after": "2100-01-01T00:00:00Z"}
+    )
+    assert response.headers["X-Total-Count"] == "0"
+
+
+async def test_get_task_with_fields(async_api_client):
+    """
+    Testa a projeção de campos (?fields=) nas rotas assíncronas.
+    """
+    response = await async_api_client.post("/tasks/", json={"title": faker.sentence(nb_words=3)})
+    task = response.json()
+
+    response = await async_api_client.get(f"/tasks/{task['id']}?fields=id,status")
+    assert response.json() == {"id": task["id"], "status": task["status"]}
+
+    response = await async_api_client.get("/tasks/?fields=title")
+    assert response.json() == [{"title": task["title"]}]
+
+
+async def test_get_tasks_by_ids(async_api_client):
+    """
+    Testa a busca em lote por `?ids=` nas rotas assíncronas.
+    """
+    ids = []
+    for _ in range(2):
+        response = await async_api_client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)})
+        ids.append(response.json()["id"])
+
+    response = await async_api_client.get(f"/tasks/?ids={ids[1]},{ids[0]},99999")
+    assert [task["id"] for task in response.json()] == [ids[1], ids[0]]
+    assert response.headers["X-Missing-Ids"] == "99999"
+
+
+async def test_task_mutations_are_published(async_api_client):
+    """
+    Testa que as rotas assíncronas publicam as alterações no broker de /tasks/changes.
+    """
+    subscription = get_change_broker().subscribe()
+    try:
+        response = await async_api_client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)})
+        await async_api_client.delete(f"/tasks/{response.json()['id']}")
+
+        created, deleted = [await subscription.get() for _ in range(2)]
+    finally:
+        subscription.close()
+
+    assert (created.type, created.task.title) == (TaskChangeType.CREATED, response.json()["title"])
+    assert (deleted.type, deleted.task_id) == (TaskChangeType.DELETED, response.json()["id"])
@@ -0,0 +1,46 @@
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_pool_stats(client):
+    """
+    Testa se as estatísticas do pool de conexões são expostas.
+    """
+    client.get("/tasks/")
+
+    response = client.get("/database/pool")
+    assert response.status_code == 200, response.text
+
+    stats = response.json()
+    assert stats["pool_class"] == "InstrumentedQueuePool"
+    assert stats["checkouts"] >= 1
+    assert "wait_time_avg" in stats
+    assert "checked_out" in stats
+
+
+def test_cache_stats(client):
+    """
+    Testa se os contadores do cache de leitura são expostos e refletem as leituras por ID.
+    """
+    response = client.post("/tasks/", json={"title": "cache stats"})
+    assert response.status_code == 201, response.text
+    task_id = response.json()["id"]
+
+    client.get(f"/tasks/{task_id}")
+    client.get(f"/tasks/{task_id}")
+    client.delete(f"/tasks/{task_id}")
+
+    response = client.get("/cache/stats")
+    assert response.status_code == 200, response.text
+
+    stats = response.json()
+    assert stats["backend"] == "InMemoryCache"
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+    assert "evictions" in stats
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from faker import Faker
+
+from configs.changes import get_change_broker
+from main import app
+from schemas.enums import TaskChangeType
+
+faker = Faker()
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+async def read_stream(path: str, query: str, until: str, headers=()):
+    """
+    Executa a requisição de streaming direto na aplicação ASGI e desconecta ao receber `until`.
+    """
+    body = b""
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal body
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+        else:
+            body += message.get("body", b"")
+            if until.encode() in body:
+                disconnected.set()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": query.encode(),
+        "headers": [(name.encode(), value.encode()) for name, value in headers],
+        "server": ("test", 80), "client": ("test", 1234),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+    return body.decode()
+
+
+async def test_task_mutations_are_published(client):
+    """
+    Testa que criação, alteração e exclusão pelas rotas publicam eventos no broker de alterações.
+    """
+    subscription = get_change_broker().subscribe()
+    try:
+        task = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()
+        client.patch(f"/tasks/{task['id']}", json={"status": "COMPLETED"})
+        client.delete(f"/tasks/{task['id']}")
+
+        changes = [await asyncio.wait_for(subscription.get(), timeout=1) for _ in range(3)]
+    finally:
+        subscription.close()
+
+    assert [change.type for change in changes] == [
+        TaskChangeType.CREATED, TaskChangeType.UPDATED, TaskChangeType.DELETED
+    ]
+    assert {change.task_id for change in changes} == {task["id"]}
+    assert changes[1].task.status.value == "COMPLETED"
+    assert changes[0].seq < changes[1].seq < changes[2].seq
+
+
+async def test_changes_stream_resumes_from_last_event_id():
+    """
+    Testa o stream SSE retomado pelo cabeçalho Last-Event-ID.
+    """
+    broker = get_change_broker()
+    last_seen = broker.last_seq
+    broker.publish(TaskChangeType.DELETED, 12345)
+
+    body = await read_stream(
+        "/tasks/changes", "after=0", until="event: deleted", headers=[("last-event-id", str(last_seen))]
+    )
+
+    assert body.startswith(f"id: {last_seen + 1}\nevent: deleted\n")
+    assert '"task_id":12345' in body
+    assert broker.subscribers == 0
+
+
+async def test_changes_with_invalid_last_event_id(client):
+    """
+    Testa o stream com um Last-Event-ID inválido.
+    """
+    response = client.get("/tasks/changes", headers={"Last-Event-ID": "abc"})
+    assert response.status_code == 400
@@ -1,7 +1,12 @@
+import csv
+import io
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from faker import Faker
 from main import app
+from repositories.task_repository import TaskRepository
 
 faker = Faker()
 
@@ -106,3 +111,463 @@ def test_get_task_not_found(client):
     """
     response = client.get("/tasks/99999")
     assert response.status_code == 404
+
+
+def test_list_tasks_with_cursor(client):
+    """
+    Testa a paginação por cursor seguindo o cabeçalho X-Next-Cursor.
+    """
+    for _ in range(3):
+        client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4), "status": "COMPLETED"})
+
+    seen_ids = []
+    cursor = None
+    while True:
+        params = {"status": "COMPLETED", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/tasks/", params=params)
+        assert response.status_code == 200, response.text
+
+        seen_ids.extend(task["id"] for task in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert len(seen_ids) >= 3
+    assert len(seen_ids) == len(set(seen_ids))
+
+
+def test_list_tasks_with_sort_and_updated_after(client):
+    """
+    Testa a ordenação (sort/order) com cursor e a sincronização incremental por updated_after.
+    """
+    ids = [client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"] for _ in range(3)]
+
+    titles, cursor = [], None
+    while True:
+        params = {"sort": "title", "order": "desc", "limit": 2, "fields": "id"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/tasks/", params=params)
+        assert response.status_code == 200, response.text
+        titles.extend(client.get(f"/tasks/{task['id']}").json()["title"] for task in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert titles == sorted(titles, reverse=True)
+    assert len(titles) == len(set(titles))
+
+    last_sync = client.get(f"/tasks/{ids[-1]}").json()["created_at"]
+    client.patch(f"/tasks/{ids[0]}", json={"status": "COMPLETED"})
+    response = client.get("/tasks/", params={"sort": "updated_at", "updated_after": last_sync})
+    listed = {task["id"] for task in response.json()}
+    assert ids[0] in listed and ids[1] not in listed
+
+    cursor = client.get("/tasks/?limit=1").headers["X-Next-Cursor"]
+    assert client.get(f"/tasks/?limit=1&sort=title&cursor={cursor}").status_code == 400
+    assert client.get("/tasks/?sort=description").status_code == 422
+
+
+def test_list_tasks_with_invalid_cursor(client):
+    """
+    Testa a listagem com um cursor inválido.
+    """
+    response = client.get("/tasks/?cursor=invalid")
+    assert response.status_code == 400
+
+
+def test_create_tasks_in_bulk(client):
+    """
+    Testa a criação de tarefas em lote com resultado por item.
+    """
+    existing = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()
+    new_title = faker.unique.sentence(nb_words=4)
+
+    response = client.post(
+        "/tasks/bulk",
+        json=[{"title": existing["title"]}, {"title": new_title, "status": "IN_PROGRESS"}]
+    )
+    assert response.status_code == 200, response.text
+
+    result = response.json()
+    assert result["created"] == 1
+    assert result["failed"] == 1
+    assert result["results"][0]["success"] is False
+    assert result["results"][1]["task"]["title"] == new_title
+    assert result["results"][1]["task"]["status"] == "IN_PROGRESS"
+
+
+def test_create_tasks_in_bulk_with_concurrent_insert(client, monkeypatch):
+    """
+    Testa a criação em lote e a importação quando um título é gravado por outra requisição entre a
+    consulta dos títulos existentes e o INSERT: o item é reportado como existente, sem erro 500.
+    """
+    get_existing_titles = TaskRepository.get_existing_titles
+    calls = []
+
+    def stale_existing_titles(repository, titles):
+        calls.append(titles)
+        # A primeira consulta de cada lote não vê o título gravado "concorrentemente"
+        return set() if len(calls) % 2 else get_existing_titles(repository, titles)
+
+    monkeypatch.setattr(TaskRepository, "get_existing_titles", stale_existing_titles)
+    taken_title = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["title"]
+    new_title = faker.unique.sentence(nb_words=4)
+
+    response = client.post("/tasks/bulk", json=[{"title": taken_title}, {"title": new_title}])
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert [item["success"] for item in result["results"]] == [False, True]
+    assert "already exists" in result["results"][0]["detail"]
+
+    lines = [json.dumps({"title": taken_title}), json.dumps({"title": faker.unique.sentence(nb_words=4)})]
+    response = client.post("/tasks/import", content="\n".join(lines).encode())
+    assert response.status_code == 200, response.text
+    assert response.json()["created"] == 1
+    assert [error["line"] for error in response.json()["errors"]] == [1]
+
+
+def test_update_tasks_in_bulk(client):
+    """
+    Testa a atualização em lote de tarefas por lista de IDs.
+    """
+    task_ids = [
+        client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4), "status": "IN_PROGRESS"}).json()["id"]
+        for _ in range(2)
+    ]
+
+    response = client.patch("/tasks/bulk", json={"ids": task_ids, "patch": {"status": "COMPLETED"}})
+    assert response.status_code == 200, response.text
+    assert response.json()["updated"] == 2
+    assert sorted(response.json()["ids"]) == sorted(task_ids)
+
+    for task_id in task_ids:
+        assert client.get(f"/tasks/{task_id}").json()["status"] == "COMPLETED"
+
+
+def test_update_tasks_in_bulk_without_selection(client):
+    """
+    Testa a atualização em lote sem IDs nem status.
+    """
+    response = client.patch("/tasks/bulk", json={"patch": {"status": "COMPLETED"}})
+    assert response.status_code == 422
+
+
+def test_delete_tasks_in_bulk(client):
+    """
+    Testa a exclusão em lote de tarefas por lista de IDs.
+    """
+    task_ids = [
+        client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+        for _ in range(2)
+    ]
+
+    response = client.delete("/tasks/", params={"ids": task_ids})
+    assert response.status_code == 200, response.text
+    assert response.json()["deleted"] == 2
+
+    for task_id in task_ids:
+        assert client.get(f"/tasks/{task_id}").status_code == 404
+
+
+def test_create_task_with_existing_title(client):
+    """
+    Testa se a restrição de título único é devolvida como 400.
+    """
+    payload = {"title": faker.unique.sentence(nb_words=4)}
+    client.post("/tasks/", json=payload)
+
+    response = client.post("/tasks/", json=payload)
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
+
+
+def test_update_and_delete_task_not_found(client):
+    """
+    Testa a atualização e a exclusão de uma tarefa inexistente.
+    """
+    response = client.patch("/tasks/99999", json={"status": "COMPLETED"})
+    assert response.status_code == 404
+
+    response = client.delete("/tasks/99999")
+    assert response.status_code == 404
+
+
+def test_export_tasks_ndjson(client):
+    """
+    Testa a exportação de tarefas em NDJSON com filtro por status.
+    """
+    title = faker.unique.sentence(nb_words=4)
+    client.post("/tasks/", json={"title": title, "status": "IN_PROGRESS"})
+
+    response = client.get("/tasks/export", params={"status": "IN_PROGRESS"})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    tasks = [json.loads(line) for line in response.text.splitlines()]
+    assert any(task["title"] == title for task in tasks)
+    assert all(task["status"] == "IN_PROGRESS" for task in tasks)
+
+
+def test_export_tasks_csv(client):
+    """
+    Testa a exportação de tarefas em CSV.
+    """
+    title = faker.unique.sentence(nb_words=4)
+    client.post("/tasks/", json={"title": title})
+
+    response = client.get("/tasks/export", params={"format": "csv"})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert any(row["title"] == title and row["status"] == "PENDING" and row["version"] == "1" for row in rows)
+
+    ndjson_task = next(
+        json.loads(line) for line in client.get("/tasks/export").text.splitlines() if json.loads(line)["title"] == title
+    )
+    assert set(rows[0]) == set(ndjson_task)
+
+
+def test_import_tasks_ndjson(client):
+    """
+    Testa a importação de tarefas em NDJSON com resumo dos registros rejeitados.
+    """
+    existing_title = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["title"]
+    new_title = faker.unique.sentence(nb_words=4)
+    lines = [
+        json.dumps({"title": new_title, "status": "COMPLETED"}),
+        "not json",
+        json.dumps({"description": "missing title"}),
+        json.dumps({"title": existing_title}),
+    ]
+
+    response = client.post("/tasks/import", content="\n".join(lines).encode())
+    assert response.status_code == 200, response.text
+
+    result = response.json()
+    assert result["processed"] == 4
+    assert result["created"] == 1
+    assert result["rejected"] == 3
+    assert [error["line"] for error in result["errors"]] == [2, 3, 4]
+    assert "already exists" in result["errors"][2]["detail"]
+
+
+def test_import_tasks_csv(client):
+    """
+    Testa a importação de tarefas em CSV com descrição multilinha.
+    """
+    title = faker.unique.sentence(nb_words=4)
+    content = f'title,description,status\n"{title}","first line\nsecond line",IN_PROGRESS\n'
+
+    response = client.post("/tasks/import", params={"format": "csv"}, content=content.encode())
+    assert response.status_code == 200, response.text
+    assert response.json()["created"] == 1
+
+    tasks = client.get("/tasks/", params={"status": "IN_PROGRESS", "limit": 1000}).json()
+    imported = next(task for task in tasks if task["title"] == title)
+    assert imported["description"] == "first line\nsecond line"
+
+
+def test_get_task_not_modified(client):
+    """
+    Testa as respostas 304 com If-None-Match e If-Modified-Since e a nova ETag após uma alteração.
+    """
+    task_id = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+
+    response = client.get(f"/tasks/{task_id}")
+    etag = response.headers["ETag"]
+    assert response.headers["Last-Modified"]
+
+    response = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.get(f"/tasks/{task_id}", headers={"If-Modified-Since": response.headers["Last-Modified"]})
+    assert response.status_code == 304
+
+    client.patch(f"/tasks/{task_id}", json={"status": "COMPLETED"})
+    response = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag
+
+
+def test_list_tasks_not_modified(client):
+    """
+    Testa a resposta 304 na listagem e a mudança da ETag quando uma tarefa da página é excluída.
+    """
+    ids = [
+        client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+        for _ in range(2)
+    ]
+
+    response = client.get("/tasks/?limit=1000")
+    etag = response.headers["ETag"]
+
+    response = client.get("/tasks/?limit=1000", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = client.get("/tasks/?limit=500", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    client.delete(f"/tasks/{ids[0]}")
+    response = client.get("/tasks/?limit=1000", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_list_tasks_ignores_if_modified_since(client):
+    """
+    Testa que a listagem não usa Last-Modified: após excluir uma tarefa da página, If-Modified-Since
+    com uma data futura não gera um 304 com o conteúdo antigo.
+    """
+    ids = [
+        client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+        for _ in range(2)
+    ]
+    assert "Last-Modified" not in client.get("/tasks/?limit=1000").headers
+
+    client.delete(f"/tasks/{ids[1]}")
+    response = client.get("/tasks/?limit=1000", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+    assert response.status_code == 200
+    listed = {task["id"] for task in response.json()}
+    assert ids[0] in listed and ids[1] not in listed
+
+
+def test_update_and_delete_task_with_if_match(client):
+    """
+    Testa a escrita condicional com If-Match: ETag desatualizada retorna 412; a atual é aceita.
+    """
+    task_id = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"]
+    etag = client.get(f"/tasks/{task_id}").headers["ETag"]
+
+    response = client.patch(f"/tasks/{task_id}", json={"status": "COMPLETED"}, headers={"If-Match": etag})
+    assert response.status_code == 200, response.text
+    new_etag = response.headers["ETag"]
+    assert new_etag != etag
+
+    response = client.patch(f"/tasks/{task_id}", json={"status": "PENDING"}, headers={"If-Match": etag})
+    assert response.status_code == 412
+
+    response = client.delete(f"/tasks/{task_id}", headers={"If-Match": etag})
+    assert response.status_code == 412
+
+    response = client.delete(f"/tasks/{task_id}", headers={"If-Match": new_etag})
+    assert response.status_code == 200, response.text
+
+
+def test_update_task_with_version_conflict(client):
+    """
+    Testa a concorrência otimista: a versão avança a cada PATCH e uma versão antiga retorna 409.
+    """
+    task = client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()
+    assert task["version"] == 1
+
+    response = client.patch(f"/tasks/{task['id']}", json={"status": "COMPLETED", "version": 1})
+    assert response.status_code == 200, response.text
+    assert response.json()["version"] == 2
+
+    response = client.patch(f"/tasks/{task['id']}", json={"status": "PENDING", "version": 1})
+    assert response.status_code == 409
+    assert client.get(f"/tasks/{task['id']}").json()["status"] == "COMPLETED"
+
+
+def test_task_stats_and_total_count(client):
+    """
+    Testa os contadores por status em /tasks/stats e o cabeçalho X-Total-Count da listagem,
+    acompanhando criação, mudança de status e exclusão.
+    """
+    before = client.get("/tasks/stats").json()
+    ids = [
+        client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4), "status": "PENDING"}).json()["id"]
+        for _ in range(3)
+    ]
+    client.patch(f"/tasks/{ids[0]}", json={"status": "COMPLETED"})
+    client.delete(f"/tasks/{ids[1]}")
+
+    response = client.get("/tasks/stats")
+    assert response.status_code == 200, response.text
+    stats = response.json()
+    assert stats["total"] == before["total"] + 2
+    assert stats["by_status"]["PENDING"] == before["by_status"]["PENDING"] + 1
+    assert stats["by_status"]["COMPLETED"] == before["by_status"]["COMPLETED"] + 1
+    assert stats["by_status"]["IN_PROGRESS"] == before["by_status"]["IN_PROGRESS"]
+
+    response = client.get("/tasks/?limit=1&include_total=true")
+    assert response.headers["X-Total-Count"] == str(stats["total"])
+    response = client.get("/tasks/?status=COMPLETED&include_total=true")
+    assert response.headers["X-Total-Count"] == str(stats["by_status"]["COMPLETED"])
+    assert "X-Total-Count" not in client.get("/tasks/").headers
+    response = client.get("/tasks/?include_total=true", params={"created_after": "2100-01-01T00:00:00Z"})
+    assert response.json() == []
+    assert response.headers["X-Total-Count"] == "0"
+
+
+def test_search_tasks_with_cursor(client):
+    """
+    Testa a busca textual paginada por cursor, sem repetir resultados entre as páginas.
+    """
+    word = faker.unique.pystr(min_chars=12, max_chars=12).lower()
+    ids = {
+        client.post("/tasks/", json={"title": f"{word} {faker.unique.sentence(nb_words=3)}"}).json()["id"]
+        for _ in range(5)
+    }
+
+    response = client.get(f"/tasks/search?q={word}&limit=3")
+    assert response.status_code == 200, response.text
+    first_page = response.json()
+    assert len(first_page) == 3
+    assert all("score" in result for result in first_page)
+
+    response = client.get(f"/tasks/search?q={word}&limit=3&cursor={response.headers['X-Next-Cursor']}")
+    second_page = response.json()
+    assert "X-Next-Cursor" not in response.headers
+    assert {result["id"] for result in first_page + second_page} == ids
+
+    assert client.get("/tasks/search?q=x&cursor=invalid").status_code == 400
+    assert client.get("/tasks/search?q=").status_code == 422
+
+
+def test_get_tasks_by_ids(client):
+    """
+    Testa a busca em lote por `?ids=`: ordem da requisição e IDs inexistentes em X-Missing-Ids.
+    """
+    ids = [client.post("/tasks/", json={"title": faker.unique.sentence(nb_words=4)}).json()["id"] for _ in range(3)]
+    requested = [ids[2], 99999, ids[0]]
+
+    response = client.get(f"/tasks/?ids={','.join(map(str, requested))}&status=COMPLETED&offset=10")
+    assert response.status_code == 200, response.text
+    assert [task["id"] for task in response.json()] == [ids[2], ids[0]]
+    assert response.headers["X-Missing-Ids"] == "99999"
+
+    response = client.get(f"/tasks/?ids={ids[1]}&fields=title")
+    assert response.json() == [{"title": client.get(f"/tasks/{ids[1]}").json()["title"]}]
+    assert "X-Missing-Ids" not in response.headers
+    etag = response.headers["ETag"]
+    assert client.get(f"/tasks/?ids={ids[1]}&fields=title", headers={"If-None-Match": etag}).status_code == 304
+
+    assert client.get("/tasks/?ids=1,abc").status_code == 400
+
+
+def test_list_and_get_tasks_with_fields(client):
+    """
+    Testa a projeção de campos (?fields=) na listagem e na busca por ID.
+    """
+    task = client.post(
+        "/tasks/", json={"title": faker.unique.sentence(nb_words=4), "description": faker.text()}
+    ).json()
+
+    response = client.get("/tasks/?fields=title,id,status&limit=1000")
+    assert response.status_code == 200, response.text
+    assert all(set(item) == {"id", "title", "status"} for item in response.json())
+
+    response = client.get(f"/tasks/{task['id']}?fields=title")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"title": task["title"]}
+    assert response.headers["ETag"] == client.get(f"/tasks/{task['id']}").headers["ETag"]
+
+    response = client.get(f"/tasks/{task['id']}?fields=title,description")
+    assert response.json() == {"title": task["title"], "description": task["description"]}
+
+    assert client.get("/tasks/?fields=title,password").status_code == 400
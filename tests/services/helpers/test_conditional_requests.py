@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from services.helpers.conditional_requests import etag_matches, is_not_modified, task_etag, task_list_etag
+
+
+def make_task(task_id=1, version=1):
+    return SimpleNamespace(id=task_id, created_at=datetime(2024, 1, 1, 12), updated_at=None, version=version)
+
+
+def test_task_etag_changes_with_version():
+    """
+    Testa que a ETag de uma tarefa muda a cada nova versão.
+    """
+    assert task_etag(make_task()) == task_etag(make_task())
+    assert task_etag(make_task()) != task_etag(make_task(version=2))
+
+
+def test_task_list_etag_depends_on_params_and_tasks():
+    """
+    Testa que a ETag da listagem considera os parâmetros da consulta e as tarefas da página.
+    """
+    tasks = [make_task(1), make_task(2)]
+
+    assert task_list_etag(tasks, None, 50) == task_list_etag(list(tasks), None, 50)
+    assert task_list_etag(tasks, None, 50) != task_list_etag(tasks, None, 10)
+    assert task_list_etag(tasks, None, 50) != task_list_etag(tasks[:1], None, 50)
+
+
+def test_etag_matches():
+    """
+    Testa a comparação de listas de ETags, incluindo `*` e ETags fracas.
+    """
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert not etag_matches('W/"b"', '"b"', weak=False)
+    assert not etag_matches(None, '"b"')
+
+
+def test_is_not_modified():
+    """
+    Testa a precedência de If-None-Match sobre If-Modified-Since.
+    """
+    modified_at = datetime(2024, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+
+    assert is_not_modified('"a"', modified_at, '"a"', None)
+    assert not is_not_modified('"a"', modified_at, '"b"', "Mon, 01 Jan 2024 12:00:00 GMT")
+    assert is_not_modified('"a"', modified_at, None, "Mon, 01 Jan 2024 12:00:00 GMT")
+    assert not is_not_modified('"a"', modified_at, None, "Mon, 01 Jan 2024 11:59:59 GMT")
+    assert not is_not_modified('"a"', modified_at, None, "invalid")
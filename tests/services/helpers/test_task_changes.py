@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+from schemas.enums import TaskChangeType
+from services.helpers.task_changes import TaskChangeBroker, sse_events
+
+pytestmark = pytest.mark.anyio
+
+
+async def next_change(subscription):
+    return await asyncio.wait_for(subscription.get(), timeout=1)
+
+
+async def test_publish_reaches_subscribers_in_order():
+    """
+    Testa a entrega dos eventos, em ordem, publicados no próprio event loop e a partir de outra thread.
+    """
+    broker = TaskChangeBroker()
+    subscription = broker.subscribe()
+
+    broker.publish(TaskChangeType.CREATED, 1)
+    thread = threading.Thread(target=broker.publish, args=(TaskChangeType.DELETED, 1))
+    thread.start()
+    thread.join()
+
+    first, second = await next_change(subscription), await next_change(subscription)
+    assert (first.seq, first.type) == (1, TaskChangeType.CREATED)
+    assert (second.seq, second.type) == (2, TaskChangeType.DELETED)
+
+
+async def test_subscribe_resumes_from_sequence_number():
+    """
+    Testa a retomada a partir de um `seq`: eventos ainda no buffer são reenviados; os que já saíram geram reset.
+    """
+    broker = TaskChangeBroker(buffer_size=3)
+    for task_id in range(5):
+        broker.publish(TaskChangeType.UPDATED, task_id)
+
+    subscription = broker.subscribe(after=3)
+    assert [(await next_change(subscription)).seq for _ in range(2)] == [4, 5]
+    assert subscription.reset_seq is None
+
+    assert broker.subscribe(after=1).reset_seq == 5
+    assert broker.subscribe(after=99).reset_seq == 5
+    assert broker.subscribe(after=2).reset_seq is None
+
+
+async def test_slow_subscriber_is_dropped():
+    """
+    Testa a política de descarte: o publicador não espera e o assinante com a fila cheia é desconectado.
+    """
+    broker = TaskChangeBroker(queue_size=2)
+    slow, fast = broker.subscribe(), broker.subscribe()
+
+    for task_id in range(3):
+        broker.publish(TaskChangeType.CREATED, task_id)
+        await next_change(fast)
+
+    assert await next_change(slow) is None
+    assert slow.overflowed
+    assert broker.subscribers == 1
+
+
+async def test_sse_events_format():
+    """
+    Testa o formato Server-Sent Events: reset inicial, eventos com id/event/data e keep-alive.
+    """
+    broker = TaskChangeBroker(buffer_size=1)
+    broker.publish(TaskChangeType.CREATED, 1)
+    broker.publish(TaskChangeType.CREATED, 2)
+
+    stream = sse_events(broker.subscribe(after=0), heartbeat=0.01)
+    assert await anext(stream) == 'id: 2\nevent: reset\ndata: {"seq": 2}\n\n'
+    assert await anext(stream) == ": keep-alive\n\n"
+
+    broker.publish(TaskChangeType.DELETED, 2)
+    frame = await anext(stream)
+    assert frame.startswith("id: 3\nevent: deleted\ndata: {")
+    assert '"task_id":2' in frame
+
+    await stream.aclose()
+    assert broker.subscribers == 0
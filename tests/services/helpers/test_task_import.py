@@ -0,0 +1,44 @@
+import pytest
+
+from services.helpers.task_import import iter_csv_records, iter_ndjson_records
+
+pytestmark = pytest.mark.anyio
+
+
+async def byte_chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def test_iter_ndjson_records_across_chunks():
+    """
+    Testa a leitura de NDJSON com linhas e caracteres multibyte divididos entre blocos.
+    """
+    data = '{"title": "ação"}\n\nnot json\n[1]\n{"title": "último"}'.encode()
+
+    records = [record async for record in iter_ndjson_records(byte_chunks(data, 3))]
+
+    assert records[0] == (1, {"title": "ação"}, None)
+    assert records[1][0] == 3 and "Invalid JSON" in records[1][2]
+    assert records[2] == (4, None, "Each line must be a JSON object")
+    assert records[3] == (5, {"title": "último"}, None)
+
+
+async def test_iter_csv_records_with_multiline_fields():
+    """
+    Testa a leitura de CSV com cabeçalho, campos multilinha entre aspas e colunas extras.
+    """
+    data = (
+        'id,title,description,status\r\n'
+        '1,first,"line one\r\nline ""two""",PENDING\r\n'
+        '2,second,,\r\n'
+        '3,broken\r\n'
+    ).encode()
+
+    records = [record async for record in iter_csv_records(byte_chunks(data, 5))]
+
+    assert records[0] == (
+        2, {"id": "1", "title": "first", "description": 'line one\nline "two"', "status": "PENDING"}, None
+    )
+    assert records[1] == (4, {"id": "2", "title": "second", "description": None, "status": None}, None)
+    assert records[2] == (5, None, "Expected 4 columns, got 2")
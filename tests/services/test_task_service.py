@@ -1,11 +1,17 @@
+from datetime import datetime
+
 import pytest
 from unittest.mock import MagicMock
 from fastapi import HTTPException
 from faker import Faker
-from schemas.task_schema import TaskCreateSchema, TaskUpdateSchema
-from schemas.enums import TaskStatus
+from schemas.task_schema import TaskBulkUpdateSchema, TaskCreateSchema, TaskUpdateSchema
+from schemas.enums import FileFormat, TaskStatus
+from services.async_task_service import AsyncTaskService
 from services.task_service import TaskService
+from services.helpers.task_changes import TaskChangeBroker
+from repositories.cache import InMemoryCache
 from repositories.models.task_model import Task
+from repositories.helpers.db_operations import RepositoryIntegrityException
 
 faker = Faker()
 
@@ -13,41 +19,37 @@ faker = Faker()
 @pytest.fixture
 def mock_repository():
     """
-    Mock do repositório para uso nos testes de TaskService.
+    Mock do repositório para uso nos testes de TaskService (lendo do primário).
     """
-    return MagicMock()
+    return MagicMock(reads_from_replica=False)
 
 
 @pytest.fixture
 def task_service(mock_repository):
     """
-    Instância de TaskService com repositório mockado.
+    Instância de TaskService com repositório mockado e um cache em memória exclusivo do teste.
     """
-    return TaskService(repository=mock_repository)
+    return TaskService(repository=mock_repository, cache=InMemoryCache(), changes=TaskChangeBroker())
 
 
 def test_create_task(task_service, mock_repository):
     """
     Testa a criação de uma nova tarefa com título único.
     """
-    mock_repository.get_by_title.return_value = None
-    mock_repository.create.return_value = Task(
-        id=1,
-        title=faker.sentence(nb_words=3),
-        description=faker.text(),
-        status=TaskStatus.PENDING,
-    )
+    def create(task):
+        task.id, task.version, task.created_at = 1, 1, datetime(2024, 1, 1)
+        return task
 
-    task_data = TaskCreateSchema(
-        title=mock_repository.create.return_value.title,
-        description=mock_repository.create.return_value.description,
-    )
+    mock_repository.create.side_effect = create
+
+    task_data = TaskCreateSchema(title=faker.sentence(nb_words=3), description=faker.text())
     created_task = task_service.create_task(task_data)
 
     assert created_task.title == task_data.title
     assert created_task.description == task_data.description
-    mock_repository.get_by_title.assert_called_once_with(task_data.title)
+    mock_repository.get_by_title.assert_not_called()
     mock_repository.create.assert_called_once()
+    assert task_service.changes.last_seq == 1
 
 
 def test_create_task_with_existing_title(task_service, mock_repository):
@@ -55,9 +57,7 @@ def test_create_task_with_existing_title(task_service, mock_repository):
     Testa a criação de uma tarefa com título duplicado.
     """
     existing_task_title = faker.sentence(nb_words=3)
-    mock_repository.get_by_title.return_value = Task(
-        id=1, title=existing_task_title, description=faker.text(), status=TaskStatus.PENDING
-    )
+    mock_repository.create.side_effect = RepositoryIntegrityException()
 
     task_data = TaskCreateSchema(title=existing_task_title)
     with pytest.raises(HTTPException) as exc_info:
@@ -65,7 +65,7 @@ def test_create_task_with_existing_title(task_service, mock_repository):
 
     assert exc_info.value.status_code == 400
     assert "already exists" in str(exc_info.value.detail)
-    mock_repository.get_by_title.assert_called_once_with(existing_task_title)
+    mock_repository.create.assert_called_once()
 
 
 def test_get_task(task_service, mock_repository):
@@ -73,7 +73,7 @@ def test_get_task(task_service, mock_repository):
     Testa a recuperação de uma tarefa existente por ID.
     """
     mock_repository.get.return_value = Task(
-        id=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING
+        id=1, version=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING
     )
 
     task = task_service.get_task(1)
@@ -83,6 +83,115 @@ def test_get_task(task_service, mock_repository):
     mock_repository.get.assert_called_once_with(1)
 
 
+def test_get_task_uses_cache(task_service, mock_repository):
+    """
+    Testa que a segunda leitura da mesma tarefa é atendida pelo cache, sem ir ao repositório.
+    """
+    mock_repository.get.return_value = Task(
+        id=1, version=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING
+    )
+
+    first = task_service.get_task(1)
+    second = task_service.get_task(1)
+
+    assert second == first
+    mock_repository.get.assert_called_once_with(1)
+    assert task_service.cache.stats()["hits"] == 1
+    assert task_service.cache.stats()["misses"] == 1
+
+
+def test_update_and_delete_invalidate_cache(task_service, mock_repository):
+    """
+    Testa que atualizar ou excluir uma tarefa remove a entrada do cache.
+    """
+    mock_repository.get.return_value = Task(
+        id=1, version=1, title=faker.sentence(nb_words=3), status=TaskStatus.PENDING
+    )
+    mock_repository.update.return_value = Task(
+        id=1, version=2, title=faker.sentence(nb_words=3), status=TaskStatus.COMPLETED
+    )
+    task_service.get_task(1)
+
+    task_service.update_task(1, TaskUpdateSchema(status=TaskStatus.COMPLETED))
+    task_service.get_task(1)
+    assert mock_repository.get.call_count == 2
+
+    task_service.delete_task(1)
+    task_service.get_task(1)
+    assert mock_repository.get.call_count == 3
+
+
+def test_bulk_operations_invalidate_cache(task_service, mock_repository):
+    """
+    Testa a invalidação do cache nas operações em lote: por IDs ou, com filtros, do cache inteiro.
+    """
+    mock_repository.get.side_effect = lambda task_id: Task(
+        id=task_id, version=1, title=faker.unique.sentence(nb_words=3), status=TaskStatus.PENDING
+    )
+    mock_repository.update_many.return_value = (1, [1])
+    mock_repository.delete_many.return_value = 1
+    task_service.get_task(1)
+    task_service.get_task(2)
+
+    task_service.update_tasks(TaskBulkUpdateSchema(ids=[1], patch={"status": TaskStatus.COMPLETED}))
+    assert task_service.cache.get("task:1") is None
+    assert task_service.cache.get("task:2") is not None
+
+    task_service.delete_tasks(status=TaskStatus.PENDING)
+    assert task_service.cache.get("task:2") is None
+
+
+def test_get_task_with_fields(task_service, mock_repository):
+    """
+    Testa a busca com projeção: lê só as colunas pedidas e serializa apenas esses campos.
+    """
+    title = faker.sentence(nb_words=3)
+    mock_repository.get_row.return_value = Task(id=1, version=1, title=title, created_at=datetime(2024, 1, 1))
+
+    task = task_service.get_task(1, fields=("title",))
+
+    assert task.model_dump_json() == f'{{"title":"{title}"}}'
+    mock_repository.get.assert_not_called()
+    selected = mock_repository.get_row.call_args.args[1]
+    assert "title" in selected and "description" not in selected
+
+
+def test_get_tasks_in_request_order(task_service, mock_repository):
+    """
+    Testa a busca em lote: uma única consulta, resultado na ordem pedida e IDs inexistentes informados.
+    """
+    mock_repository.get_rows.return_value = [
+        Task(id=task_id, version=1, title=faker.unique.sentence(nb_words=3), status=TaskStatus.PENDING)
+        for task_id in (1, 3)
+    ]
+
+    tasks, missing = task_service.get_tasks([3, 2, 1])
+
+    assert [task.id for task in tasks] == [3, 1]
+    assert missing == [2]
+    mock_repository.get_rows.assert_called_once_with([3, 2, 1], fields=None)
+
+
+def test_parse_ids():
+    """
+    Testa a conversão e a validação de `?ids=`.
+    """
+    assert TaskService.parse_ids("3, 1,3,,2") == [3, 1, 2]
+
+    for value in ("1,a", ",", ",".join(str(i) for i in range(10000))):
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService.parse_ids(value)
+        assert exc_info.value.status_code == 400
+
+
+def test_sync_and_async_services_share_param_parsers():
+    """
+    Testa que os serviços síncrono e assíncrono usam os mesmos parsers de `?ids=` e `?fields=`.
+    """
+    assert TaskService.parse_ids is AsyncTaskService.parse_ids
+    assert TaskService.parse_fields is AsyncTaskService.parse_fields
+
+
 def test_get_task_not_found(task_service, mock_repository):
     """
     Testa a recuperação de uma tarefa inexistente.
@@ -101,28 +210,25 @@ def test_list_tasks(task_service, mock_repository):
     """
     Testa a listagem de todas as tarefas.
     """
-    mock_repository.list.return_value = [
-        Task(id=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING),
-        Task(id=2, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.COMPLETED),
+    mock_repository.list_rows.return_value = [
+        Task(id=1, version=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING),
+        Task(id=2, version=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.COMPLETED),
     ]
 
     tasks = task_service.list_tasks()
 
     assert len(tasks) == 2
-    assert tasks[0].title == mock_repository.list.return_value[0].title
-    assert tasks[1].title == mock_repository.list.return_value[1].title
-    mock_repository.list.assert_called_once()
+    assert tasks[0].title == mock_repository.list_rows.return_value[0].title
+    assert tasks[1].title == mock_repository.list_rows.return_value[1].title
+    mock_repository.list_rows.assert_called_once()
 
 
 def test_update_task(task_service, mock_repository):
     """
     Testa a atualização de uma tarefa existente.
     """
-    mock_repository.get.return_value = Task(
-        id=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING
-    )
     mock_repository.update.return_value = Task(
-        id=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.COMPLETED
+        id=1, version=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.COMPLETED
     )
 
     update_data = TaskUpdateSchema(
@@ -135,15 +241,15 @@ def test_update_task(task_service, mock_repository):
     assert updated_task.title == update_data.title
     assert updated_task.description == update_data.description
     assert updated_task.status == update_data.status
-    mock_repository.get.assert_called_once_with(1)
-    mock_repository.update.assert_called_once()
+    mock_repository.get.assert_not_called()
+    mock_repository.update.assert_called_once_with(1, update_data.model_dump(exclude_unset=True), None)
 
 
 def test_update_task_not_found(task_service, mock_repository):
     """
     Testa a atualização de uma tarefa inexistente.
     """
-    mock_repository.get.return_value = None
+    mock_repository.update.return_value = None
 
     update_data = TaskUpdateSchema(title=faker.sentence(nb_words=3))
     with pytest.raises(HTTPException) as exc_info:
@@ -151,35 +257,202 @@ def test_update_task_not_found(task_service, mock_repository):
 
     assert exc_info.value.status_code == 404
     assert "Task not found" in str(exc_info.value.detail)
-    mock_repository.get.assert_called_once_with(999)
+    mock_repository.update.assert_called_once_with(999, {"title": update_data.title}, None)
 
 
 def test_delete_task(task_service, mock_repository):
     """
     Testa a exclusão de uma tarefa existente.
     """
-    mock_repository.get.return_value = Task(
-        id=1, title=faker.sentence(nb_words=3), description=faker.text(), status=TaskStatus.PENDING
-    )
     mock_repository.delete.return_value = True
 
     result = task_service.delete_task(1)
 
     assert result["task_id"] == 1
     assert "excluída com sucesso" in result["message"]
-    mock_repository.get.assert_called_once_with(1)
-    mock_repository.delete.assert_called_once_with(1)
+    mock_repository.get.assert_not_called()
+    mock_repository.delete.assert_called_once_with(1, None)
 
 
 def test_delete_task_not_found(task_service, mock_repository):
     """
     Testa a exclusão de uma tarefa inexistente.
     """
-    mock_repository.get.return_value = None
+    mock_repository.delete.return_value = False
 
     with pytest.raises(HTTPException) as exc_info:
         task_service.delete_task(999)
 
     assert exc_info.value.status_code == 404
     assert "Task with id 999 not found" in str(exc_info.value.detail)
-    mock_repository.get.assert_called_once_with(999)
+    mock_repository.delete.assert_called_once_with(999, None)
+
+
+def test_update_task_with_stale_version(task_service, mock_repository):
+    """
+    Testa que a atualização com uma versão desatualizada retorna 409.
+    """
+    mock_repository.update.return_value = None
+    mock_repository.get.return_value = Task(id=1, version=3, title=faker.sentence(nb_words=3))
+
+    with pytest.raises(HTTPException) as exc_info:
+        task_service.update_task(1, TaskUpdateSchema(status=TaskStatus.COMPLETED, version=2))
+
+    assert exc_info.value.status_code == 409
+    mock_repository.update.assert_called_once_with(1, {"status": TaskStatus.COMPLETED}, {"version": 2})
+
+
+def test_get_stats(task_service, mock_repository):
+    """
+    Testa o resumo de tarefas por status a partir dos contadores do repositório.
+    """
+    mock_repository.count_by_status.return_value = {
+        TaskStatus.PENDING: 2, TaskStatus.IN_PROGRESS: 0, TaskStatus.COMPLETED: 5
+    }
+
+    stats = task_service.get_stats()
+
+    assert stats.total == 7
+    assert stats.by_status[TaskStatus.COMPLETED] == 5
+    mock_repository.list_rows.assert_not_called()
+
+
+def test_list_tasks_with_invalid_cursor(task_service, mock_repository):
+    """
+    Testa a listagem com um cursor inválido.
+    """
+    with pytest.raises(HTTPException) as exc_info:
+        task_service.list_tasks(cursor="not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+    mock_repository.list_rows.assert_not_called()
+
+
+def test_create_tasks(task_service, mock_repository):
+    """
+    Testa a criação em lote, rejeitando títulos existentes e repetidos na requisição.
+    """
+    existing_title = faker.unique.sentence(nb_words=4)
+    new_title = faker.unique.sentence(nb_words=4)
+    mock_repository.get_existing_titles.return_value = {existing_title}
+    mock_repository.create_many.side_effect = lambda rows: [
+        Task(id=index + 1, version=1, **row) for index, row in enumerate(rows)
+    ]
+
+    result = task_service.create_tasks([
+        TaskCreateSchema(title=existing_title),
+        TaskCreateSchema(title=new_title),
+        TaskCreateSchema(title=new_title),
+    ])
+
+    assert result.created == 1
+    assert result.failed == 2
+    assert [item.success for item in result.results] == [False, True, False]
+    assert result.results[1].task.title == new_title
+    assert "already exists" in result.results[0].detail
+    assert "duplicated" in result.results[2].detail
+    mock_repository.get_existing_titles.assert_called_once()
+    mock_repository.create_many.assert_called_once()
+
+
+def test_create_tasks_with_concurrent_insert(task_service, mock_repository):
+    """
+    Testa a criação em lote quando outra requisição grava um dos títulos entre a consulta e o INSERT:
+    o título é reportado como existente e os demais são gravados.
+    """
+    taken_title = faker.unique.sentence(nb_words=4)
+    new_title = faker.unique.sentence(nb_words=4)
+    mock_repository.get_existing_titles.side_effect = [set(), {taken_title}]
+    mock_repository.create_many.side_effect = [
+        RepositoryIntegrityException(),
+        [Task(id=1, version=1, title=new_title, status=TaskStatus.PENDING, created_at=datetime(2024, 1, 1))],
+    ]
+
+    result = task_service.create_tasks([TaskCreateSchema(title=taken_title), TaskCreateSchema(title=new_title)])
+
+    assert result.created == 1
+    assert result.failed == 1
+    assert [item.success for item in result.results] == [False, True]
+    assert "already exists" in result.results[0].detail
+    assert [row["title"] for row in mock_repository.create_many.call_args.args[0]] == [new_title]
+
+
+def test_update_tasks(task_service, mock_repository):
+    """
+    Testa a atualização em lote de tarefas selecionadas por ID.
+    """
+    mock_repository.update_many.return_value = (2, [1, 2])
+
+    result = task_service.update_tasks(
+        TaskBulkUpdateSchema(ids=[1, 2, 3], patch={"status": TaskStatus.COMPLETED})
+    )
+
+    assert result.updated == 2
+    assert result.ids == [1, 2]
+    mock_repository.update_many.assert_called_once_with(
+        {"status": TaskStatus.COMPLETED}, ids=[1, 2, 3], status=None
+    )
+
+
+def test_update_tasks_without_fields(task_service, mock_repository):
+    """
+    Testa a atualização em lote sem campos a alterar.
+    """
+    with pytest.raises(HTTPException) as exc_info:
+        task_service.update_tasks(TaskBulkUpdateSchema(status=TaskStatus.PENDING, patch={}))
+
+    assert exc_info.value.status_code == 400
+    mock_repository.update_many.assert_not_called()
+
+
+def test_delete_tasks(task_service, mock_repository):
+    """
+    Testa a exclusão em lote de tarefas por status.
+    """
+    mock_repository.delete_many.return_value = 3
+
+    result = task_service.delete_tasks(status=TaskStatus.COMPLETED)
+
+    assert result.deleted == 3
+    mock_repository.delete_many.assert_called_once()
+
+
+def test_delete_tasks_without_filter(task_service, mock_repository):
+    """
+    Testa a exclusão em lote sem nenhum filtro.
+    """
+    with pytest.raises(HTTPException) as exc_info:
+        task_service.delete_tasks()
+
+    assert exc_info.value.status_code == 400
+    mock_repository.delete_many.assert_not_called()
+
+
+def test_update_task_with_existing_title(task_service, mock_repository):
+    """
+    Testa a atualização de uma tarefa para um título já usado por outra.
+    """
+    mock_repository.update.side_effect = RepositoryIntegrityException()
+
+    with pytest.raises(HTTPException) as exc_info:
+        task_service.update_task(1, TaskUpdateSchema(title=faker.sentence(nb_words=3)))
+
+    assert exc_info.value.status_code == 400
+    assert "already exists" in str(exc_info.value.detail)
+
+
+def test_export_tasks_csv(task_service, mock_repository):
+    """
+    Testa a exportação em CSV, gerando um bloco por bloco de linhas lido do repositório.
+    """
+    mock_repository.stream_rows.return_value = iter([
+        [Task(id=1, title="first", status=TaskStatus.PENDING, created_at=datetime(2024, 1, 1), version=1)],
+        [Task(id=2, title="second", status=TaskStatus.COMPLETED, created_at=datetime(2024, 1, 2), version=3)],
+    ])
+
+    chunks = list(task_service.export_tasks(FileFormat.CSV))
+
+    assert len(chunks) == 3
+    assert chunks[0] == b"id,title,description,status,created_at,updated_at,version\r\n"
+    assert chunks[1] == b"1,first,,PENDING,2024-01-01T00:00:00,,1\r\n"
+    assert chunks[2].startswith(b"2,second,,COMPLETED") and chunks[2].endswith(b",3\r\n")